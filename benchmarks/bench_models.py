@@ -0,0 +1,129 @@
+"""Benchmark memory and construction time of parsed result models.
+
+Compares the models built by the parsers (unvalidated construction with a
+shared fields set and interned repeated strings) with equivalent validated
+pydantic models, as the parsers built them before, and with the same models
+given a fields set per instance, as plain ``model_construct`` does. Memory is
+what a cache holding the parsed pages keeps alive: a number of large search
+pages and a long table of contents.
+
+Usage:
+    uv run python benchmarks/bench_models.py [--pages 20] [--results 500] [--entries 2000]
+"""
+
+import argparse
+import gc
+import json
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import upstream
+
+from jw_org_mcp.models import SearchResult, construct
+from jw_org_mcp.parser import ArticleParser, SearchResponseParser
+
+
+def retained(build: Callable[[], Any]) -> tuple[int, Any]:
+    """Measure the memory kept alive by the value a function builds.
+
+    Args:
+        build: Function building the value
+
+    Returns:
+        Tuple of (bytes allocated and still alive, value)
+    """
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, value
+
+
+def validated_copy(models: list[Any]) -> list[Any]:
+    """Rebuild models with validation and fresh strings, like the legacy parsers."""
+    return [type(m).model_validate(json.loads(m.model_dump_json())) for m in models]
+
+
+def own_fields_set(models: list[Any]) -> list[Any]:
+    """Rebuild models with the same strings but a fields set per instance."""
+    return [type(m).model_construct(**m.__dict__) for m in models]
+
+
+def toc_page(entries: int) -> str:
+    """Build a table of contents page with the given number of article links."""
+    links = "".join(
+        f'<li><a href="/en/wol/d/r1/lp-e/{2024000 + i}?q=x">Article number {i}</a></li>'
+        for i in range(entries)
+    )
+    return (
+        f'<html><body><article id="article"><h1>Index</h1><ul>{links}</ul></article></body></html>'
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print memory and timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=20, help="Cached search pages")
+    parser.add_argument("--results", type=int, default=500, help="Results per search page")
+    parser.add_argument("--entries", type=int, default=2000, help="Table of contents entries")
+    args = parser.parse_args()
+
+    # Each page is decoded separately, as responses are, so strings are not shared
+    raw_pages = [
+        json.dumps(upstream.search_payload(f"query {i}", results=args.results))
+        for i in range(args.pages)
+    ]
+
+    def parse_pages() -> list[list[SearchResult]]:
+        return [
+            SearchResponseParser.parse_search_results(json.loads(raw), "q", "all")
+            for raw in raw_pages
+        ]
+
+    pages = parse_pages()
+    toc_html = toc_page(args.entries)
+    toc = ArticleParser.parse_article(toc_html, upstream.INDEX_URL)
+    entries = toc.articles  # type: ignore[union-attr]
+
+    rows = [
+        (
+            f"{args.pages} search pages x {args.results}",
+            retained(lambda: [validated_copy(page) for page in pages])[0],
+            retained(lambda: [own_fields_set(page) for page in pages])[0],
+            retained(parse_pages)[0],
+        ),
+        (
+            f"table of contents x {args.entries}",
+            retained(lambda: validated_copy(entries))[0],
+            retained(lambda: own_fields_set(entries))[0],
+            retained(lambda: ArticleParser.parse_article(toc_html, upstream.INDEX_URL))[0],
+        ),
+    ]
+    print(
+        f"{'retained memory':<32} {'validated':>12} {'own set':>12} {'compact':>12} {'saving':>8}"
+    )
+    for name, before, own_set, after in rows:
+        print(
+            f"{name:<32} {before / 1024:9.0f} KiB {own_set / 1024:9.0f} KiB "
+            f"{after / 1024:9.0f} KiB {1 - after / before:7.0%}"
+        )
+
+    fields = pages[0][0].model_dump()
+    number = 50000
+    print()
+    print(f"{'construction':<32} {'us/result':>12}")
+    for name, func in {
+        "validated SearchResult(...)": lambda: SearchResult(**fields),
+        "SearchResult.model_construct": lambda: SearchResult.model_construct(**fields),
+        "construct(SearchResult, ...)": lambda: construct(SearchResult, **fields),
+    }.items():
+        seconds = timeit.timeit(func, number=number)
+        print(f"{name:<32} {seconds / number * 1e6:12.3f}")
+
+
+if __name__ == "__main__":
+    main()
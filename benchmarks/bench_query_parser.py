@@ -0,0 +1,58 @@
+"""Benchmark QueryParser.extract_search_terms against the legacy re.sub loop.
+
+Usage:
+    uv run python benchmarks/bench_query_parser.py [--number N]
+"""
+
+import argparse
+import re
+import timeit
+
+from jw_org_mcp.parser import QueryParser, _extract_search_terms
+
+QUERIES = [
+    "love",
+    "What does the Bible say about peace and security?",
+    "How can I find true happiness?",
+    "Tell me about Jehovah's love",
+    "Who was Abraham?",
+    "Find information about the Kingdom.",
+    "Why does God permit suffering?",
+    "explain the ransom",
+]
+
+
+def legacy_extract(query: str) -> str:
+    """The original implementation: one uncompiled re.sub per pattern."""
+    cleaned = query.strip().lower()
+    for pattern in QueryParser.QUESTION_PATTERNS:
+        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+    cleaned = cleaned.rstrip("?.!")
+    if not cleaned or len(cleaned) < 3:
+        return query.strip()
+    return cleaned.strip()
+
+
+def main() -> None:
+    """Run the benchmark and print per-call timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000, help="Iterations per variant")
+    args = parser.parse_args()
+
+    variants = {
+        "legacy re.sub loop": lambda: [legacy_extract(q) for q in QUERIES],
+        "precompiled (uncached)": lambda: [
+            QueryParser._extract_uncached(q, "E") for q in QUERIES
+        ],
+        "precompiled + memo": lambda: [QueryParser.extract_search_terms(q) for q in QUERIES],
+    }
+
+    _extract_search_terms.cache_clear()
+    calls = args.number * len(QUERIES)
+    for name, func in variants.items():
+        seconds = timeit.timeit(func, number=args.number)
+        print(f"{name:<24} {seconds / calls * 1e6:8.3f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Benchmark throughput of the multi-worker HTTP server as the worker count grows.
+
+Starts the server with 1, 2, 4, ... workers (JWORG_MCP_HTTP_WORKERS) against a
+shared cache pre-warmed with a long article, then drives get_article tool
+calls over streamable HTTP from several client processes and reports calls
+per second and scaling efficiency. No network access to jw.org is needed.
+
+Usage:
+    uv run python benchmarks/bench_workers.py [--workers 1 2 4] [--duration 10]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+
+from jw_org_mcp.cache import Cache
+from jw_org_mcp.codec import encode_value
+from jw_org_mcp.models import ArticleContent, ResponseMetadata
+from jw_org_mcp.shared import SharedCacheStore
+
+ARTICLE_URL = "https://wol.jw.org/en/wol/d/r1/lp-e/1985720"
+PORT = 8790
+
+
+def prewarm(state_dir: Path) -> None:
+    """Store a long article in the shared cache tier."""
+    article = ArticleContent(
+        title="Benchmark Article",
+        paragraphs=[f"Paragraph {i}. " + "Lorem ipsum dolor sit amet. " * 20 for i in range(200)],
+        source_url=ARTICLE_URL,
+        pids=list(range(1, 201)),
+    )
+    metadata = ResponseMetadata(
+        source_domain="wol.jw.org", source_url=ARTICLE_URL, timestamp=datetime.now(UTC)
+    )
+    encoded = encode_value((article, metadata))
+    assert encoded is not None
+    key = Cache()._make_key(*(ARTICLE_URL, "article"))
+    SharedCacheStore(state_dir / "cache.sqlite3").set(key, encoded, time.time() + 3600)
+
+
+async def drive(url: str, sessions: int, duration: float) -> tuple[int, int]:
+    """Run concurrent sessions calling get_article until the deadline.
+
+    Returns:
+        Tuple of (successful calls, failed calls)
+    """
+    deadline = time.monotonic() + duration
+    calls = errors = 0
+
+    async def session_loop(index: int) -> None:
+        nonlocal calls, errors
+        async with streamable_http_client(url) as (read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                start = index
+                while time.monotonic() < deadline:
+                    # Vary the range so responses are rendered, not only replayed
+                    first = start % 200 + 1
+                    arguments = {"url": ARTICLE_URL, "start": first, "end": first + 19}
+                    try:
+                        await session.call_tool("get_article", arguments)
+                        calls += 1
+                    except Exception:  # noqa: BLE001 - counted and reported
+                        errors += 1
+                    start += 7
+
+    await asyncio.gather(*(session_loop(i) for i in range(sessions)))
+    return calls, errors
+
+
+def driver_process(url: str, sessions: int, duration: float) -> tuple[int, int]:
+    """Driver process entry point."""
+    return asyncio.run(drive(url, sessions, duration))
+
+
+def run(workers: int, drivers: int, sessions: int, duration: float) -> float:
+    """Benchmark one worker count.
+
+    Returns:
+        Successful tool calls per second
+    """
+    with tempfile.TemporaryDirectory() as state_dir:
+        prewarm(Path(state_dir))
+        env = {
+            **os.environ,
+            "JWORG_MCP_TRANSPORT": "http",
+            "JWORG_MCP_HTTP_PORT": str(PORT),
+            "JWORG_MCP_HTTP_WORKERS": str(workers),
+            "JWORG_MCP_SHARED_STATE_DIR": state_dir,
+            "JWORG_MCP_LOG_LEVEL": "WARNING",
+        }
+        server = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-c", "import jw_org_mcp; jw_org_mcp.main()"], env=env
+        )
+        try:
+            for _ in range(100):
+                try:
+                    httpx.get(f"http://127.0.0.1:{PORT}/health", timeout=1).raise_for_status()
+                    break
+                except httpx.HTTPError:
+                    time.sleep(0.2)
+            time.sleep(1.0 * workers)  # let every worker finish starting
+
+            url = f"http://127.0.0.1:{PORT}/mcp"
+            with multiprocessing.get_context("spawn").Pool(drivers) as pool:
+                counts = pool.starmap(driver_process, [(url, sessions, duration)] * drivers)
+        finally:
+            server.terminate()
+            server.wait(30)
+
+    errors = sum(failed for _, failed in counts)
+    if errors:
+        print(f"workers={workers}: {errors} failed calls")
+    return sum(ok for ok, _ in counts) / duration
+
+
+def main() -> None:
+    """Run the benchmark for each worker count and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--drivers", type=int, default=4, help="Client processes")
+    parser.add_argument("--sessions", type=int, default=8, help="Sessions per client process")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    args = parser.parse_args()
+
+    print(f"CPU cores: {os.cpu_count()}")
+    baseline: float | None = None
+    for workers in args.workers:
+        throughput = run(workers, args.drivers, args.sessions, args.duration)
+        baseline = baseline or throughput / workers
+        efficiency = throughput / (baseline * workers) * 100
+        print(f"workers={workers:<3} {throughput:9.1f} calls/s  scaling {efficiency:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Local HTTP server standing in for jw.org and jw-cdn.org, with injectable faults.
+
+Serves the responses of upstream.py over a real socket, so that a client
+under test exercises its connection pool, timeouts and retries. Each response
+can be delayed, and a fraction of requests can fail with HTTP 503 or stall
+until the client times out.
+
+Usage:
+    uv run python benchmarks/fake_upstream.py --port 8791 --latency 0.05 --jitter 0.02 \\
+        --error-rate 0.01 --stall-rate 0.001 --token-ttl 330
+"""
+
+import argparse
+import asyncio
+import random
+
+import httpx
+import upstream
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+
+def create_app(
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    stall_rate: float = 0.0,
+    token_ttl: float | None = None,
+    seed: int = 0,
+) -> Starlette:
+    """Create the stand-in application.
+
+    Args:
+        latency: Mean seconds to wait before each response
+        jitter: Maximum seconds added to or removed from the latency
+        error_rate: Fraction of requests answered with HTTP 503
+        stall_rate: Fraction of requests never answered within an hour
+        token_ttl: Lifetime of issued JWT tokens in seconds; the client refreshes
+            tokens 5 minutes before expiry, so e.g. 330 forces a refresh every 30 s
+        seed: Seed for the fault injection
+
+    Returns:
+        Starlette application
+    """
+    rng = random.Random(seed)
+
+    async def handle(request: Request) -> Response:
+        delay = max(latency + rng.uniform(-jitter, jitter), 0.0)
+        roll = rng.random()
+        if roll < stall_rate:
+            delay = 3600.0
+        if delay:
+            await asyncio.sleep(delay)
+        if roll < stall_rate + error_rate:
+            return Response("Service Unavailable", status_code=503)
+
+        answer = upstream.respond(httpx.Request("GET", str(request.url)), token_ttl=token_ttl)
+        return Response(
+            answer.content,
+            status_code=answer.status_code,
+            media_type=answer.headers.get("content-type"),
+        )
+
+    return Starlette(routes=[Route("/{path:path}", endpoint=handle, methods=["GET"])])
+
+
+def main() -> None:
+    """Serve the stand-in until interrupted."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8791)
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean response delay (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Delay variation (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered 503")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Fraction never answered")
+    parser.add_argument("--token-ttl", type=float, help="JWT lifetime in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = create_app(
+        args.latency, args.jitter, args.error_rate, args.stall_rate, args.token_ttl, args.seed
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
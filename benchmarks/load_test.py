@@ -0,0 +1,388 @@
+"""Load generator and soak test for the MCP tool call path.
+
+Drives ``call_tool`` in process with a configurable mix of search_content,
+get_article and get_scripture calls at a target request rate and maximum
+concurrency, against fake_upstream.py listening on a local port (started
+automatically unless --upstream is given). Faults can be injected upstream:
+latency, jitter, HTTP 503 errors, stalled responses and short-lived JWT tokens.
+
+Arrivals are scheduled open-loop, and latency is measured from each call's
+scheduled start, so time spent queued behind the concurrency limit or an
+exhausted connection pool is included. Reports latency distributions and
+error rates per tool, RSS over time, cache size and hit rates, token
+refreshes and upstream status codes.
+
+Usage:
+    uv run python benchmarks/load_test.py --rps 50 --concurrency 100 --duration 60
+    uv run python benchmarks/load_test.py --mix search=1,article=3 --articles 1000 \\
+        --latency 0.2 --error-rate 0.02 --token-ttl 330 --pool-size 20
+    # Soak: an hour with a report per minute; fail if RSS grows by more than 100 MB/hour
+    uv run python benchmarks/load_test.py --duration 3600 --report-interval 60 \\
+        --max-rss-growth 100
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from jw_org_mcp import server
+from jw_org_mcp.client import JWOrgClient
+from jw_org_mcp.config import settings
+from jw_org_mcp.metrics import metrics
+
+ERROR_PREFIXES = ("Error:", "Unexpected error:", "Unknown tool:")
+TOPICS = (
+    "peace kingdom hope faith love prayer ransom resurrection paradise wisdom "
+    "justice mercy creation prophecy family marriage suffering death"
+).split()
+
+
+@dataclass
+class Stats:
+    """Outcomes of the calls made in a run."""
+
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # Latencies of all calls in completion order, for per-interval reports
+    completed: list[float] = field(default_factory=list)
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def record(self, tool: str, latency: float, ok: bool) -> None:
+        """Record one call."""
+        self.latencies[tool].append(latency)
+        self.completed.append(latency)
+        if not ok:
+            self.errors[tool] += 1
+
+    def total(self) -> int:
+        """Count all recorded calls."""
+        return len(self.completed)
+
+
+def current_rss_mb() -> float:
+    """Get the resident set size of this process in MiB."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # Peak rather than current RSS; KiB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def percentiles(samples: list[float]) -> tuple[float, float, float, float]:
+    """Get the p50, p95, p99 and maximum of samples, in ms."""
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return value, value, value, value
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return cuts[49] * 1000, cuts[94] * 1000, cuts[98] * 1000, max(samples) * 1000
+
+
+def growth_per_hour(samples: list[tuple[float, float]]) -> float:
+    """Fit a line to (seconds, MiB) samples and return its slope in MiB per hour."""
+    if len(samples) < 3:
+        return 0.0
+    # Skip the first sample: start-up allocations are not growth
+    times, values = zip(*samples[1:], strict=True)
+    return statistics.linear_regression(times, values).slope * 3600
+
+
+class Workload:
+    """Chooses tool calls according to the configured mix and key space."""
+
+    def __init__(self, args: argparse.Namespace, upstream_url: str) -> None:
+        """Initialize the workload.
+
+        Args:
+            args: Command line arguments
+            upstream_url: Base URL of the fake upstream
+        """
+        self._rng = random.Random(args.seed)
+        mix = dict(part.split("=") for part in args.mix.split(","))
+        self._tools = list(mix)
+        self._tool_weights = [float(weight) for weight in mix.values()]
+        self._articles = [
+            f"{upstream_url}/en/wol/d/r1/lp-e/{2024100 + i}" for i in range(args.articles)
+        ]
+        self._queries = [
+            f"What does the Bible say about {TOPICS[i % len(TOPICS)]} {i // len(TOPICS)}?"
+            for i in range(args.queries)
+        ]
+        self._verses = [f"John {i // 30 + 1}:{i % 30 + 1}" for i in range(args.verses)]
+        # Popularity follows a Zipf-like distribution, as for real content
+        self._weights = {
+            size: [1 / (rank + 1) for rank in range(size)]
+            for size in {args.articles, args.queries, args.verses}
+        }
+
+    def _pick(self, items: list[str]) -> str:
+        return self._rng.choices(items, weights=self._weights[len(items)])[0]
+
+    def next_call(self) -> tuple[str, dict[str, Any]]:
+        """Choose the next call.
+
+        Returns:
+            Tuple of (mix name, tool arguments)
+        """
+        kind = self._rng.choices(self._tools, weights=self._tool_weights)[0]
+        if kind == "search":
+            return kind, {"query": self._pick(self._queries)}
+        if kind == "article":
+            return kind, {"url": self._pick(self._articles), "max_tokens": 2000}
+        if kind == "scripture":
+            return kind, {"reference": self._pick(self._verses)}
+        raise ValueError(f"Unknown call type in --mix: {kind}")
+
+
+TOOL_NAMES = {"search": "search_content", "article": "get_article", "scripture": "get_scripture"}
+
+
+async def issue(
+    kind: str, arguments: dict[str, Any], scheduled: float, limit: asyncio.Semaphore, stats: Stats
+) -> None:
+    """Make one tool call and record its outcome."""
+    async with limit:
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            content = await server.call_tool(TOOL_NAMES[kind], arguments)
+            ok = not content[0].text.startswith(ERROR_PREFIXES)
+        except Exception:  # noqa: BLE001 - counted as an error
+            ok = False
+        finally:
+            stats.in_flight -= 1
+    stats.record(kind, time.perf_counter() - scheduled, ok)
+
+
+async def report(
+    stats: Stats, rss: list[tuple[float, float]], started: float, interval: float
+) -> None:
+    """Print a progress line every interval and sample RSS."""
+    client = server.get_client()
+    seen = 0
+    window_start = time.perf_counter()
+    while True:
+        await asyncio.sleep(interval)
+        now = time.perf_counter()
+        rss.append((now - started, current_rss_mb()))
+        calls = stats.total()
+        p50, p95, p99, _ = percentiles(stats.completed[seen:calls])
+        cache = client.get_cache_stats()
+        print(
+            f"{now - started:7.0f}s  {(calls - seen) / (now - window_start):7.1f} calls/s  "
+            f"p50 {p50:7.1f}  p95 {p95:7.1f}  p99 {p99:7.1f} ms  "
+            f"errors {sum(stats.errors.values()):5d}  in flight {stats.in_flight:4d}  "
+            f"RSS {rss[-1][1]:7.1f} MiB  cache {cache['entries']:6d} entries "
+            f"{cache['hit_rate']:5.1f}% hits",
+            flush=True,
+        )
+        seen = calls
+        window_start = now
+
+
+async def run(args: argparse.Namespace, upstream_url: str) -> tuple[Stats, list, float]:
+    """Generate load for the configured duration.
+
+    Returns:
+        Tuple of (call stats, RSS samples, elapsed seconds)
+    """
+    server._client = JWOrgClient()
+    workload = Workload(args, upstream_url)
+    stats = Stats()
+    limit = asyncio.Semaphore(args.concurrency)
+    rss: list[tuple[float, float]] = []
+    tasks: set[asyncio.Task[None]] = set()
+
+    started = time.perf_counter()
+    rss.append((0.0, current_rss_mb()))
+    reporter = asyncio.create_task(report(stats, rss, started, args.report_interval))
+
+    interval = 1 / args.rps
+    scheduled = started
+    deadline = started + args.duration
+    while scheduled < deadline:
+        kind, arguments = workload.next_call()
+        task = asyncio.create_task(issue(kind, arguments, scheduled, limit, stats))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        scheduled += interval
+        await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+
+    if tasks:
+        await asyncio.wait(tasks, timeout=settings.request_timeout * 2)
+    elapsed = time.perf_counter() - started
+    reporter.cancel()
+    rss.append((elapsed, current_rss_mb()))
+    return stats, rss, elapsed
+
+
+def print_summary(stats: Stats, rss: list[tuple[float, float]], elapsed: float) -> None:
+    """Print the end-of-run report."""
+    print(
+        f"\n{'call':<10} {'count':>8} {'errors':>8} {'err %':>7} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for kind, samples in sorted(stats.latencies.items()):
+        errors = stats.errors[kind]
+        p50, p95, p99, peak = percentiles(samples)
+        print(
+            f"{kind:<10} {len(samples):>8} {errors:>8} {errors / len(samples):>7.2%} "
+            f"{p50:>9.1f} {p95:>9.1f} {p99:>9.1f} {peak:>9.1f}"
+        )
+
+    total = stats.total()
+    print(
+        f"\nThroughput: {total / elapsed:.1f} calls/s over {elapsed:.0f} s, "
+        f"max {stats.max_in_flight} in flight"
+    )
+
+    cache = server.get_client().get_cache_stats()
+    print(
+        f"Cache: {cache['entries']} entries, {cache['hit_rate']}% hit rate "
+        f"({cache['hits']} hits, {cache['misses']} misses), "
+        f"{cache['rendered_hits']} rendered hits"
+    )
+
+    refreshes = {
+        dict(labels)["status"]: int(value)
+        for labels, value in metrics._counters.get("jworg_auth_refresh_total", {}).items()
+    }
+    print(f"Token refreshes: {refreshes or 'none'}")
+    upstream_status: dict[str, int] = defaultdict(int)
+    for labels, value in metrics._counters.get("jworg_upstream_requests_total", {}).items():
+        upstream_status[dict(labels)["status"]] += int(value)
+    print(f"Upstream responses by status: {dict(sorted(upstream_status.items()))}")
+
+    peak = max(value for _, value in rss)
+    print(
+        f"RSS: {rss[0][1]:.1f} MiB at start, {rss[-1][1]:.1f} MiB at end, {peak:.1f} MiB peak, "
+        f"trend {growth_per_hour(rss):+.1f} MiB/hour"
+    )
+
+
+def start_upstream(args: argparse.Namespace) -> subprocess.Popen[bytes]:
+    """Start fake_upstream.py with the configured faults and wait until it answers."""
+    command = [
+        sys.executable,
+        str(Path(__file__).with_name("fake_upstream.py")),
+        f"--port={args.upstream_port}",
+        f"--latency={args.latency}",
+        f"--jitter={args.jitter}",
+        f"--error-rate={args.error_rate}",
+        f"--stall-rate={args.stall_rate}",
+    ]
+    if args.token_ttl is not None:
+        command.append(f"--token-ttl={args.token_ttl}")
+    process = subprocess.Popen(command)  # noqa: S603
+
+    url = f"http://127.0.0.1:{args.upstream_port}/tokens/jworg.jwt"
+    for _ in range(100):
+        try:
+            httpx.get(url, timeout=1 + args.latency + args.jitter)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Fake upstream did not start")
+
+
+def main() -> None:
+    """Run the load test and print the report."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    load = parser.add_argument_group("load")
+    load.add_argument("--rps", type=float, default=50.0, help="Target calls per second")
+    load.add_argument("--concurrency", type=int, default=100, help="Maximum calls in flight")
+    load.add_argument("--duration", type=float, default=30.0, help="Seconds of load")
+    load.add_argument(
+        "--mix", default="search=5,article=4,scripture=1", help="Relative call type weights"
+    )
+    load.add_argument("--articles", type=int, default=200, help="Distinct article URLs")
+    load.add_argument("--queries", type=int, default=100, help="Distinct search queries")
+    load.add_argument("--verses", type=int, default=100, help="Distinct scripture references")
+    load.add_argument("--seed", type=int, default=0)
+    load.add_argument("--report-interval", type=float, default=5.0, help="Seconds per line")
+    load.add_argument("--verbose", action="store_true", help="Show server logs")
+
+    client = parser.add_argument_group("client")
+    client.add_argument("--pool-size", type=int, help="Connection pool size")
+    client.add_argument("--timeout", type=float, help="Request timeout in seconds")
+    client.add_argument("--no-cache", action="store_true", help="Disable caching")
+
+    faults = parser.add_argument_group("upstream")
+    faults.add_argument("--upstream", help="Use a running fake upstream at this URL")
+    faults.add_argument("--upstream-port", type=int, default=8791)
+    faults.add_argument("--latency", type=float, default=0.05, help="Mean response delay (s)")
+    faults.add_argument("--jitter", type=float, default=0.02, help="Delay variation (s)")
+    faults.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered 503")
+    faults.add_argument("--stall-rate", type=float, default=0.0, help="Fraction never answered")
+    faults.add_argument("--token-ttl", type=float, help="JWT lifetime in seconds (min 300)")
+
+    checks = parser.add_argument_group("checks (exit code 1 when exceeded)")
+    checks.add_argument("--max-error-rate", type=float, help="Allowed fraction of failed calls")
+    checks.add_argument("--max-rss-growth", type=float, help="Allowed RSS trend in MiB/hour")
+    args = parser.parse_args()
+
+    process = None
+    upstream_url = args.upstream
+    if upstream_url is None:
+        process = start_upstream(args)
+        upstream_url = f"http://127.0.0.1:{args.upstream_port}"
+
+    # Settings are read when the client is created and on each call
+    settings.cdn_base_url = upstream_url
+    settings.enable_cache = not args.no_cache
+    if args.pool_size is not None:
+        settings.connection_pool_size = args.pool_size
+    if args.timeout is not None:
+        settings.request_timeout = args.timeout
+    metrics.enabled = True
+    # Injected faults would otherwise log an error per failed call
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.CRITICAL)
+
+    async def run_and_close() -> tuple[Stats, list, float]:
+        try:
+            return await run(args, upstream_url)
+        finally:
+            await server.cleanup()
+
+    try:
+        stats, rss, elapsed = asyncio.run(run_and_close())
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(10)
+
+    print_summary(stats, rss, elapsed)
+
+    failed = []
+    error_rate = sum(stats.errors.values()) / max(stats.total(), 1)
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        failed.append(f"error rate {error_rate:.2%} exceeds {args.max_error_rate:.2%}")
+    growth = growth_per_hour(rss)
+    if args.max_rss_growth is not None and growth > args.max_rss_growth:
+        failed.append(f"RSS trend {growth:+.1f} MiB/hour exceeds {args.max_rss_growth}")
+    for line in failed:
+        print(f"FAILED: {line}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Record a cassette of real jw.org traffic for offline benchmarks and tests.
+
+Runs searches for the given queries and fetches the top results, recording
+every HTTP exchange (token, search and wol requests) into a gzip-compressed
+cassette. The benchmark suite replays it with ``--cassette``, or the server
+can be run against it with JWORG_MCP_CASSETTE_MODE=replay.
+
+Usage:
+    uv run python benchmarks/record_cassette.py benchmarks/cassettes/session.json.gz \\
+        --query "peace" --query "kingdom" --articles 3
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from jw_org_mcp.client import JWOrgClient
+from jw_org_mcp.config import settings
+
+DEFAULT_QUERIES = ["peace", "prayer", "kingdom of god"]
+
+
+async def record(queries: list[str], articles: int) -> None:
+    """Search for each query and fetch its top articles.
+
+    Args:
+        queries: Search queries
+        articles: Number of results to fetch per query
+    """
+    client = JWOrgClient()
+    try:
+        for query in queries:
+            response, _ = await client.search(query)
+            print(f"search {query!r}: {len(response.results)} results")
+            for result in response.results[:articles]:
+                if "wol.jw.org" not in result.url:
+                    continue
+                content, _ = await client.get_article(result.url)
+                print(f"  article {result.url}: {content.title}")
+    finally:
+        # Closing the clients saves the cassette
+        await client.close()
+
+
+def main() -> None:
+    """Record the cassette."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("path", type=Path, help="Cassette file to record into")
+    parser.add_argument("--query", action="append", help="Search query (repeatable)")
+    parser.add_argument("--articles", type=int, default=3, help="Results to fetch per query")
+    args = parser.parse_args()
+
+    settings.cassette_mode = "record"
+    settings.cassette_path = str(args.path)
+    settings.enable_cache = False
+    asyncio.run(record(args.query or DEFAULT_QUERIES, args.articles))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,472 @@
+"""Offline benchmark suite for the parser, cache and tool call paths.
+
+Runs each case against the local jw.org stand-in (see upstream.py), reports
+throughput and p50/p95/p99 latency, and optionally saves the results as a
+baseline or compares them with one. Comparison fails (exit code 1) when a
+case's p50 regresses by more than the threshold.
+
+Usage:
+    uv run python benchmarks/run_suite.py
+    uv run python benchmarks/run_suite.py --save-baseline benchmarks/baseline.json
+    uv run python benchmarks/run_suite.py --compare benchmarks/baseline.json [--threshold 0.25]
+    uv run python benchmarks/run_suite.py --filter parse --scale 0.2
+    uv run python benchmarks/run_suite.py --cassette benchmarks/cassettes/session.json.gz
+"""
+
+import argparse
+import asyncio
+import base64
+import contextlib
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import upstream
+
+from jw_org_mcp import server
+from jw_org_mcp.cache import Cache
+from jw_org_mcp.client import JWOrgClient
+from jw_org_mcp.config import settings
+from jw_org_mcp.formatter import ResponseFormatter
+from jw_org_mcp.http_client import Cassette, get_cassette
+from jw_org_mcp.models import ResponseMetadata
+from jw_org_mcp.parser import ArticleParser, QueryParser, SearchResponseParser
+
+# PRD targets for end-to-end tool calls
+TARGET_P95_SECONDS = 2.0
+TARGET_CONCURRENCY = 100
+
+QUERIES = [
+    "love",
+    "What does the Bible say about peace and security?",
+    "How can I find true happiness?",
+    "Tell me about Jehovah's love",
+    "Who was Abraham?",
+    "Why does God permit suffering?",
+]
+
+
+@dataclass
+class Result:
+    """Timings of one benchmark case."""
+
+    name: str
+    samples: list[float]
+    wall_seconds: float
+
+    def summary(self) -> dict[str, float]:
+        """Summarize the samples.
+
+        Returns:
+            Throughput (operations per second of wall time) and latency percentiles in ms
+        """
+        if len(self.samples) > 1:
+            cuts = statistics.quantiles(self.samples, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = self.samples[0]
+        return {
+            "iterations": len(self.samples),
+            "ops_per_sec": round(len(self.samples) / self.wall_seconds, 1),
+            "p50_ms": round(p50 * 1000, 4),
+            "p95_ms": round(p95 * 1000, 4),
+            "p99_ms": round(p99 * 1000, 4),
+        }
+
+
+def time_sync(name: str, func: Callable[[int], Any], iterations: int) -> Result:
+    """Time sequential calls of a function.
+
+    Args:
+        name: Case name
+        func: Called with the iteration index
+        iterations: Number of timed calls
+
+    Returns:
+        Case timings
+    """
+    for i in range(min(iterations // 10, 50)):
+        func(i)
+
+    samples = []
+    wall_start = time.perf_counter()
+    for i in range(iterations):
+        start = time.perf_counter()
+        func(i)
+        samples.append(time.perf_counter() - start)
+    return Result(name, samples, time.perf_counter() - wall_start)
+
+
+async def time_async(
+    name: str, func: Callable[[int], Awaitable[Any]], iterations: int, concurrency: int = 1
+) -> Result:
+    """Time awaited calls of a coroutine function, with a given number in flight.
+
+    Args:
+        name: Case name
+        func: Called with the iteration index
+        iterations: Number of timed calls
+        concurrency: Calls in flight at once
+
+    Returns:
+        Case timings
+    """
+    for i in range(min(iterations // 10, 5)):
+        await func(i)
+
+    samples: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await func(i)
+            samples.append(time.perf_counter() - start)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(iterations)))
+    return Result(name, samples, time.perf_counter() - wall_start)
+
+
+@contextlib.contextmanager
+def cache_enabled(enabled: bool) -> Iterator[None]:
+    """Temporarily enable or disable caching."""
+    previous = settings.enable_cache
+    settings.enable_cache = enabled
+    try:
+        yield
+    finally:
+        settings.enable_cache = previous
+
+
+@dataclass
+class Case:
+    """A benchmark case."""
+
+    name: str
+    # Called with the iteration index; tool cases return awaitables
+    func: Callable[[int], Any]
+    iterations: int
+    cached: bool = True
+    concurrency: int = 1
+    upstream_latency: float = 0.0
+    # Served from the replayed cassette instead of the stand-in
+    recorded: bool = False
+
+
+def unit_cases() -> list[Case]:
+    """Benchmark cases for individual components.
+
+    Returns:
+        Cases calling synchronous functions
+    """
+    cache = Cache(ttl_seconds=3600)
+    for i in range(1000):
+        cache.set(f"query {i}", "all", "E", 0, value=i)
+
+    payload = upstream.search_payload("peace security")
+    snippet = payload["results"][0]["results"][0]["snippet"]
+    index_html = upstream.index_page()
+
+    cases = [
+        Case("cache.get hit", lambda i: cache.get(f"query {i % 1000}", "all", "E", 0), 50000),
+        Case("cache.get miss", lambda i: cache.get(f"absent {i}", "all", "E", 0), 50000),
+        Case("cache.set", lambda i: cache.set(f"new {i}", "all", "E", 0, value=i), 50000),
+        Case(
+            "extract_search_terms uncached",
+            lambda i: QueryParser._extract_uncached(QUERIES[i % len(QUERIES)], "E"),
+            20000,
+        ),
+        Case(
+            "extract_search_terms",
+            lambda i: QueryParser.extract_search_terms(QUERIES[i % len(QUERIES)]),
+            50000,
+        ),
+        Case("_clean_html", lambda i: SearchResponseParser._clean_html(snippet), 5000),
+        Case(
+            "parse_search_results",
+            lambda i: SearchResponseParser.parse_search_results(payload, "peace security", "all"),
+            500,
+        ),
+    ]
+    for size, (url, paragraphs) in upstream.ARTICLES.items():
+        html = upstream.article_page(paragraphs)
+        cases.append(
+            Case(
+                f"parse_article {size} ({len(html) // 1024} KiB)",
+                lambda i, html=html, url=url: ArticleParser.parse_article(html, url),
+                max(20000 // paragraphs, 20),
+            )
+        )
+    cases.append(
+        Case(
+            "parse_article index",
+            lambda i: ArticleParser.parse_article(index_html, upstream.INDEX_URL),
+            500,
+        )
+    )
+
+    # Hits on a large article held raw and compressed
+    large_url, large_paragraphs = upstream.ARTICLES["large"]
+    article = ArticleParser.parse_article(upstream.article_page(large_paragraphs), large_url)
+    metadata = ResponseMetadata(
+        source_domain="wol.jw.org", source_url=large_url, timestamp=datetime.now(UTC)
+    )
+    for compression in ("off", "zlib", "brotli"):
+        article_cache = Cache(ttl_seconds=3600, compression=compression)
+        article_cache.set("article", value=(article, metadata))
+        cases.append(
+            Case(
+                f"cache.get large article compression={compression}",
+                lambda i, c=article_cache: c.get("article"),
+                2000,
+            )
+        )
+
+    # JSON of a large article: kept with a raw entry, serialized on every
+    # call for a compressed one, which does not keep large derived values
+    for compression in ("off", "brotli"):
+        json_cache = Cache(ttl_seconds=3600, compression=compression)
+        json_cache.set("article", value=(article, metadata))
+
+        def article_json(i: int, c: Cache = json_cache) -> str:
+            serialized = c.get_derived("article", name="json")
+            if serialized is None:
+                serialized = ResponseFormatter.article_json(article)
+                c.set_derived("article", name="json", value=serialized, size=len(serialized))
+            return str(serialized)
+
+        cases.append(Case(f"article json large compression={compression}", article_json, 500))
+    return cases
+
+
+def tool_cases() -> list[Case]:
+    """Benchmark cases for end-to-end tool calls against the jw.org stand-in.
+
+    Returns:
+        Cases calling coroutine functions
+    """
+    large_url, _ = upstream.ARTICLES["large"]
+    medium_url, _ = upstream.ARTICLES["medium"]
+
+    async def search(i: int) -> None:
+        await server.call_tool("search_content", {"query": QUERIES[i % len(QUERIES)]})
+
+    async def article(i: int) -> None:
+        await server.call_tool("get_article", {"url": large_url})
+
+    async def article_range(i: int) -> None:
+        # A different range per call: served from the cached model, but rendered
+        await server.call_tool("get_article", {"url": large_url, "start": i % 200 + 1})
+
+    async def scripture(i: int) -> None:
+        await server.call_tool("get_scripture", {"reference": f"John 3:{i % 30 + 1}"})
+
+    async def medium_article(i: int) -> None:
+        await server.call_tool("get_article", {"url": medium_url})
+
+    return [
+        Case("tool search_content uncached", search, 300, cached=False),
+        Case("tool search_content cached", search, 3000),
+        Case("tool get_article large uncached", article, 100, cached=False),
+        Case("tool get_article large cached", article, 3000),
+        Case("tool get_article large cached, new range", article_range, 1000),
+        Case("tool get_scripture uncached", scripture, 300, cached=False),
+        # Upstream latency keeps all calls in flight at once, as under real load
+        Case(
+            f"tool get_article x{TARGET_CONCURRENCY} concurrent, 50 ms upstream",
+            medium_article,
+            TARGET_CONCURRENCY * 3,
+            cached=False,
+            concurrency=TARGET_CONCURRENCY,
+            upstream_latency=0.05,
+        ),
+    ]
+
+
+def print_results(results: dict[str, dict[str, float]], baseline: dict[str, Any] | None) -> None:
+    """Print a results table, with the change in p50 against a baseline."""
+    header = f"{'case':<48} {'ops/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}"
+    print(header + ("  vs baseline" if baseline else ""))
+    print("-" * (len(header) + (13 if baseline else 0)))
+    for name, summary in results.items():
+        line = (
+            f"{name:<48} {summary['ops_per_sec']:>10.1f} {summary['p50_ms']:>10.4f} "
+            f"{summary['p95_ms']:>10.4f} {summary['p99_ms']:>10.4f}"
+        )
+        reference = (baseline or {}).get("results", {}).get(name)
+        if reference:
+            line += f"  {summary['p50_ms'] / reference['p50_ms'] - 1:+11.1%}"
+        print(line)
+
+
+def regressions(
+    results: dict[str, dict[str, float]], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Find cases whose p50 regressed beyond the threshold.
+
+    Args:
+        results: Current results
+        baseline: Stored baseline
+        threshold: Allowed relative p50 increase
+
+    Returns:
+        Descriptions of the regressed cases
+    """
+    found = []
+    for name, summary in results.items():
+        reference = baseline.get("results", {}).get(name)
+        if reference and summary["p50_ms"] > reference["p50_ms"] * (1 + threshold):
+            found.append(f"{name}: p50 {reference['p50_ms']} ms -> {summary['p50_ms']} ms")
+    return found
+
+
+def recorded_cases(cassette: Cassette) -> list[Case]:
+    """Benchmark cases for the pages and searches recorded in a cassette.
+
+    Args:
+        cassette: Cassette recorded from jw.org (see record_cassette.py)
+
+    Returns:
+        Parse cases and tool cases replaying the cassette
+    """
+    cases = []
+    article_urls = []
+    queries = []
+    for interaction in cassette.interactions:
+        url = httpx.URL(interaction["url"])
+        if interaction["status"] != 200:
+            continue
+        if "/wol/d/" in url.path:
+            html = base64.b64decode(interaction["body"]).decode("utf-8", errors="replace")
+            name = f"parse_article recorded {url.path.rsplit('/', 1)[-1]} ({len(html) // 1024} KiB)"
+            cases.append(
+                Case(
+                    name,
+                    lambda i, html=html, url=str(url): ArticleParser.parse_article(html, url),
+                    max(2_000_000 // max(len(html), 1), 20),
+                )
+            )
+            article_urls.append(str(url))
+        elif url.path.startswith("/apis/search/results/") and url.path.endswith("/all"):
+            queries.append(url.params.get("q", ""))
+
+    async def article(i: int) -> None:
+        await server.call_tool("get_article", {"url": article_urls[i % len(article_urls)]})
+
+    async def search(i: int) -> None:
+        await server.call_tool("search_content", {"query": queries[i % len(queries)]})
+
+    if article_urls:
+        cases.append(
+            Case("tool get_article recorded uncached", article, 100, cached=False, recorded=True)
+        )
+    if queries:
+        cases.append(
+            Case("tool search_content recorded uncached", search, 300, cached=False, recorded=True)
+        )
+    return cases
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """Run the selected cases.
+
+    Returns:
+        Case name -> summary
+    """
+
+    def iterations(case: Case) -> int:
+        return max(int(case.iterations * args.scale), 10)
+
+    cases = unit_cases() + tool_cases()
+    if args.cassette:
+        settings.cassette_mode = "replay"
+        settings.cassette_path = str(args.cassette)
+        cases += recorded_cases(get_cassette(args.cassette))
+
+    results: dict[str, dict[str, float]] = {}
+    for case in cases:
+        if args.filter in case.name and not asyncio.iscoroutinefunction(case.func):
+            results[case.name] = time_sync(case.name, case.func, iterations(case)).summary()
+
+    client = JWOrgClient()
+    replay_client = JWOrgClient()
+    try:
+        for case in cases:
+            if args.filter not in case.name or not asyncio.iscoroutinefunction(case.func):
+                continue
+            if case.recorded:
+                server._client = replay_client
+            else:
+                server._client = client
+                upstream.install(client, latency=case.upstream_latency)
+            with cache_enabled(case.cached):
+                result = await time_async(case.name, case.func, iterations(case), case.concurrency)
+            results[case.name] = result.summary()
+    finally:
+        await client.close()
+        await replay_client.close()
+    return results
+
+
+def main() -> None:
+    """Run the suite, print the results and handle baselines."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--filter", default="", help="Only run cases containing this text")
+    parser.add_argument("--scale", type=float, default=1.0, help="Iteration count multiplier")
+    parser.add_argument("--save-baseline", type=Path, help="Write results to this file")
+    parser.add_argument("--compare", type=Path, help="Compare with this baseline file")
+    parser.add_argument("--cassette", type=Path, help="Also benchmark pages recorded here")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed p50 regression (default 25%%)"
+    )
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    results = asyncio.run(run(args))
+    print_results(results, baseline)
+
+    concurrent = next((r for name, r in results.items() if "concurrent" in name), None)
+    if concurrent is not None:
+        verdict = "meets" if concurrent["p95_ms"] / 1000 < TARGET_P95_SECONDS else "MISSES"
+        print(
+            f"\nConcurrent p95 {concurrent['p95_ms']:.1f} ms {verdict} the "
+            f"{TARGET_P95_SECONDS:.0f} s target at {TARGET_CONCURRENCY} concurrent requests"
+        )
+
+    if args.save_baseline:
+        args.save_baseline.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if baseline is not None:
+        found = regressions(results, baseline, args.threshold)
+        if found:
+            print(f"\nRegressions beyond {args.threshold:.0%}:")
+            for line in found:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
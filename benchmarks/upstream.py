@@ -0,0 +1,251 @@
+"""Offline stand-in for the jw.org endpoints used by the benchmarks.
+
+Serves deterministic responses shaped like the real ones: wol.jw.org article
+pages (site chrome, headings, ``data-pid`` paragraphs, scripture links,
+captions and footnotes) in several sizes, a publication index page, jw-cdn.org
+search results with HTML snippets, and a JWT token. Content is generated from
+a fixed seed, so every run parses identical bytes.
+
+Use ``mock_transport()`` to plug the stand-in into httpx clients, or
+``install(client)`` to route a JWOrgClient's requests through it.
+"""
+
+import asyncio
+import base64
+import functools
+import json
+import random
+import re
+import time
+from typing import Any
+
+import httpx
+
+from jw_org_mcp.client import JWOrgClient
+
+CDN_BASE_URL = "https://b.jw-cdn.org"
+WOL_BASE_URL = "https://wol.jw.org"
+
+# Article URL -> number of paragraphs; sizes span a short news item to a study book chapter
+ARTICLES = {
+    "small": (f"{WOL_BASE_URL}/en/wol/d/r1/lp-e/2024001", 8),
+    "medium": (f"{WOL_BASE_URL}/en/wol/d/r1/lp-e/2024002", 40),
+    "large": (f"{WOL_BASE_URL}/en/wol/d/r1/lp-e/2024003", 240),
+}
+INDEX_URL = f"{WOL_BASE_URL}/en/wol/publication/r1/lp-e/w24"
+
+_WORDS = (
+    "peace security kingdom jehovah bible hope faith love congregation prophecy "
+    "ransom resurrection paradise earth heaven spirit wisdom justice mercy prayer "
+    "disciple witness shepherd covenant promise creation truth light people nation "
+    "the of and to in that for with as on is was by at from his they this will"
+).split()
+_BOOKS = ("Genesis", "Psalm", "Isaiah", "Daniel", "Matthew", "John", "Romans", "Revelation")
+
+_ARTICLE_PATH = re.compile(r"/wol/d/r1/lp-e/(\d+)$")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """Build a sentence of random words."""
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _scripture(rng: random.Random) -> str:
+    """Build a scripture citation."""
+    return f"{rng.choice(_BOOKS)} {rng.randint(1, 50)}:{rng.randint(1, 30)}"
+
+
+@functools.cache
+def article_page(paragraphs: int, seed: int = 0) -> str:
+    """Build a wol.jw.org article page.
+
+    Args:
+        paragraphs: Number of content paragraphs
+        seed: Seed for the generated text
+
+    Returns:
+        HTML page
+    """
+    rng = random.Random(seed * 100003 + paragraphs)
+    chrome = "".join(
+        f'<li><a href="/en/wol/library/r1/lp-e/{i}">{_sentence(rng, 2)}</a></li>' for i in range(60)
+    )
+    body: list[str] = [f'<h1 id="p1" data-pid="1">{_sentence(rng, 6)}</h1>']
+    for pid in range(2, paragraphs + 2):
+        if pid % 12 == 2:
+            body.append(f'<h2 id="p{pid}_h"><strong>{_sentence(rng, 4)}</strong></h2>')
+        sentences = []
+        for _ in range(rng.randint(3, 6)):
+            sentence = _sentence(rng, rng.randint(8, 20))
+            if rng.random() < 0.4:
+                href = f"/en/wol/bc/r1/lp-e/2024003/{pid}"
+                sentence += f' (<a href="{href}" class="b">{_scripture(rng)}</a>)'
+            sentences.append(sentence)
+        body.append(
+            f'<p id="p{pid}" data-pid="{pid}" class="sb"><span class="parNum">{pid - 1}</span> '
+            + " ".join(f"<span>{s}</span>" for s in sentences)
+            + "</p>"
+        )
+        if pid % 20 == 0:
+            body.append(
+                f'<figure><img src="/img/{pid}.jpg" alt="">'
+                f'<p data-pid="{pid}c" class="caption">{_sentence(rng, 10)}</p></figure>'
+            )
+    footnote = f'<p data-pid="fn1" class="footnote">{_sentence(rng, 12)}</p>'
+    body.append(f'<div class="footnote">{footnote}</div>')
+
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        "<title>Watchtower ONLINE LIBRARY</title>"
+        + "".join(f'<link rel="stylesheet" href="/css/{i}.css">' for i in range(8))
+        + '<script>window.wolConfig = {"lang": "en", "rsconf": "r1"};</script></head>'
+        f'<body><header id="regionHeader"><nav><ul>{chrome}</ul></nav></header>'
+        '<div id="regionMain"><div id="content"><div class="docClass-40">'
+        f'<article id="article" class="article">{"".join(body)}</article>'
+        f"</div></div></div><footer><ul>{chrome}</ul></footer></body></html>"
+    )
+
+
+@functools.cache
+def index_page(entries: int = 30) -> str:
+    """Build a wol.jw.org publication index (table of contents) page.
+
+    Args:
+        entries: Number of linked articles
+
+    Returns:
+        HTML page
+    """
+    rng = random.Random(entries)
+    links = "".join(
+        f'<li><a href="/en/wol/d/r1/lp-e/{2024100 + i}?q=x">{_sentence(rng, 5)}</a></li>'
+        for i in range(entries)
+    )
+    return (
+        '<!DOCTYPE html><html lang="en"><body><div id="regionMain">'
+        f"<h1>The Watchtower 2024</h1><ul>{links}</ul>"
+        '<article id="article"><p>Contents</p></article></div></body></html>'
+    )
+
+
+@functools.cache
+def search_payload(query: str, filter_type: str = "all", results: int = 10) -> dict[str, Any]:
+    """Build a jw-cdn.org search API response.
+
+    Args:
+        query: Search terms
+        filter_type: Search filter
+        results: Number of results
+
+    Returns:
+        Response JSON
+    """
+    rng = random.Random(f"{query}:{filter_type}")
+    items = []
+    for rank in range(1, results + 1):
+        url, _ = ARTICLES[("small", "medium", "large")[rank % 3]]
+        if filter_type == "bible":
+            title = _scripture(rng)
+        else:
+            title = _sentence(rng, 5)
+        snippet = " ".join(
+            f"<strong>{word}</strong>" if word in query.split() else word
+            for word in _sentence(rng, 30).split()
+        )
+        items.append(
+            {
+                "type": "item",
+                "subtype": "article",
+                "links": {"wol": url, "jw.org": f"https://www.jw.org/en/library/{rank}/"},
+                "title": title,
+                "snippet": f"<p>{snippet}</p>",
+                "context": f"The Watchtower ({1980 + rank})",
+                "insight": {"rank": rank},
+            }
+        )
+    return {
+        "layout": ["flat"],
+        "results": [{"type": "group", "results": items}],
+        "insight": {
+            "query": query,
+            "filter": filter_type,
+            "page": 1,
+            "total": {"value": results * 25, "relation": "gte"},
+        },
+    }
+
+
+def make_token(expires: int = 4102444800) -> str:
+    """Build an unsigned JWT with the given expiry.
+
+    Args:
+        expires: Expiry as a Unix timestamp
+
+    Returns:
+        Token string
+    """
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expires}).encode()).decode()
+    return f"eyJhbGciOiJub25lIn0.{payload.rstrip('=')}.signature"
+
+
+def respond(request: httpx.Request, token_ttl: float | None = None) -> httpx.Response:
+    """Answer a request to one of the stand-in endpoints.
+
+    Requests are routed by path, so the stand-in can also be served from any host.
+
+    Args:
+        request: Request for a jw-cdn.org or wol.jw.org URL
+        token_ttl: Lifetime of issued tokens in seconds (default: until 2100)
+
+    Returns:
+        Response (404 for unknown URLs)
+    """
+    path = request.url.path
+    if path == "/tokens/jworg.jwt":
+        expires = int(time.time() + token_ttl) if token_ttl is not None else 4102444800
+        return httpx.Response(200, text=make_token(expires))
+    if path.startswith("/apis/search/results/"):
+        filter_type = path.rsplit("/", 1)[-1]
+        query = request.url.params.get("q", "")
+        return httpx.Response(200, json=search_payload(query, filter_type))
+    if path == httpx.URL(INDEX_URL).path:
+        return httpx.Response(200, text=index_page())
+    match = _ARTICLE_PATH.search(path)
+    if match:
+        for article_url, paragraphs in ARTICLES.values():
+            if path == httpx.URL(article_url).path:
+                return httpx.Response(200, text=article_page(paragraphs))
+        # Unknown documents get a medium article of their own
+        return httpx.Response(200, text=article_page(40, seed=int(match.group(1))))
+    return httpx.Response(404, text="Not found")
+
+
+def mock_transport(latency: float = 0.0) -> httpx.MockTransport:
+    """Create an httpx transport answering from the stand-in.
+
+    Args:
+        latency: Seconds to wait before each response
+
+    Returns:
+        Transport for httpx.AsyncClient
+    """
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if latency:
+            await asyncio.sleep(latency)
+        return respond(request)
+
+    return httpx.MockTransport(handler)
+
+
+def install(client: JWOrgClient, latency: float = 0.0) -> None:
+    """Route a client's jw.org, jw-cdn.org and token requests through the stand-in.
+
+    Args:
+        client: Client to route
+        latency: Seconds to wait before each response
+    """
+    transport = mock_transport(latency)
+    client._http_client = httpx.AsyncClient(transport=transport, follow_redirects=True)
+    client._auth_manager._http_client = httpx.AsyncClient(transport=transport)
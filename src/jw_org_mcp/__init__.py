@@ -1,19 +1,58 @@
 """JW.Org MCP Tool - Model Context Protocol server for verified jw.org content access."""
 
-import asyncio
+from typing import TYPE_CHECKING, Any
 
-from mcp.server.stdio import stdio_server
+if TYPE_CHECKING:
+    from .server import app, cleanup
 
-from .server import app, cleanup
+__all__ = ["app", "async_main", "cleanup", "main"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the server lazily on first access to its attributes (PEP 562).
+
+    Importing the package (e.g. for jw_org_mcp.cache) does not pull in the MCP
+    SDK or the HTTP/HTML stack.
+    """
+    if name in ("app", "cleanup"):
+        from . import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
     """Main entry point for the MCP server."""
+    from .config import settings
+
+    if settings.transport == "http" and settings.http_workers > 1:
+        from .workers import run_supervisor
+
+        run_supervisor()
+        return
+
+    import asyncio
+
     asyncio.run(async_main())
 
 
 async def async_main() -> None:
     """Async main function."""
+    from .config import settings
+    from .server import app, cleanup, configure_logging, start_maintenance
+
+    configure_logging()
+
+    if settings.transport == "http":
+        from .http_server import serve_http
+
+        # The HTTP application's lifespan calls cleanup() on shutdown
+        await serve_http()
+        return
+
+    from mcp.server.stdio import stdio_server
+
+    start_maintenance()
     try:
         async with stdio_server() as (read_stream, write_stream):
             await app.run(
@@ -1,33 +1,55 @@
 """Authentication and CDN discovery for JW.Org API."""
 
+import asyncio
 import logging
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 import httpx
 
 from .config import settings
-from .exceptions import AuthenticationError
+from .exceptions import AuthenticationError, CircuitOpenError
+from .http_client import configured_timeout, create_http_client
+from .metrics import metrics
 from .models import CDNInfo, JWTToken
 
+if TYPE_CHECKING:
+    from .resilience import CircuitBreaker
+    from .shared import SharedTokenStore
+
 logger = logging.getLogger(__name__)
 
 
 class AuthManager:
     """Manages authentication with JW.Org APIs."""
 
-    def __init__(self) -> None:
-        """Initialize the auth manager."""
+    def __init__(
+        self,
+        token_store: "SharedTokenStore | None" = None,
+        breaker: "CircuitBreaker | None" = None,
+    ) -> None:
+        """Initialize the auth manager.
+
+        Args:
+            token_store: Optional token store shared with other worker processes
+            breaker: Optional circuit breaker of the token endpoint
+        """
+        self._token_store = token_store
+        self._breaker = breaker
         self._cdn_info: CDNInfo | None = None
         self._jwt_token: JWTToken | None = None
         self._client_id: str = str(uuid.uuid4())
         self._http_client: httpx.AsyncClient | None = None
+        # Serializes refreshes so concurrent requests share one token fetch
+        self._token_lock = asyncio.Lock()
 
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                timeout=settings.request_timeout,
+            self._http_client = create_http_client(
+                timeout=configured_timeout(),
                 limits=httpx.Limits(
                     max_connections=settings.connection_pool_size,
                     max_keepalive_connections=settings.connection_pool_size,
@@ -69,7 +91,7 @@ class AuthManager:
         self._cdn_info = CDNInfo(
             base_url=settings.cdn_base_url, discovered_at=datetime.now(UTC)
         )
-        logger.info(f"Using CDN: {settings.cdn_base_url}")
+        logger.info("Using CDN: %s", settings.cdn_base_url)
         return self._cdn_info
 
     async def get_jwt_token(self, force_refresh: bool = False) -> str:
@@ -85,12 +107,62 @@ class AuthManager:
             AuthenticationError: If authentication fails
         """
         # Check if we have a valid token
-        if not force_refresh and self._jwt_token is not None:
-            # Check if token is still valid (with 5 minute buffer)
-            if datetime.now(UTC) < self._jwt_token.expires_at - timedelta(minutes=5):
-                return self._jwt_token.token
+        token = None if force_refresh else self._valid_token()
+        if token is not None:
+            return token
+
+        async with self._token_lock:
+            # Another request may have refreshed the token while we waited
+            token = None if force_refresh else self._valid_token()
+            if token is not None:
+                return token
+
+            if self._token_store is not None:
+                # Adopt a token another worker fetched, or fetch one for all workers
+                rejected = self._jwt_token.token if force_refresh and self._jwt_token else None
+                self._jwt_token = await self._token_store.refresh(
+                    self._fetch_token, self._is_fresh, reject=rejected
+                )
+            else:
+                self._jwt_token = await self._fetch_token()
+            return self._jwt_token.token
+
+    @staticmethod
+    def _is_fresh(token: JWTToken) -> bool:
+        """Check whether a token is still valid (with 5 minute buffer).
 
-        # Need to get a new token
+        Args:
+            token: Token to check
+
+        Returns:
+            True if the token is not about to expire
+        """
+        return datetime.now(UTC) < token.expires_at - timedelta(minutes=5)
+
+    def _valid_token(self) -> str | None:
+        """Get the current token if it is still valid.
+
+        Returns:
+            JWT token string, or None if missing or about to expire
+        """
+        if self._jwt_token is not None and self._is_fresh(self._jwt_token):
+            return self._jwt_token.token
+        return None
+
+    async def _fetch_token(self) -> JWTToken:
+        """Request a new JWT token.
+
+        Returns:
+            The new token
+
+        Raises:
+            AuthenticationError: If authentication fails
+        """
+        with metrics.timer("jworg_auth_refresh_duration_seconds", "jworg_auth_refresh_total"):
+            return await self._request_token()
+
+    async def _request_token(self) -> JWTToken:
+        """Request a new JWT token from the CDN (see _fetch_token)."""
         try:
             cdn_info = await self.discover_cdn()
             token_url = f"{cdn_info.base_url}/tokens/jworg.jwt"
@@ -98,7 +170,21 @@ class AuthManager:
             client = await self._get_http_client()
             logger.info("Requesting JWT token")
 
-            response = await client.get(token_url)
+            if self._breaker is not None:
+                self._breaker.check()
+            start = time.perf_counter()
+            with metrics.timer(
+                "jworg_upstream_duration_seconds", "jworg_upstream_requests_total", endpoint="token"
+            ) as timer:
+                try:
+                    response = await client.get(token_url)
+                except httpx.TransportError:
+                    if self._breaker is not None:
+                        self._breaker.record_failure()
+                    raise
+                timer.status = str(response.status_code)
+            if self._breaker is not None:
+                self._breaker.record_response(response.status_code, time.perf_counter() - start)
             response.raise_for_status()
 
             token = response.text.strip()
@@ -106,18 +192,19 @@ class AuthManager:
             # Parse JWT to get expiry (simple extraction without validation)
             exp_time = self._extract_token_expiry(token)
 
-            self._jwt_token = JWTToken(
-                token=token, expires_at=exp_time, issued_at=datetime.now(UTC)
-            )
+            jwt_token = JWTToken(token=token, expires_at=exp_time, issued_at=datetime.now(UTC))
 
-            logger.info(f"JWT token acquired, expires at {exp_time}")
-            return token
+            logger.info("JWT token acquired, expires at %s", exp_time)
+            return jwt_token
 
+        except CircuitOpenError as e:
+            logger.warning("JWT token request skipped: %s", e)
+            raise AuthenticationError(f"Failed to get JWT token: {e}") from e
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error getting JWT token: {e}")
+            logger.error("HTTP error getting JWT token: %s", e)
             raise AuthenticationError(f"Failed to get JWT token: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error getting JWT token: {e}")
+            logger.error("Unexpected error getting JWT token: %s", e)
             raise AuthenticationError(f"Unexpected error getting JWT token: {e}") from e
 
     def _extract_token_expiry(self, token: str) -> datetime:
@@ -156,7 +243,7 @@ class AuthManager:
             return datetime.fromtimestamp(exp_timestamp, UTC)
 
         except Exception as e:
-            logger.warning(f"Could not extract token expiry: {e}, using default")
+            logger.warning("Could not extract token expiry: %s, using default", e)
             # Default to 7 days
             return datetime.now(UTC) + timedelta(days=7)
 
@@ -1,17 +1,39 @@
 """Caching layer for JW.Org MCP Tool."""
 
 import hashlib
+import heapq
 import logging
-from datetime import UTC, datetime, timedelta
-from typing import Any
+import os
+import struct
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .codec import CompressedValue, EncodedValue, compress_value, decode_value, encode_value
+from .metrics import metrics
+
+if TYPE_CHECKING:
+    from .shared import SharedCacheStore
 
 logger = logging.getLogger(__name__)
 
+# Snapshot file: magic, then one record per entry, each followed by its payload
+_SNAPSHOT_MAGIC = b"JWCACHE\x01"
+# Key (SHA-256), expiry (Unix time), kind, encoded size, payload size
+_SNAPSHOT_RECORD = struct.Struct("<32sdBII")
+# Record kinds: how the payload is stored
+_SNAPSHOT_KINDS = {"encoded": 0, "zlib": 1, "brotli": 2}
+_SNAPSHOT_KIND_NAMES = {kind: name for name, kind in _SNAPSHOT_KINDS.items()}
+
 
 class CacheEntry:
-    """A cache entry with expiration."""
+    """A cache entry with expiration.
 
-    def __init__(self, data: Any, ttl_seconds: int) -> None:
+    Times are on the ``time.monotonic()`` clock.
+    """
+
+    def __init__(self, data: Any, ttl_seconds: float) -> None:
         """Initialize cache entry.
 
         Args:
@@ -19,8 +41,10 @@ class CacheEntry:
             ttl_seconds: Time to live in seconds
         """
         self.data = data
-        self.created_at = datetime.now(UTC)
-        self.expires_at = self.created_at + timedelta(seconds=ttl_seconds)
+        # Representations computed from data (e.g. serialized JSON), dropped with the entry
+        self.derived: dict[str, Any] = {}
+        self.created_at = time.monotonic()
+        self.expires_at = self.created_at + ttl_seconds
 
     def is_expired(self) -> bool:
         """Check if cache entry is expired.
@@ -28,22 +52,158 @@ class CacheEntry:
         Returns:
             True if expired
         """
-        return datetime.now(UTC) >= self.expires_at
+        return time.monotonic() >= self.expires_at
+
+
+class AdaptiveTTL:
+    """TTLs learned per cache key from how often the cached content changes.
+
+    Each time a key is stored again (after its entry expired and the content
+    was fetched anew), the content hash is compared with the previous one:
+    unchanged content doubles the key's TTL and changed content halves it,
+    within the configured bounds.
+    """
+
+    def __init__(self, min_seconds: float, max_seconds: float, max_keys: int = 10000) -> None:
+        """Initialize the learned TTLs.
+
+        Args:
+            min_seconds: Shortest TTL
+            max_seconds: Longest TTL
+            max_keys: Keys to remember; the least recently stored are forgotten
+        """
+        self._min_seconds = min_seconds
+        self._max_seconds = max_seconds
+        self._max_keys = max_keys
+        # Key -> (content class, content hash, learned TTL), least recent first
+        self._keys: OrderedDict[str, tuple[str, str, float]] = OrderedDict()
+        self._unchanged = 0
+        self._changed = 0
+
+    def ttl(self, key: str, content_hash: str, content_class: str, default: float) -> float:
+        """Learn from a newly stored value and get its TTL.
+
+        Args:
+            key: Hashed cache key
+            content_hash: Hash of the value's content
+            content_class: Kind of content (e.g. "article"), for statistics
+            default: TTL for a key seen for the first time
+
+        Returns:
+            TTL in seconds
+        """
+        state = self._keys.pop(key, None)
+        if state is None:
+            ttl = default
+        elif state[1] == content_hash:
+            ttl = state[2] * 2
+            self._unchanged += 1
+        else:
+            ttl = state[2] / 2
+            self._changed += 1
+        ttl = min(max(ttl, self._min_seconds), self._max_seconds)
+
+        self._keys[key] = (content_class, content_hash, ttl)
+        if len(self._keys) > self._max_keys:
+            self._keys.popitem(last=False)
+        return ttl
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the learned TTL distribution.
+
+        Returns:
+            Dictionary with the number of keys, how often content was found
+            unchanged or changed, and per content class the number of keys
+            by learned TTL in seconds
+        """
+        distribution: dict[str, dict[int, int]] = {}
+        for content_class, _, ttl in self._keys.values():
+            counts = distribution.setdefault(content_class, {})
+            counts[round(ttl)] = counts.get(round(ttl), 0) + 1
+        return {
+            "keys": len(self._keys),
+            "unchanged": self._unchanged,
+            "changed": self._changed,
+            "distribution": {
+                content_class: dict(sorted(counts.items()))
+                for content_class, counts in sorted(distribution.items())
+            },
+        }
 
 
 class Cache:
-    """Simple in-memory cache with TTL."""
+    """Simple in-memory cache with TTL.
+
+    Optionally backed by a shared tier that other worker processes read and
+    write; values are written through to it and local misses fall back to it.
+
+    Large values can be held compressed; they are decompressed on each hit,
+    trading a little CPU for resident memory.
+
+    Expired entries are removed when looked up, and by ``sweep``, which
+    walks an expiry-ordered heap so that it only touches expired entries.
 
-    def __init__(self, ttl_seconds: int = 900) -> None:
+    With an AdaptiveTTL, values stored with a content hash get a TTL learned
+    from how often their content changes.
+
+    With ``stale_seconds``, expired entries are kept that much longer so that
+    ``get_stale`` can still serve them while upstream is failing.
+    """
+
+    # Seconds between removals of expired values from the shared tier
+    SHARED_PURGE_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        ttl_seconds: int = 900,
+        shared: "SharedCacheStore | None" = None,
+        compression: str = "off",
+        compress_min_bytes: int = 16384,
+        adaptive_ttl: AdaptiveTTL | None = None,
+        tier: str = "local",
+        stale_seconds: float = 0.0,
+    ) -> None:
         """Initialize cache.
 
         Args:
             ttl_seconds: Default time to live in seconds
+            shared: Optional cache tier shared with other processes
+            compression: "zlib" or "brotli" to hold large values compressed,
+                or "off"
+            compress_min_bytes: Encoded size from which values are compressed
+            adaptive_ttl: Optional learned TTLs for values stored with a
+                content hash
+            tier: Tier label of the cache's metrics
+            stale_seconds: How long expired entries are kept for get_stale
+
+        Raises:
+            ValueError: If the compression algorithm is unknown
         """
+        if compression not in ("off", "zlib", "brotli"):
+            raise ValueError(f"Unknown compression algorithm: {compression}")
         self._cache: dict[str, CacheEntry] = {}
+        # (removal time, key) of every entry stored: its expiry plus the stale
+        # period; items of replaced or removed entries stay until popped or
+        # compacted away
+        self._expiry: list[tuple[float, str]] = []
+        self._next_shared_purge = 0.0
+        self._expired = 0
         self._ttl_seconds = ttl_seconds
+        self._shared = shared
+        self._compression = compression
+        self._compress_min_bytes = compress_min_bytes
+        self._adaptive_ttl = adaptive_ttl
+        self._tier = tier
+        self._stale_seconds = stale_seconds
+        self._stale_hits = 0
         self._hits = 0
         self._misses = 0
+        self._shared_hits = 0
+        self._compress_seconds = 0.0
+        self._decompress_seconds = 0.0
+        self._decompressions = 0
+        self._derived_skipped = 0
+        self._restored = 0
 
     def _make_key(self, *args: Any) -> str:
         """Create cache key from arguments.
@@ -69,54 +229,460 @@ class Cache:
         key = self._make_key(*args)
         entry = self._cache.get(key)
 
-        if entry is None:
-            self._misses += 1
-            logger.debug(f"Cache miss: {key}")
-            return None
+        value = None
+        if entry is not None:
+            if entry.is_expired():
+                # Remove expired entry, unless it may still be served stale
+                if time.monotonic() >= entry.expires_at + self._stale_seconds:
+                    del self._cache[key]
+                logger.debug("Cache expired: %s", key)
+            else:
+                value = self._load(key, entry)
 
-        if entry.is_expired():
-            # Remove expired entry
-            del self._cache[key]
-            self._misses += 1
-            logger.debug(f"Cache expired: {key}")
-            return None
+        if value is None:
+            metrics.inc("jworg_cache_requests_total", tier=self._tier, result="miss")
+            value = self._get_shared(key)
+            if value is None:
+                self._misses += 1
+                logger.debug("Cache miss: %s", key)
+                return None
+            self._shared_hits += 1
+        else:
+            metrics.inc("jworg_cache_requests_total", tier=self._tier, result="hit")
 
         self._hits += 1
-        logger.debug(f"Cache hit: {key}")
-        return entry.data
+        logger.debug("Cache hit: %s", key)
+        return value
+
+    def get_stale(self, *args: Any) -> Any | None:
+        """Get a value from the local cache even if it has expired.
 
-    def set(self, *args: Any, value: Any, ttl_seconds: int | None = None) -> None:
+        For serving something while upstream is failing; values expired for
+        longer than ``stale_seconds`` are gone. Does not count towards
+        hit/miss statistics.
+
+        Args:
+            *args: Cache key components
+
+        Returns:
+            Cached value, or None if not held
+        """
+        key = self._make_key(*args)
+        entry = self._cache.get(key)
+        if entry is None or time.monotonic() >= entry.expires_at + self._stale_seconds:
+            return None
+        value = self._load(key, entry)
+        if value is not None:
+            self._stale_hits += 1
+            metrics.inc("jworg_cache_requests_total", tier=self._tier, result="stale")
+            logger.debug("Cache stale hit: %s", key)
+        return value
+
+    def peek(self, *args: Any) -> Any | None:
+        """Get a value held in the local cache, even if it has expired.
+
+        For comparing a refetched value with the one it replaces; does not
+        count as a lookup. Values expired for longer than ``stale_seconds``
+        are gone.
+
+        Args:
+            *args: Cache key components
+
+        Returns:
+            Cached value, or None if not held
+        """
+        key = self._make_key(*args)
+        entry = self._cache.get(key)
+        if entry is None or time.monotonic() >= entry.expires_at + self._stale_seconds:
+            return None
+        return self._load(key, entry)
+
+    def set(
+        self,
+        *args: Any,
+        value: Any,
+        ttl_seconds: float | None = None,
+        content_hash: str | None = None,
+        content_class: str = "other",
+        keep_derived: tuple[str, ...] = (),
+    ) -> None:
         """Set value in cache.
 
         Args:
             *args: Cache key components (last arg is the value)
             value: Value to cache
             ttl_seconds: Optional custom TTL
+            content_hash: Hash of the value's content, excluding volatile
+                parts such as fetch timestamps; enables the learned TTL
+            content_class: Kind of content, for learned TTL statistics
+            keep_derived: Names of derived representations of the replaced
+                entry that are still valid for the new value
         """
         key = self._make_key(*args)
-        ttl = ttl_seconds if ttl_seconds is not None else self._ttl_seconds
+        if ttl_seconds is not None:
+            ttl: float = ttl_seconds
+        elif self._adaptive_ttl is not None and content_hash is not None:
+            ttl = self._adaptive_ttl.ttl(key, content_hash, content_class, self._ttl_seconds)
+        else:
+            ttl = self._ttl_seconds
+
+        encoded = None
+        if self._shared is not None or self._compression != "off":
+            encoded = encode_value(value)
+
+        entry = CacheEntry(self._compress(value, encoded), ttl)
+        previous = self._cache.get(key)
+        if previous is not None:
+            entry.derived = {
+                name: previous.derived[name] for name in keep_derived if name in previous.derived
+            }
+        self._store(key, entry)
+        logger.debug("Cache set: %s (TTL: %ss)", key, ttl)
+
+        if self._shared is not None and encoded is not None:
+            self._shared.set(key, encoded, time.time() + ttl)
+
+    def _load(self, key: str, entry: CacheEntry) -> Any | None:
+        """Get the value of a live entry, decoding it if needed.
+
+        Entries restored from a snapshot are decoded on their first hit and
+        then held like any other value.
+
+        Args:
+            key: Hashed cache key
+            entry: Entry to read
+
+        Returns:
+            The value, or None if a restored value cannot be decoded
+        """
+        data = entry.data
+        if isinstance(data, CompressedValue):
+            return self._decompress(data)
+        if isinstance(data, EncodedValue):
+            try:
+                value = decode_value(data.payload)
+            except ValueError as e:
+                logger.warning("Discarding undecodable restored cache value %s: %s", key, e)
+                del self._cache[key]
+                return None
+            entry.data = self._compress(value, data.payload)
+            return value
+        return data
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry and schedule its expiry.
 
-        self._cache[key] = CacheEntry(value, ttl)
-        logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+        Args:
+            key: Hashed cache key
+            entry: Entry to store
+        """
+        self._cache[key] = entry
+        heapq.heappush(self._expiry, (entry.expires_at + self._stale_seconds, key))
+
+    def _compress(self, value: Any, encoded: bytes | None) -> Any:
+        """Get the form in which to hold a value locally.
+
+        Args:
+            value: Value to cache
+            encoded: The value encoded by encode_value, or None if unsupported
+
+        Returns:
+            A CompressedValue if compression is enabled and the encoded value
+            reaches the size threshold, otherwise the value itself
+        """
+        if self._compression == "off" or encoded is None or len(encoded) < self._compress_min_bytes:
+            return value
+        start = time.perf_counter()
+        compressed = compress_value(encoded, self._compression)
+        self._compress_seconds += time.perf_counter() - start
+        return compressed
+
+    def _decompress(self, value: CompressedValue) -> Any:
+        """Decode a value held compressed.
+
+        Args:
+            value: Compressed value
+
+        Returns:
+            The decoded value
+        """
+        start = time.perf_counter()
+        decoded = value.decode()
+        self._decompress_seconds += time.perf_counter() - start
+        self._decompressions += 1
+        return decoded
+
+    def _get_shared(self, key: str) -> Any | None:
+        """Load a value from the shared tier into the local cache.
+
+        Args:
+            key: Hashed cache key
+
+        Returns:
+            The loaded value, or None if the shared tier has no usable value
+        """
+        if self._shared is None:
+            return None
+
+        row = self._shared.get(key)
+        if row is None:
+            metrics.inc("jworg_cache_requests_total", tier="shared", result="miss")
+            return None
+
+        encoded, expires_at = row
+        try:
+            value = decode_value(encoded)
+        except ValueError as e:
+            logger.warning("Discarding undecodable shared cache value %s: %s", key, e)
+            metrics.inc("jworg_cache_requests_total", tier="shared", result="miss")
+            return None
+
+        # Keep the remaining TTL of the shared value
+        self._store(key, CacheEntry(self._compress(value, encoded), expires_at - time.time()))
+        metrics.inc("jworg_cache_requests_total", tier="shared", result="hit")
+        logger.debug("Shared cache hit: %s", key)
+        return value
+
+    def get_derived(self, *args: Any, name: str, count_hit: bool = False) -> Any | None:
+        """Get a derived representation stored alongside a cached value.
+
+        Does not count towards hit/miss statistics, unless ``count_hit`` is
+        set and the representation is found.
+
+        Args:
+            *args: Cache key components
+            name: Name of the derived representation
+            count_hit: Count a found representation as a hit of its entry,
+                for lookups it answers in place of the value
+
+        Returns:
+            Derived value or None if missing or the entry is expired
+        """
+        entry = self._cache.get(self._make_key(*args))
+        if entry is None or entry.is_expired():
+            return None
+        value = entry.derived.get(name)
+        if value is not None and count_hit:
+            self._hits += 1
+            metrics.inc("jworg_cache_requests_total", tier=self._tier, result="hit")
+        return value
+
+    def set_derived(self, *args: Any, name: str, value: Any, size: int = 0) -> bool:
+        """Store a derived representation alongside a cached value.
+
+        The derived value shares the entry's lifetime and is discarded when the
+        entry expires, is replaced, or the cache is cleared. Derived values are
+        held uncompressed, so an entry held compressed only keeps those smaller
+        than the compression threshold: a large one would undo the saving.
+
+        Args:
+            *args: Cache key components
+            name: Name of the derived representation
+            value: Derived value
+            size: Approximate size of the value in characters or bytes
+
+        Returns:
+            True if stored, False if there is no live entry for the key or the
+            value is too large to keep next to a compressed entry
+        """
+        entry = self._cache.get(self._make_key(*args))
+        if entry is None or entry.is_expired():
+            return False
+        if isinstance(entry.data, CompressedValue) and size >= self._compress_min_bytes:
+            self._derived_skipped += 1
+            return False
+        entry.derived[name] = value
+        return True
 
     def clear(self) -> None:
         """Clear all cache entries."""
         count = len(self._cache)
         self._cache.clear()
+        self._expiry.clear()
+        if self._shared is not None:
+            self._shared.clear()
         self._hits = 0
         self._misses = 0
-        logger.info(f"Cache cleared: {count} entries removed")
+        self._shared_hits = 0
+        self._compress_seconds = 0.0
+        self._decompress_seconds = 0.0
+        self._decompressions = 0
+        self._derived_skipped = 0
+        self._expired = 0
+        self._restored = 0
+        self._stale_hits = 0
+        logger.info("Cache cleared: %d entries removed", count)
 
-    def cleanup_expired(self) -> None:
-        """Remove expired entries from cache."""
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
+    def sweep(self, budget_seconds: float | None = None) -> int:
+        """Remove expired entries from the local cache, oldest expiry first.
+
+        Entries are kept until their stale period has passed too. Only
+        entries due for removal are visited, and the clock is read once per
+        batch rather than once per entry.
+
+        Args:
+            budget_seconds: Stop after about this long, leaving the remaining
+                expired entries to the next sweep; None for no limit
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        stop_at = now + budget_seconds if budget_seconds is not None else float("inf")
+        heap = self._expiry
+        removed = 0
+        popped = 0
+        while heap and heap[0][0] <= now:
+            remove_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip items left behind by entries replaced or removed since
+            if entry is not None and entry.expires_at + self._stale_seconds == remove_at:
+                del self._cache[key]
+                removed += 1
+            popped += 1
+            if popped % 64 == 0 and time.monotonic() >= stop_at:
+                break
+
+        # Rebuild the heap once stale items outnumber the live entries
+        if len(heap) > 2 * len(self._cache) + 1024:
+            self._expiry = [
+                (entry.expires_at + self._stale_seconds, key) for key, entry in self._cache.items()
+            ]
+            heapq.heapify(self._expiry)
+
+        self._expired += removed
+        if removed:
+            metrics.inc("jworg_cache_expired_total", removed, tier=self._tier)
+            logger.debug("Cache sweep: %d expired entries removed", removed)
+        return removed
+
+    def maintain(self, budget_seconds: float) -> int:
+        """Run one round of background maintenance.
+
+        Sweeps the local cache within the budget and, at most every
+        SHARED_PURGE_INTERVAL seconds, removes expired values from the shared
+        tier.
+
+        Args:
+            budget_seconds: Time budget for the local sweep
+
+        Returns:
+            Number of entries removed from either tier
+        """
+        removed = self.sweep(budget_seconds)
+        now = time.monotonic()
+        if self._shared is not None and now >= self._next_shared_purge:
+            self._next_shared_purge = now + self.SHARED_PURGE_INTERVAL
+            shared_removed = self._shared.delete_expired()
+            if shared_removed:
+                metrics.inc("jworg_cache_expired_total", shared_removed, tier="shared")
+            removed += shared_removed
+        return removed
 
-        for key in expired_keys:
-            del self._cache[key]
+    def save_snapshot(self, path: Path) -> int:
+        """Write the live entries to a snapshot file for load_snapshot.
 
-        removed = len(expired_keys)
+        Entries keep their expiry as wall-clock time, so the time until the
+        next start counts against their TTL. Values the codec does not
+        support and derived representations are not saved.
+
+        Args:
+            path: Snapshot file, replaced atomically
+
+        Returns:
+            Number of entries written
+        """
+        now = time.monotonic()
+        wall_offset = time.time() - now
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        count = 0
+        with temp.open("wb") as f:
+            f.write(_SNAPSHOT_MAGIC)
+            for key, entry in self._cache.items():
+                if entry.expires_at <= now:
+                    continue
+                data = entry.data
+                if isinstance(data, CompressedValue):
+                    kind = _SNAPSHOT_KINDS[data.algorithm]
+                    payload, size = data.payload, data.raw_size
+                else:
+                    encoded = data.payload if isinstance(data, EncodedValue) else encode_value(data)
+                    if encoded is None:
+                        continue
+                    kind, payload, size = _SNAPSHOT_KINDS["encoded"], encoded, len(encoded)
+                f.write(
+                    _SNAPSHOT_RECORD.pack(
+                        bytes.fromhex(key), entry.expires_at + wall_offset, kind, size, len(payload)
+                    )
+                )
+                f.write(payload)
+                count += 1
+        temp.replace(path)
+        logger.info("Cache snapshot: %d entries saved to %s", count, path)
+        return count
+
+    def load_snapshot(self, path: Path) -> int:
+        """Restore the unexpired entries of a snapshot written by save_snapshot.
+
+        Values are not decoded here but on their first hit, so loading a large
+        snapshot costs little more than reading the file.
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            Number of entries restored; 0 if the file is missing or invalid
+        """
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return 0
+        if not data.startswith(_SNAPSHOT_MAGIC):
+            logger.warning("Ignoring cache snapshot %s: unknown format", path)
+            return 0
+
+        now = time.time()
+        view = memoryview(data)
+        offset = len(_SNAPSHOT_MAGIC)
+        count = 0
+        try:
+            while offset < len(data):
+                key, expires_at, kind, size, length = _SNAPSHOT_RECORD.unpack_from(view, offset)
+                offset += _SNAPSHOT_RECORD.size
+                payload = bytes(view[offset : offset + length])
+                offset += length
+                if len(payload) != length:
+                    raise ValueError("truncated record")
+                if expires_at <= now:
+                    continue
+                value: EncodedValue | CompressedValue
+                if kind == _SNAPSHOT_KINDS["encoded"]:
+                    value = EncodedValue(payload)
+                else:
+                    value = CompressedValue(_SNAPSHOT_KIND_NAMES[kind], payload, size)
+                self._store(key.hex(), CacheEntry(value, expires_at - now))
+                count += 1
+        except (struct.error, KeyError, ValueError) as e:
+            logger.warning("Cache snapshot %s is damaged after %d entries: %s", path, count, e)
+
+        self._restored += count
+        logger.info("Cache snapshot: %d entries restored from %s", count, path)
+        return count
+
+    def cleanup_expired(self) -> None:
+        """Remove all expired entries from the cache and the shared tier."""
+        removed = self.sweep()
+        if self._shared is not None:
+            removed += self._shared.delete_expired()
         if removed > 0:
-            logger.info(f"Cache cleanup: {removed} expired entries removed")
+            logger.info("Cache cleanup: %d expired entries removed", removed)
+
+    def close(self) -> None:
+        """Close the shared tier, if any; the cache keeps working locally afterwards."""
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -127,9 +693,41 @@ class Cache:
         total_requests = self._hits + self._misses
         hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
 
-        return {
+        stats: dict[str, Any] = {
             "entries": len(self._cache),
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": round(hit_rate, 2),
+            "shared_hits": self._shared_hits,
+            "expired": self._expired,
+            "restored": self._restored,
+            "stale_hits": self._stale_hits,
         }
+        if self._shared is not None:
+            stats["shared_busy_skips"] = self._shared.busy_skips
+        if self._adaptive_ttl is not None:
+            stats["adaptive_ttl"] = self._adaptive_ttl.get_stats()
+        if self._compression != "off":
+            compressed = [
+                entry.data
+                for entry in self._cache.values()
+                if isinstance(entry.data, CompressedValue)
+            ]
+            raw_bytes = sum(value.raw_size for value in compressed)
+            stored_bytes = sum(len(value.payload) for value in compressed)
+            stats.update(
+                {
+                    "compression": self._compression,
+                    "compressed_entries": len(compressed),
+                    "compressed_raw_bytes": raw_bytes,
+                    "compressed_stored_bytes": stored_bytes,
+                    "compression_ratio": (
+                        round(raw_bytes / stored_bytes, 2) if stored_bytes else 0
+                    ),
+                    "compress_ms": round(self._compress_seconds * 1000, 2),
+                    "decompress_ms": round(self._decompress_seconds * 1000, 2),
+                    "decompressions": self._decompressions,
+                    "derived_skipped": self._derived_skipped,
+                }
+            )
+        return stats
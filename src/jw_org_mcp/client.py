@@ -1,35 +1,124 @@
 """JW.Org API client."""
 
+import asyncio
+import functools
+import hashlib
 import logging
+import time
+import weakref
+from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 import httpx
+from mcp.types import TextContent
 
 from .auth import AuthManager
-from .cache import Cache
+from .cache import AdaptiveTTL, Cache
 from .config import settings
-from .exceptions import ContentRetrievalError, SearchError
-from .models import ArticleContent, PublicationIndex, ResponseMetadata, SearchResponse
-from .parser import ArticleParser, QueryParser, SearchResponseParser
+from .exceptions import (
+    AuthenticationError,
+    CircuitOpenError,
+    ContentRetrievalError,
+    ParseError,
+    SearchError,
+)
+from .http_client import configured_timeout, create_http_client, decoded_response
+from .metrics import metrics, span
+from .models import (
+    AlignedParagraph,
+    ArticleContent,
+    ContentChanges,
+    ParallelArticle,
+    PublicationIndex,
+    ResponseMetadata,
+    SearchResponse,
+)
+from .parser import ArticleEndDetector, ArticleParser, QueryParser, SearchResponseParser
+from .resilience import CircuitBreakers, HedgeBudget, LatencyTracker, is_failure_status
+from .shared import SharedCacheStore, SharedTokenStore
+from .urls import article_language, canonical_article_url, localized_article_url
 
 logger = logging.getLogger(__name__)
 
+# Bytes still read after the article ends, so that short page tails finish
+# and the connection can be reused
+_TAIL_DRAIN_BYTES = 64 * 1024
+
+# Derived forms of a cached article computed from its content alone (unlike
+# rendered responses, which include fetch metadata)
+_CONTENT_DERIVED = ("json",)
+
 
 class JWOrgClient:
     """Client for interacting with JW.Org APIs."""
 
     def __init__(self) -> None:
         """Initialize the client."""
-        self._auth_manager = AuthManager()
-        self._cache = Cache(ttl_seconds=settings.cache_ttl_seconds)
+        shared_cache: SharedCacheStore | None = None
+        token_store: SharedTokenStore | None = None
+        if settings.shared_state_dir:
+            state_dir = Path(settings.shared_state_dir)
+            shared_cache = SharedCacheStore(state_dir / "cache.sqlite3")
+            token_store = SharedTokenStore(state_dir / "token.json")
+
+        # Circuit breakers of the search, token and article endpoints
+        self._breakers = CircuitBreakers(
+            failure_threshold=settings.circuit_failure_threshold,
+            reset_seconds=settings.circuit_reset_seconds,
+            failure_rate=settings.circuit_failure_rate,
+            window=settings.circuit_window,
+            slow_call_seconds=settings.circuit_slow_call_seconds,
+        )
+        self._latency = LatencyTracker()
+        self._hedge_budget = HedgeBudget(settings.hedge_budget)
+        self._hedges_sent = 0
+        self._hedges_won = 0
+        self._auth_manager = AuthManager(
+            token_store=token_store, breaker=self._breakers.get("token")
+        )
+        self._cache = Cache(
+            ttl_seconds=settings.cache_ttl_seconds,
+            shared=shared_cache,
+            stale_seconds=settings.cache_stale_seconds,
+            compression=settings.cache_compression,
+            compress_min_bytes=settings.cache_compress_min_bytes,
+            adaptive_ttl=(
+                AdaptiveTTL(settings.adaptive_ttl_min_seconds, settings.adaptive_ttl_max_seconds)
+                if settings.adaptive_ttl
+                else None
+            ),
+        )
+        self._snapshot_path: Path | None = None
+        if settings.cache_snapshot_path and shared_cache is None:
+            self._snapshot_path = Path(settings.cache_snapshot_path).expanduser()
+            self._cache.load_snapshot(self._snapshot_path)
+        # Failed article lookups (not found, unparseable), remembered with
+        # their error message so that repeats fail without a fetch
+        self._negative = Cache(ttl_seconds=settings.negative_ttl_not_found, tier="negative")
+        self._negative_hits = 0
         self._http_client: httpx.AsyncClient | None = None
+        # Parsed article bodies by content hash, so URLs serving the same
+        # article share its paragraphs for as long as a cache entry holds it
+        self._bodies: weakref.WeakValueDictionary[str, ArticleContent | PublicationIndex] = (
+            weakref.WeakValueDictionary()
+        )
+        self._shared_bodies = 0
+        self._pages_cut_short = 0
+        # Cache hits and misses by language code
+        self._language_stats: dict[str, dict[str, int]] = {}
+        # Refetched articles found unchanged or revised, and paragraphs that differed
+        self._revisions = {"unchanged": 0, "revised": 0, "paragraphs": 0}
+        self._render_hits = 0
+        self._render_misses = 0
+        self._render_seconds_saved = 0.0
 
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                timeout=settings.request_timeout,
+            self._http_client = create_http_client(
+                timeout=configured_timeout(),
                 limits=httpx.Limits(
                     max_connections=settings.connection_pool_size,
                     max_keepalive_connections=settings.connection_pool_size,
@@ -38,6 +127,178 @@ class JWOrgClient:
             )
         return self._http_client
 
+    async def _fetch(
+        self,
+        url: str,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+        article_page: bool = False,
+    ) -> httpx.Response:
+        """GET an upstream URL through the circuit breaker of its endpoint.
+
+        Transport errors, rate limiting, server errors and slow responses
+        count as failures of the endpoint.
+
+        Args:
+            url: URL to fetch
+            endpoint: Endpoint name, for its breaker and metrics
+            headers: Optional request headers
+            article_page: Whether the URL is a wol.jw.org page that only needs
+                to be read up to the end of its article (with
+                ``settings.stream_articles``)
+
+        Returns:
+            Response (not checked for an error status)
+
+        Raises:
+            CircuitOpenError: If the endpoint's breaker is open
+            ContentRetrievalError: If an article page is too large
+            httpx.HTTPError: If the request fails
+        """
+        breaker = self._breakers.get(endpoint)
+        breaker.check()
+        client = await self._get_http_client()
+        get: Callable[[str], Coroutine[Any, Any, httpx.Response]]
+        if article_page and settings.stream_articles:
+            get = functools.partial(self._get_article_page, client, headers=headers)
+        else:
+            get = functools.partial(client.get, headers=headers)
+        start = time.perf_counter()
+        with metrics.timer(
+            "jworg_upstream_duration_seconds",
+            "jworg_upstream_requests_total",
+            endpoint=endpoint,
+        ) as timer:
+            try:
+                response = await self._hedged_get(get, url, endpoint)
+            except httpx.TransportError:
+                breaker.record_failure()
+                raise
+            timer.status = str(response.status_code)
+        elapsed = time.perf_counter() - start
+        breaker.record_response(response.status_code, elapsed)
+        self._latency.record(endpoint, elapsed)
+        return response
+
+    async def _get_article_page(
+        self, client: httpx.AsyncClient, url: str, headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """GET a wol.jw.org page, reading it only up to the end of its article.
+
+        The page is parsed incrementally while it downloads; once
+        ``article#article`` is closed, at most a short tail is read further
+        before the download is abandoned.
+
+        Args:
+            client: HTTP client
+            url: Page URL
+            headers: Optional request headers
+
+        Returns:
+            Response holding the decoded page as far as it was read
+
+        Raises:
+            ContentRetrievalError: If the page exceeds ``settings.max_page_bytes``
+        """
+        limit = settings.max_page_bytes
+        async with client.stream("GET", url, headers=headers) as response:
+            if not response.is_success:
+                await response.aread()
+                return response
+            declared = response.headers.get("content-length", "")
+            if declared.isdigit() and int(declared) > limit:
+                raise ContentRetrievalError(f"Article page exceeds {limit} bytes: {url}")
+
+            detector = ArticleEndDetector(response.charset_encoding)
+            chunks: list[bytes] = []
+            size = 0
+            tail = 0
+            async for chunk in response.aiter_bytes():
+                if detector.done:
+                    tail += len(chunk)
+                    if tail > _TAIL_DRAIN_BYTES:
+                        self._pages_cut_short += 1
+                        break
+                    continue
+                size += len(chunk)
+                if size > limit:
+                    raise ContentRetrievalError(f"Article page exceeds {limit} bytes: {url}")
+                chunks.append(chunk)
+                detector.feed(chunk)
+        return decoded_response(response, b"".join(chunks), response.request)
+
+    async def _hedged_get(
+        self, get: Callable[[str], Coroutine[Any, Any, httpx.Response]], url: str, endpoint: str
+    ) -> httpx.Response:
+        """GET a URL, sending a second request if the first is slow.
+
+        With ``settings.hedge_requests``, a request that has not answered by
+        the endpoint's ``settings.hedge_quantile`` latency is hedged, within
+        the hedging budget, and the first successful response is kept.
+
+        Args:
+            get: Function sending a GET request for a URL
+            url: URL to fetch
+            endpoint: Endpoint name, for its latency history
+
+        Returns:
+            Response
+
+        Raises:
+            httpx.HTTPError: If every request sent fails
+        """
+        delay = None
+        if settings.hedge_requests:
+            self._hedge_budget.deposit()
+            delay = self._latency.quantile(endpoint, settings.hedge_quantile)
+        if delay is None:
+            return await get(url)
+
+        primary = asyncio.create_task(get(url))
+        hedge: asyncio.Task[httpx.Response] | None = None
+        try:
+            done, _ = await asyncio.wait(
+                {primary}, timeout=max(delay, settings.hedge_min_delay_seconds)
+            )
+            if done or not self._hedge_budget.withdraw():
+                return await primary
+
+            self._hedges_sent += 1
+            metrics.inc("jworg_hedged_requests_total", endpoint=endpoint)
+            hedge = asyncio.create_task(get(self._hedge_url(url)))
+            pending: set[asyncio.Task[httpx.Response]] = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._hedges_won += 1
+                            metrics.inc("jworg_hedges_won_total", endpoint=endpoint)
+                        return task.result()
+            # Both failed: report the first request's error
+            return await primary
+        finally:
+            for task in [primary] if hedge is None else [primary, hedge]:
+                if not task.cancel() and not task.cancelled():
+                    # Retrieve the loser's error so it is not logged as unhandled
+                    task.exception()
+
+    @staticmethod
+    def _hedge_url(url: str) -> str:
+        """Get the URL a hedged request is sent to.
+
+        Args:
+            url: URL of the first request
+
+        Returns:
+            The same URL on the alternate CDN host if one is configured and
+            the URL is on the CDN, otherwise the URL itself
+        """
+        alternate = settings.cdn_alternate_base_url
+        if alternate and url.startswith(settings.cdn_base_url):
+            return alternate.rstrip("/") + url[len(settings.cdn_base_url.rstrip("/")) :]
+        return url
+
     async def search(
         self,
         query: str,
@@ -61,15 +322,23 @@ class JWOrgClient:
         Raises:
             SearchError: If search fails
         """
+        with span("JWOrgClient.search", query=query, filter=filter_type, language=language):
+            return await self._search(query, filter_type, language, limit, offset)
+
+    async def _search(
+        self, query: str, filter_type: str, language: str, limit: int, offset: int
+    ) -> tuple[SearchResponse, ResponseMetadata]:
+        """Search JW.Org content (see search)."""
         # Parse query to extract meaningful search terms
-        search_terms = QueryParser.extract_search_terms(query)
+        cache_key_parts = self.search_cache_key(query, filter_type, language, offset)
+        search_terms = cache_key_parts[0]
 
         # Check cache
-        cache_key_parts = (search_terms, filter_type, language, offset)
         if settings.enable_cache:
             cached = self._cache.get(*cache_key_parts)
+            self._count_lookup(language, cached is not None)
             if cached is not None:
-                logger.info(f"Cache hit for search: {search_terms}")
+                logger.info("Cache hit for search: %s", search_terms)
                 response, metadata = cached
                 metadata.cache_hit = True
                 return response, metadata
@@ -88,19 +357,18 @@ class JWOrgClient:
             if offset > 0:
                 search_url += f"&offset={offset}"
 
-            logger.info(f"Searching: {search_url}")
+            logger.info("Searching: %s", search_url)
 
             # Make request
-            client = await self._get_http_client()
-            response = await client.get(search_url, headers=headers)
+            response = await self._fetch(search_url, "search", headers)
             response.raise_for_status()
 
-            data = response.json()
-
             # Parse results
-            results = SearchResponseParser.parse_search_results(
-                data, search_terms, filter_type
-            )
+            with metrics.timer("jworg_parse_duration_seconds", stage="search_results"):
+                data = response.json()
+                results = SearchResponseParser.parse_search_results(
+                    data, search_terms, filter_type
+                )
 
             # Get total count
             insight = data.get("insight", {})
@@ -129,21 +397,41 @@ class JWOrgClient:
                 cache_hit=False,
             )
 
-            # Cache result
-            if settings.enable_cache:
-                self._cache.set(*cache_key_parts, value=(search_response, metadata))
+            # Cache result; searches without results only briefly
+            if settings.enable_cache and results:
+                self._cache.set(
+                    *cache_key_parts,
+                    value=(search_response, metadata),
+                    content_hash=self._content_hash(search_response),
+                    content_class="search",
+                )
+            elif settings.enable_cache and settings.negative_ttl_empty_search > 0:
+                self._cache.set(
+                    *cache_key_parts,
+                    value=(search_response, metadata),
+                    ttl_seconds=settings.negative_ttl_empty_search,
+                )
 
             return search_response, metadata
 
+        except (CircuitOpenError, AuthenticationError) as e:
+            stale = self._stale(cache_key_parts, "search")
+            if stale is not None:
+                return stale
+            logger.warning("Search failed: %s", e)
+            raise SearchError(f"Search failed: {e}") from e
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error during search: {e}")
+            stale = self._stale(cache_key_parts, "search") if self._upstream_failed(e) else None
+            if stale is not None:
+                return stale
+            logger.error("HTTP error during search: %s", e)
             raise SearchError(f"Search failed: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error during search: {e}")
+            logger.error("Unexpected error during search: %s", e)
             raise SearchError(f"Unexpected error during search: {e}") from e
 
     async def get_article(
-        self, url: str
+        self, url: str, language: str | None = None
     ) -> tuple[ArticleContent | PublicationIndex, ResponseMetadata]:
         """Get article content from wol.jw.org.
 
@@ -151,65 +439,222 @@ class JWOrgClient:
         than a specific article, returns a PublicationIndex with links to
         individual articles.
 
+        URL variants of an article (query parameters, fragments, finder
+        links) are fetched and cached once, under the canonical URL.
+
         Args:
             url: Article URL or publication finder URL
+            language: Optional language code (E, S, ...) to get the article
+                in, instead of the language of the URL
 
         Returns:
             Tuple of (ArticleContent or PublicationIndex, ResponseMetadata)
 
         Raises:
-            ContentRetrievalError: If content retrieval fails
+            ContentRetrievalError: If content retrieval fails, or the article
+                cannot be requested in the language
         """
+        with span("JWOrgClient.get_article", url=url, language=language or ""):
+            return await self._get_article(url, language)
+
+    async def _get_article(
+        self, requested_url: str, language: str | None = None
+    ) -> tuple[ArticleContent | PublicationIndex, ResponseMetadata]:
+        """Get article content from wol.jw.org (see get_article)."""
+        try:
+            cache_key_parts = self.article_cache_key(requested_url, language)
+        except ValueError as e:
+            raise ContentRetrievalError(str(e)) from e
+        url = cache_key_parts[0]
+
         # Check cache
         if settings.enable_cache:
-            cached = self._cache.get(url, "article")
+            cached = self._cache.get(*cache_key_parts)
+            self._count_lookup(article_language(url) or "other", cached is not None)
             if cached is not None:
-                logger.info(f"Cache hit for article: {url}")
+                logger.info("Cache hit for article: %s", url)
                 content, metadata = cached
                 metadata.cache_hit = True
                 return content, metadata
+            failure = self._negative.get(*cache_key_parts)
+            if failure is not None:
+                logger.info("Negative cache hit for article: %s", url)
+                self._negative_hits += 1
+                raise ContentRetrievalError(failure)
 
         try:
-            logger.info(f"Fetching article: {url}")
+            logger.info("Fetching article: %s", url)
 
-            client = await self._get_http_client()
-            response = await client.get(url)
+            response = await self._fetch(url, "article", article_page=True)
             response.raise_for_status()
 
             # Parse article
-            article = ArticleParser.parse_article(response.text, url)
+            with (
+                span("ArticleParser.parse_article", url=url, bytes=len(response.content)),
+                metrics.timer("jworg_parse_duration_seconds", stage="article"),
+            ):
+                article = ArticleParser.parse_article(response.text, url)
+            content_hash = self._content_hash(article)
+            article = self._share_body(article, content_hash)
+
+            # Compare with the version cached before, if this is a refetch
+            previous = self._cache.peek(*cache_key_parts) if settings.enable_cache else None
+            previous_article = previous[0] if previous is not None else None
+            changes = None
+            if isinstance(article, ArticleContent) and isinstance(previous_article, ArticleContent):
+                changes = article.changes_since(previous_article)
+                self._count_revision(changes)
 
             metadata = ResponseMetadata(
                 source_domain="wol.jw.org",
                 source_url=url,
                 timestamp=datetime.now(UTC),
-                query_params={"url": url},
+                query_params=(
+                    {"url": requested_url, "language": language}
+                    if language
+                    else {"url": requested_url}
+                ),
                 cache_hit=False,
             )
 
             # Cache result
             if settings.enable_cache:
-                self._cache.set(url, "article", value=(article, metadata))
-
+                self._cache.set(
+                    *cache_key_parts,
+                    value=(article, metadata),
+                    content_hash=content_hash,
+                    content_class=(
+                        "article" if isinstance(article, ArticleContent) else "publication_index"
+                    ),
+                    # An unchanged body was shared with the previous version
+                    # (see _share_body), whose serialized forms still apply
+                    keep_derived=_CONTENT_DERIVED if previous_article is article else (),
+                )
+
+            # Changes are reported by this response only, not by later cache hits
+            if changes is not None:
+                metadata = metadata.model_copy(update={"changes": changes})
             return article, metadata
 
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error fetching article: {e}")
+        except CircuitOpenError as e:
+            stale = self._stale(cache_key_parts, "article")
+            if stale is not None:
+                return stale
+            logger.warning("Article fetch skipped: %s", e)
             raise ContentRetrievalError(f"Failed to fetch article: {e}") from e
+        except httpx.HTTPError as e:
+            stale = self._stale(cache_key_parts, "article") if self._upstream_failed(e) else None
+            if stale is not None:
+                return stale
+            logger.error("HTTP error fetching article: %s", e)
+            message = f"Failed to fetch article: {e}"
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 404:
+                self._remember_failure(cache_key_parts, message, settings.negative_ttl_not_found)
+            raise ContentRetrievalError(message) from e
+        except ParseError as e:
+            logger.error("Could not parse article %s: %s", url, e)
+            message = f"Unexpected error fetching article: {e}"
+            self._remember_failure(cache_key_parts, message, settings.negative_ttl_parse_error)
+            raise ContentRetrievalError(message) from e
+        except ContentRetrievalError:
+            raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching article: {e}")
+            logger.error("Unexpected error fetching article: %s", e)
             raise ContentRetrievalError(
                 f"Unexpected error fetching article: {e}"
             ) from e
 
+    async def get_parallel_article(
+        self, url: str, languages: list[str]
+    ) -> tuple[ParallelArticle, ResponseMetadata]:
+        """Get an article in several languages, with paragraphs aligned by data-pid.
+
+        A document keeps its id across translations, so each language is
+        fetched concurrently from the same URL with that language's codes,
+        and cached separately like any get_article call. Languages that
+        cannot be retrieved are reported in ``ParallelArticle.errors``.
+
+        Args:
+            url: Article URL, in any language
+            languages: Language codes (E, S, ...)
+
+        Returns:
+            Tuple of (ParallelArticle, ResponseMetadata)
+
+        Raises:
+            ContentRetrievalError: If a language is unknown, the URL is not
+                an article URL, or no language could be retrieved
+        """
+        codes = list(dict.fromkeys(language.upper() for language in languages))
+        if not codes:
+            raise ContentRetrievalError("At least one language is required")
+        for code in codes:
+            try:
+                self.article_cache_key(url, code)
+            except ValueError as e:
+                raise ContentRetrievalError(str(e)) from e
+
+        with span("JWOrgClient.get_parallel_article", url=url, languages=",".join(codes)):
+            results = await asyncio.gather(
+                *(self.get_article(url, code) for code in codes), return_exceptions=True
+            )
+
+        articles: dict[str, tuple[ArticleContent, ResponseMetadata]] = {}
+        errors: dict[str, str] = {}
+        for code, result in zip(codes, results, strict=True):
+            if isinstance(result, ContentRetrievalError):
+                errors[code] = str(result)
+            elif isinstance(result, BaseException):
+                raise result
+            elif isinstance(result[0], PublicationIndex):
+                errors[code] = "Not an article: the page is a publication index"
+            else:
+                articles[code] = (result[0], result[1])
+        if not articles:
+            raise ContentRetrievalError(
+                "Failed to fetch article in any language: "
+                + "; ".join(f"{code}: {error}" for code, error in errors.items())
+            )
+
+        texts = {
+            code: dict(zip(article.pids, article.paragraphs, strict=False))
+            for code, (article, _) in articles.items()
+        }
+        pids = sorted({pid for by_pid in texts.values() for pid in by_pid})
+        parallel = ParallelArticle(
+            languages=list(articles),
+            titles={code: article.title for code, (article, _) in articles.items()},
+            source_urls={code: metadata.source_url for code, (_, metadata) in articles.items()},
+            paragraphs=[
+                AlignedParagraph(
+                    pid=pid,
+                    texts={code: by_pid[pid] for code, by_pid in texts.items() if pid in by_pid},
+                )
+                for pid in pids
+            ],
+            errors=errors,
+        )
+
+        all_metadata = [metadata for _, metadata in articles.values()]
+        metadata = ResponseMetadata(
+            source_domain="wol.jw.org",
+            source_url=all_metadata[0].source_url,
+            timestamp=datetime.now(UTC),
+            query_params={"url": url, "languages": codes},
+            cache_hit=all(m.cache_hit for m in all_metadata),
+            stale=any(m.stale for m in all_metadata),
+        )
+        return parallel, metadata
+
     async def get_scripture(
-        self, reference: str, translation: str = "nwtsty"
+        self, reference: str, translation: str = "nwtsty", language: str = "E"
     ) -> tuple[dict[str, Any], ResponseMetadata]:
         """Get scripture content.
 
         Args:
             reference: Scripture reference (e.g., "John 3:16")
             translation: Bible translation code
+            language: Language code of the reference and text
 
         Returns:
             Tuple of (scripture data, ResponseMetadata)
@@ -218,7 +663,9 @@ class JWOrgClient:
             ContentRetrievalError: If content retrieval fails
         """
         # Search for the scripture reference
-        search_response, _ = await self.search(reference, filter_type="bible")
+        search_response, search_metadata = await self.search(
+            reference, filter_type="bible", language=language
+        )
 
         if not search_response.results:
             raise ContentRetrievalError(f"Scripture not found: {reference}")
@@ -236,26 +683,319 @@ class JWOrgClient:
             source_domain="jw.org",
             source_url=result.url,
             timestamp=datetime.now(UTC),
-            query_params={"reference": reference, "translation": translation},
+            query_params={
+                "reference": reference,
+                "translation": translation,
+                "language": language,
+            },
             cache_hit=False,
+            stale=search_metadata.stale,
+            circuit_state=search_metadata.circuit_state,
         )
 
         return scripture_data, metadata
 
+    @staticmethod
+    def _upstream_failed(error: httpx.HTTPError) -> bool:
+        """Check whether an HTTP error means upstream is failing.
+
+        Args:
+            error: Error of an upstream request
+
+        Returns:
+            True for transport errors and failure statuses, False for other
+            error statuses such as 404
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            return is_failure_status(error.response.status_code)
+        return True
+
+    def _stale(
+        self, cache_key_parts: tuple[Any, ...], endpoint: str
+    ) -> tuple[Any, ResponseMetadata] | None:
+        """Get an expired cached response to answer with while upstream fails.
+
+        Args:
+            cache_key_parts: Cache key of the response
+            endpoint: Upstream endpoint that failed
+
+        Returns:
+            Tuple of (cached value, metadata marked stale), or None if no
+            response is held
+        """
+        cached = self._cache.get_stale(*cache_key_parts) if settings.enable_cache else None
+        if cached is None:
+            return None
+        value, metadata = cached
+        state = self._breakers.get(endpoint).state
+        logger.warning("Serving stale %s response (circuit %s)", endpoint, state)
+        return value, metadata.model_copy(
+            update={"cache_hit": True, "stale": True, "circuit_state": state}
+        )
+
+    def _remember_failure(
+        self, cache_key_parts: tuple[str, str], message: str, ttl_seconds: int
+    ) -> None:
+        """Remember a failed article lookup in the negative cache.
+
+        Args:
+            cache_key_parts: Cache key of the article
+            message: Error message to fail repeats with
+            ttl_seconds: How long to remember the failure (0 = not at all)
+        """
+        if settings.enable_cache and ttl_seconds > 0:
+            self._negative.set(*cache_key_parts, value=message, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def search_cache_key(
+        query: str, filter_type: str = "all", language: str = "E", offset: int = 0
+    ) -> tuple[str, str, str, int]:
+        """Build the cache key used for a search.
+
+        Args:
+            query: Search query as given by the user
+            filter_type: Content filter
+            language: Language code
+            offset: Result offset
+
+        Returns:
+            Cache key components; the first is the extracted search terms
+        """
+        return (QueryParser.extract_search_terms(query, language), filter_type, language, offset)
+
+    @staticmethod
+    def _content_hash(content: ArticleContent | PublicationIndex | SearchResponse) -> str:
+        """Hash parsed content, leaving out the URL it was fetched from.
+
+        Args:
+            content: Parsed article, publication index or search response
+
+        Returns:
+            Hex digest
+        """
+        return hashlib.sha256(content.model_dump_json(exclude={"source_url"}).encode()).hexdigest()
+
+    def _share_body(
+        self, article: ArticleContent | PublicationIndex, digest: str
+    ) -> ArticleContent | PublicationIndex:
+        """Reuse an identical parsed body already held for another URL.
+
+        Args:
+            article: Freshly parsed article or publication index
+            digest: Content hash of the article (see _content_hash)
+
+        Returns:
+            The body already held with the same content, or the given one.
+            For another URL, a shallow copy with that URL's source_url,
+            sharing the paragraphs, sections and entries of the body held.
+        """
+        existing = self._bodies.get(digest)
+        if existing is not None and type(existing) is type(article):
+            # The same URL refetched unchanged is not sharing
+            if existing.source_url == article.source_url:
+                return existing
+            self._shared_bodies += 1
+            logger.debug("Article body shared with %s", existing.source_url)
+            return existing.model_copy(update={"source_url": article.source_url})
+        self._bodies[digest] = article
+        return article
+
+    @staticmethod
+    def article_cache_key(url: str, language: str | None = None) -> tuple[str, str]:
+        """Build the cache key used for an article.
+
+        Args:
+            url: Article URL, in any variant
+            language: Optional language code to get the article in
+
+        Returns:
+            Cache key components, starting with the canonical URL
+
+        Raises:
+            ValueError: If a language is given for a URL that is not an
+                article URL, or is unknown
+        """
+        if language:
+            return (localized_article_url(url, language), "article")
+        return (canonical_article_url(url), "article")
+
+    def _count_revision(self, changes: ContentChanges) -> None:
+        """Count a refetched article in the revision statistics.
+
+        Args:
+            changes: How the article differs from the version cached before
+        """
+        result = "unchanged" if changes.unchanged else "revised"
+        self._revisions[result] += 1
+        self._revisions["paragraphs"] += (
+            len(changes.changed) + len(changes.added) + len(changes.removed)
+        )
+        metrics.inc("jworg_article_revisions_total", result=result)
+        if not changes.unchanged:
+            logger.info(
+                "Article revised: %d paragraphs changed, %d added, %d removed",
+                len(changes.changed),
+                len(changes.added),
+                len(changes.removed),
+            )
+
+    @staticmethod
+    def _key_language(key: tuple[Any, ...]) -> str:
+        """Get the language of a search or article cache key.
+
+        Args:
+            key: Cache key components (see search_cache_key and article_cache_key)
+
+        Returns:
+            Language code, or "other" for articles of unknown language
+        """
+        if key[-1] == "article":
+            return article_language(key[0]) or "other"
+        return str(key[2])
+
+    def _count_lookup(self, language: str, hit: bool) -> None:
+        """Count a cache lookup in the statistics of its language.
+
+        Args:
+            language: Language code
+            hit: Whether the lookup was a hit
+        """
+        counts = self._language_stats.get(language)
+        if counts is None:
+            counts = self._language_stats[language] = {"hits": 0, "misses": 0}
+        counts["hits" if hit else "misses"] += 1
+
+    def get_serialized(
+        self, key: tuple[Any, ...], name: str, serialize: Callable[[], str]
+    ) -> str:
+        """Get a serialized form of a cached value, computing it at most once per entry.
+
+        Args:
+            key: Cache key components of the value
+            name: Name of the serialized form (e.g. "json")
+            serialize: Produces the serialized form on first use
+
+        Returns:
+            Serialized value
+        """
+        if settings.enable_cache:
+            cached = self._cache.get_derived(*key, name=name)
+            if cached is not None:
+                return str(cached)
+
+        serialized = serialize()
+        if settings.enable_cache:
+            self._cache.set_derived(*key, name=name, value=serialized, size=len(serialized))
+        return serialized
+
+    def get_rendered(self, key: tuple[Any, ...], options: str) -> TextContent | None:
+        """Get a rendered tool response stored alongside a cached value.
+
+        Args:
+            key: Cache key components of the underlying value
+            options: Name identifying the tool and its format options
+
+        Returns:
+            The previously rendered response, or None
+        """
+        if not settings.enable_cache:
+            return None
+
+        # A rendered response answers the call in place of the cached value
+        rendered = self._cache.get_derived(*key, name=options, count_hit=True)
+        if rendered is None:
+            self._render_misses += 1
+            metrics.inc("jworg_cache_requests_total", tier="rendered", result="miss")
+            return None
+        self._count_lookup(self._key_language(key), hit=True)
+
+        content, render_seconds = rendered
+        self._render_hits += 1
+        metrics.inc("jworg_cache_requests_total", tier="rendered", result="hit")
+        self._render_seconds_saved += render_seconds
+        return content  # type: ignore[no-any-return]
+
+    def store_rendered(
+        self,
+        key: tuple[Any, ...],
+        options: str,
+        content: TextContent,
+        render_seconds: float,
+        cache_hit: bool,
+    ) -> None:
+        """Store a rendered tool response alongside a cached value.
+
+        Only responses rendered from a cache hit are stored, so the stored text
+        reports the value as cached, as every later hit would.
+
+        Args:
+            key: Cache key components of the underlying value
+            options: Name identifying the tool and its format options
+            content: Rendered response
+            render_seconds: Time spent rendering, credited on every later hit
+            cache_hit: Whether the response was rendered from a cached value
+        """
+        if settings.enable_cache and cache_hit:
+            self._cache.set_derived(
+                *key, name=options, value=(content, render_seconds), size=len(content.text)
+            )
+
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
         Returns:
             Cache statistics
         """
-        return self._cache.get_stats()
+        stats = self._cache.get_stats()
+        stats["shared_bodies"] = self._shared_bodies
+        stats["pages_cut_short"] = self._pages_cut_short
+        stats["languages"] = {
+            language: dict(counts) for language, counts in sorted(self._language_stats.items())
+        }
+        stats["revisions"] = dict(self._revisions)
+        stats["negative_entries"] = self._negative.get_stats()["entries"]
+        stats["negative_hits"] = self._negative_hits
+        stats["circuit_breakers"] = self._breakers.get_stats()
+        stats["upstream_latency"] = self._latency.get_stats()
+        stats["hedged_requests"] = self._hedges_sent
+        stats["hedges_won"] = self._hedges_won
+        stats["rendered_hits"] = self._render_hits
+        stats["rendered_misses"] = self._render_misses
+        stats["render_time_saved_ms"] = round(self._render_seconds_saved * 1000, 3)
+        return stats
+
+    def maintain_cache(self, budget_seconds: float) -> int:
+        """Remove expired cache entries (see Cache.maintain).
+
+        Args:
+            budget_seconds: Time budget for the local sweep
+
+        Returns:
+            Number of entries removed
+        """
+        return self._cache.maintain(budget_seconds) + self._negative.sweep(budget_seconds)
 
     def clear_cache(self) -> None:
         """Clear the cache."""
         self._cache.clear()
+        self._negative.clear()
+        self._negative_hits = 0
+        self._shared_bodies = 0
+        self._pages_cut_short = 0
+        self._language_stats = {}
+        self._revisions = {"unchanged": 0, "revised": 0, "paragraphs": 0}
+        self._render_hits = 0
+        self._render_misses = 0
+        self._render_seconds_saved = 0.0
 
     async def close(self) -> None:
-        """Close all connections."""
+        """Close all connections and save the cache snapshot, if configured."""
+        if self._snapshot_path is not None:
+            try:
+                self._cache.save_snapshot(self._snapshot_path)
+            except OSError as e:
+                logger.warning("Could not save cache snapshot: %s", e)
+        self._cache.close()
         if self._http_client is not None:
             await self._http_client.aclose()
             self._http_client = None
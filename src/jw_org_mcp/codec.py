@@ -0,0 +1,148 @@
+"""Serialization of cached values to bytes for storage outside the process."""
+
+import json
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+import brotli  # type: ignore[import-untyped]
+from pydantic import BaseModel
+
+from .models import (
+    ArticleContent,
+    PublicationIndex,
+    ResponseMetadata,
+    ScriptureContent,
+    SearchResponse,
+)
+
+# Models that may appear in cached values, by class name
+_MODEL_TYPES: dict[str, type[BaseModel]] = {
+    model.__name__: model
+    for model in (
+        SearchResponse,
+        ArticleContent,
+        PublicationIndex,
+        ScriptureContent,
+        ResponseMetadata,
+    )
+}
+
+
+def encode_value(value: Any) -> bytes | None:
+    """Encode a cached value.
+
+    Supports a registered model or a tuple of registered models, which covers
+    every value JWOrgClient caches.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        Encoded bytes, or None if the value is not supported
+    """
+    items = value if isinstance(value, tuple) else (value,)
+    parts = []
+    for item in items:
+        name = type(item).__name__
+        if _MODEL_TYPES.get(name) is not type(item):
+            return None
+        parts.append(f'{{"t":"{name}","v":{item.model_dump_json()}}}')
+
+    kind = "tuple" if isinstance(value, tuple) else "model"
+    return f'{{"k":"{kind}","items":[{",".join(parts)}]}}'.encode()
+
+
+def decode_value(data: bytes) -> Any:
+    """Decode a value produced by encode_value.
+
+    Args:
+        data: Encoded bytes
+
+    Returns:
+        The decoded model or tuple of models
+
+    Raises:
+        ValueError: If the data is not a valid encoded value
+    """
+    try:
+        payload = json.loads(data)
+        items = [_MODEL_TYPES[item["t"]].model_validate(item["v"]) for item in payload["items"]]
+    except (KeyError, TypeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid encoded cache value: {e}") from e
+
+    if payload["k"] == "tuple":
+        return tuple(items)
+    return items[0]
+
+
+# Compressors and decompressors by algorithm name. The levels favour speed:
+# values are compressed on every cache write.
+_COMPRESSORS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "brotli": (lambda data: brotli.compress(data, quality=4), brotli.decompress),
+}
+
+
+class CompressedValue:
+    """An encoded value held compressed, decoded only when read."""
+
+    __slots__ = ("algorithm", "payload", "raw_size")
+
+    def __init__(self, algorithm: str, payload: bytes, raw_size: int) -> None:
+        """Initialize the compressed value.
+
+        Args:
+            algorithm: Compression algorithm
+            payload: Compressed encoded value
+            raw_size: Size of the encoded value before compression
+        """
+        self.algorithm = algorithm
+        self.payload = payload
+        self.raw_size = raw_size
+
+    def decode(self) -> Any:
+        """Decompress and decode the value.
+
+        Returns:
+            The decoded model or tuple of models
+        """
+        _, decompress = _COMPRESSORS[self.algorithm]
+        return decode_value(decompress(self.payload))
+
+
+class EncodedValue:
+    """An encoded value held as-is until first read.
+
+    Used for cache entries restored from a snapshot, so that loading does not
+    decode every value up front.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: bytes) -> None:
+        """Initialize the encoded value.
+
+        Args:
+            payload: Value produced by encode_value
+        """
+        self.payload = payload
+
+
+def compress_value(encoded: bytes, algorithm: str) -> CompressedValue:
+    """Compress a value produced by encode_value.
+
+    Args:
+        encoded: Encoded value
+        algorithm: "zlib" or "brotli"
+
+    Returns:
+        Compressed value
+
+    Raises:
+        ValueError: If the algorithm is unknown
+    """
+    if algorithm not in _COMPRESSORS:
+        raise ValueError(f"Unknown compression algorithm: {algorithm}")
+    compress, _ = _COMPRESSORS[algorithm]
+    return CompressedValue(algorithm, compress(encoded), len(encoded))
@@ -17,11 +17,52 @@ class Settings(BaseSettings):
     # Cache settings
     cache_ttl_seconds: int = 900  # 15 minutes
     enable_cache: bool = True
+    cache_compression: str = "off"  # off, zlib or brotli
+    cache_compress_min_bytes: int = 16384  # smaller values are held uncompressed
+    # Learn a TTL per cached value from how often its content changes on re-fetch
+    adaptive_ttl: bool = False
+    adaptive_ttl_min_seconds: int = 60
+    adaptive_ttl_max_seconds: int = 86400  # 1 day
+    # Negative caching: how long failed lookups are remembered (0 = not at all)
+    negative_ttl_not_found: int = 300  # articles answering HTTP 404
+    negative_ttl_parse_error: int = 600  # pages that cannot be parsed
+    negative_ttl_empty_search: int = 120  # searches without results
+    # How long expired values are kept to answer with while upstream fails
+    cache_stale_seconds: int = 3600
+    cache_sweep_interval: float = 5.0  # seconds between expiry sweeps, 0 = no sweeps
+    cache_sweep_budget_ms: float = 2.0  # time limit of each sweep
+    # File the cache is saved to on shutdown and restored from on startup;
+    # unused with a shared state directory, whose cache tier already persists
+    cache_snapshot_path: str = ""
 
     # Request settings
-    request_timeout: int = 30
+    request_timeout: int = 30  # default for phases without their own timeout
+    connect_timeout: float = 5.0  # establishing a connection
+    read_timeout: float = 15.0  # waiting for each chunk of a response
+    pool_timeout: float = 5.0  # waiting for a free pooled connection
     max_retries: int = 3
     retry_backoff_factor: float = 0.5
+    # Circuit breakers per upstream endpoint: an endpoint is not called for
+    # circuit_reset_seconds once at least circuit_failure_threshold of its
+    # last circuit_window calls failed or were slow, making up
+    # circuit_failure_rate of them
+    circuit_failure_threshold: int = 5
+    circuit_failure_rate: float = 0.5
+    circuit_window: int = 20
+    circuit_slow_call_seconds: float = 10.0
+    circuit_reset_seconds: float = 30.0
+    # Hedged GETs: a request that has not answered by the hedge_quantile
+    # latency of its endpoint is sent again, and whichever answers first is
+    # kept; hedge_budget limits hedges to that fraction of all requests
+    hedge_requests: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_delay_seconds: float = 0.05
+    hedge_budget: float = 0.1
+    cdn_alternate_base_url: str = ""  # hedged search requests go here, if set
+
+    # Download article pages incrementally and stop once the article ends
+    stream_articles: bool = True
+    max_page_bytes: int = 10 * 1024 * 1024  # larger article pages are rejected
 
     # Performance settings
     max_concurrent_requests: int = 100
@@ -32,6 +73,34 @@ class Settings(BaseSettings):
     default_search_limit: int = 10
     default_search_filter: str = "all"
 
+    # Response size settings
+    response_max_tokens: int = 8000  # 0 disables the budget
+    response_chars_per_token: int = 4
+
+    # Transport settings
+    transport: str = "stdio"  # stdio or http (streamable HTTP and SSE)
+    http_host: str = "127.0.0.1"
+    http_port: int = 8000
+    http_path: str = "/mcp"
+    http_stateless: bool = False
+    http_shutdown_timeout: int = 10
+    http_workers: int = 1  # >1 runs a supervisor with this many worker processes
+    http_reuse_port: bool = True  # Workers bind with SO_REUSEPORT where available
+
+    # Directory for state shared between worker processes (cache tier, JWT token);
+    # empty disables sharing. Multi-worker mode picks a temporary directory if unset.
+    shared_state_dir: str = ""
+
+    # HTTP cassette settings: "record" saves every jw.org exchange to cassette_path,
+    # "replay" answers requests from it without network access
+    cassette_mode: str = "off"  # off, record or replay
+    cassette_path: str = ""
+    cassette_latency_scale: float = 0.0  # Replay delay as a fraction of recorded latency
+
+    # Observability settings
+    metrics_enabled: bool = False  # Prometheus metrics at /metrics (HTTP transport)
+    tracing_enabled: bool = False  # OpenTelemetry spans (requires opentelemetry-api)
+
     # Logging
     log_level: str = "INFO"
 
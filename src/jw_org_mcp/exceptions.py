@@ -53,3 +53,9 @@ class NetworkError(JWOrgMCPError):
     """Raised when network operation fails."""
 
     pass
+
+
+class CircuitOpenError(NetworkError):
+    """Raised instead of calling an upstream host that keeps failing."""
+
+    pass
@@ -0,0 +1,781 @@
+"""Formatting of tool results into MCP text responses."""
+
+import json
+from itertools import zip_longest
+from typing import Any
+
+from .config import settings
+from .models import (
+    ArticleContent,
+    ParallelArticle,
+    PublicationIndex,
+    ResponseMetadata,
+    SearchResponse,
+)
+
+
+class TextBuilder:
+    """Collects text fragments and joins them once, within an optional size budget."""
+
+    def __init__(self, max_chars: int | None = None) -> None:
+        """Initialize the builder.
+
+        Args:
+            max_chars: Soft character budget, or None for unlimited
+        """
+        self._parts: list[str] = []
+        self._size = 0
+        self._max_chars = max_chars
+
+    @property
+    def size(self) -> int:
+        """Number of characters added so far."""
+        return self._size
+
+    def fits(self, text: str) -> bool:
+        """Check whether text can be added without exceeding the budget.
+
+        Args:
+            text: Fragment to check
+
+        Returns:
+            True if the fragment fits in the remaining budget
+        """
+        return self._max_chars is None or self._size + len(text) <= self._max_chars
+
+    def add(self, *texts: str) -> None:
+        """Append fragments unconditionally.
+
+        Args:
+            *texts: Fragments to append
+        """
+        for text in texts:
+            self._parts.append(text)
+            self._size += len(text)
+
+    def build(self) -> str:
+        """Join all fragments.
+
+        Returns:
+            The complete text
+        """
+        return "".join(self._parts)
+
+
+def budget_chars(max_tokens: int | None) -> int | None:
+    """Convert a token budget into an approximate character budget.
+
+    Args:
+        max_tokens: Token budget, or None/0 for unlimited
+
+    Returns:
+        Character budget, or None for unlimited
+    """
+    if not max_tokens or max_tokens <= 0:
+        return None
+    return max_tokens * settings.response_chars_per_token
+
+
+class _RawJSON(str):
+    """Already-serialized JSON, inserted as is by _json_object."""
+
+
+def _json_object(fields: dict[str, Any]) -> str:
+    """Serialize a dict as a compact JSON object.
+
+    Args:
+        fields: Values to serialize; _RawJSON values are inserted without re-serializing
+
+    Returns:
+        Compact JSON text
+    """
+    return (
+        "{"
+        + ",".join(
+            f"{_dumps(key)}:{value if isinstance(value, _RawJSON) else _dumps(value)}"
+            for key, value in fields.items()
+        )
+        + "}"
+    )
+
+
+def _json_array(items: list[str]) -> _RawJSON:
+    """Join serialized items into a JSON array.
+
+    Args:
+        items: Serialized JSON values
+
+    Returns:
+        The array, ready to insert with _json_object
+    """
+    return _RawJSON(f"[{','.join(items)}]")
+
+
+def _fit_items(costs: list[int], size: int, max_chars: int | None) -> int:
+    """Count how many array items fit the budget.
+
+    Args:
+        costs: Serialized length of each item, in order
+        size: Characters already used by the rest of the response
+        max_chars: Soft character budget
+
+    Returns:
+        Number of leading items that fit, and at least one if there are any
+    """
+    if max_chars is None:
+        return len(costs)
+    for count, cost in enumerate(costs):
+        size += cost + 1
+        if count and size > max_chars:
+            return count
+    return len(costs)
+
+
+def _paragraph_slice(total: int, start: int, end: int | None) -> tuple[int, int]:
+    """Normalize a 1-based inclusive paragraph range.
+
+    Args:
+        total: Number of paragraphs in the article
+        start: First paragraph requested (1-based)
+        end: Last paragraph requested (1-based, inclusive), or None for the end
+
+    Returns:
+        Tuple of (first, last) as a 0-based slice within the article; the
+        range is empty when they are equal, and is then reported as
+        ``start=first + 1``, ``end=first``
+    """
+    first = min(max(start, 1) - 1, total)
+    last = total if end is None else min(max(end, first), total)
+    return first, last
+
+
+def _empty_range_message(total: int) -> str:
+    return f"The requested range has no paragraphs (article has {total} paragraphs)."
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class ResponseFormatter:
+    """Renders models into markdown or JSON text for tool responses.
+
+    Budgets are soft: the first item of a listing is always included and
+    headers/footers are not counted against the remaining space.
+    """
+
+    @staticmethod
+    def _stale_notice(metadata: ResponseMetadata) -> str:
+        """Get the header line flagging a response served from an expired cache entry.
+
+        Args:
+            metadata: Response metadata
+
+        Returns:
+            Markdown line, or an empty string for fresh responses
+        """
+        if not metadata.stale:
+            return ""
+        return (
+            f"**Stale:** upstream unavailable (circuit {metadata.circuit_state}), "
+            "showing an expired cached copy\n"
+        )
+
+    @staticmethod
+    def _changes_notice(metadata: ResponseMetadata) -> str:
+        """Get the header line listing paragraphs revised since the last fetch.
+
+        Args:
+            metadata: Response metadata
+
+        Returns:
+            Markdown line, or an empty string if nothing changed
+        """
+        changes = metadata.changes
+        if changes is None or changes.unchanged:
+            return ""
+        parts = [
+            f"{label} {', '.join(map(str, pids))}"
+            for label, pids in (
+                ("changed", changes.changed),
+                ("added", changes.added),
+                ("removed", changes.removed),
+            )
+            if pids
+        ]
+        return f"**Revised Paragraphs:** {'; '.join(parts)}\n"
+
+    @staticmethod
+    def format_search(
+        response: SearchResponse,
+        metadata: ResponseMetadata,
+        *,
+        compact: bool = False,
+        max_chars: int | None = None,
+    ) -> str:
+        """Format search results.
+
+        Args:
+            response: Search response
+            metadata: Response metadata
+            compact: Omit metadata headers and decoration
+            max_chars: Soft character budget
+
+        Returns:
+            Markdown text
+        """
+        builder = TextBuilder(max_chars)
+        builder.add(f"# Search Results for '{response.query}'\n\n")
+        if not compact:
+            builder.add(
+                f"**Total Results:** {response.total}\n",
+                f"**Filter:** {response.filter}\n",
+                f"**Source:** {metadata.source_url}\n",
+                f"**Timestamp:** {metadata.timestamp.isoformat()}\n",
+                ResponseFormatter._stale_notice(metadata),
+                f"**Cached:** {metadata.cache_hit}\n\n",
+            )
+
+        if not response.results:
+            builder.add("No results found.\n")
+            return builder.build()
+
+        if not compact:
+            builder.add(
+                f"## Results (showing {len(response.results)} of {response.total})\n\n"
+            )
+
+        shown = 0
+        for i, result in enumerate(response.results, 1):
+            if compact:
+                source = f" ({result.context})" if result.context else ""
+                block = f"{i}. {result.title}{source}\n{result.snippet}\n{result.url}\n\n"
+            else:
+                context = f"**Source:** {result.context}\n\n" if result.context else ""
+                block = (
+                    f"### {i}. {result.title}\n\n{context}{result.snippet}\n\n"
+                    f"**URL:** {result.url}\n\n---\n\n"
+                )
+            if shown and not builder.fits(block):
+                break
+            builder.add(block)
+            shown += 1
+
+        if shown < len(response.results):
+            builder.add(
+                f"**Truncated:** {shown} of {len(response.results)} results fit the "
+                "response budget. Lower `limit` or raise `max_tokens` to see more.\n"
+            )
+
+        return builder.build()
+
+    @staticmethod
+    def format_article(
+        content: ArticleContent,
+        metadata: ResponseMetadata,
+        *,
+        start: int = 1,
+        end: int | None = None,
+        heading: str = "Content",
+        selector: str = "",
+        compact: bool = False,
+        max_chars: int | None = None,
+    ) -> str:
+        """Format an article, or a range of its paragraphs.
+
+        Args:
+            content: Parsed article
+            metadata: Response metadata
+            start: First paragraph to include (1-based)
+            end: Last paragraph to include (1-based, inclusive), or None for the end
+            heading: Heading shown above the paragraphs
+            selector: Arguments that selected the range, such as ``section="2"``,
+                repeated in the continuation hint
+            compact: Omit metadata headers and decoration
+            max_chars: Soft character budget
+
+        Returns:
+            Markdown text, ending with a continuation hint if truncated
+        """
+        total = len(content.paragraphs)
+        first, last = _paragraph_slice(total, start, end)
+
+        builder = TextBuilder(max_chars)
+        builder.add(f"# {content.title}\n\n")
+        if not compact:
+            builder.add(
+                f"**Source:** {metadata.source_url}\n",
+                f"**Timestamp:** {metadata.timestamp.isoformat()}\n",
+                ResponseFormatter._stale_notice(metadata),
+                ResponseFormatter._changes_notice(metadata),
+                f"**Cached:** {metadata.cache_hit}\n\n",
+                f"## {heading}\n\n",
+            )
+        elif heading != "Content":
+            builder.add(f"## {heading}\n\n")
+
+        if first == last:
+            builder.add(f"{_empty_range_message(total)}\n")
+            return builder.build()
+
+        shown = first
+        for para in content.paragraphs[first:last]:
+            block = f"{para}\n\n"
+            if shown > first and not builder.fits(block):
+                break
+            builder.add(block)
+            shown += 1
+
+        if shown < last:
+            arguments = f"{selector}, start={shown + 1}" if selector else f"start={shown + 1}"
+            if compact:
+                builder.add(
+                    f"[truncated: paragraphs {first + 1}-{shown} of {total}; "
+                    f"continue with {arguments}]\n"
+                )
+            else:
+                builder.add(
+                    f"**Truncated:** showing paragraphs {first + 1}-{shown} of {total}. "
+                    f"Call get_article with `{arguments}` to continue.\n"
+                )
+        elif shown == total and content.references:
+            if compact:
+                builder.add(f"References: {'; '.join(content.references)}\n")
+            else:
+                builder.add("## Scripture References\n\n")
+                builder.add(*(f"- {ref}\n" for ref in content.references))
+
+        return builder.build()
+
+    @staticmethod
+    def format_parallel_article(
+        content: ParallelArticle,
+        metadata: ResponseMetadata,
+        *,
+        start: int = 1,
+        compact: bool = False,
+        max_chars: int | None = None,
+    ) -> str:
+        """Format an article in several languages, paragraph by paragraph.
+
+        Args:
+            content: Article with aligned paragraphs
+            metadata: Response metadata
+            start: First aligned paragraph to include (1-based)
+            compact: Omit metadata headers and decoration
+            max_chars: Soft character budget
+
+        Returns:
+            Markdown text, ending with a continuation hint if truncated
+        """
+        total = len(content.paragraphs)
+        first = max(start, 1) - 1
+
+        builder = TextBuilder(max_chars)
+        builder.add(f"# {' / '.join(content.titles.values())}\n\n")
+        if not compact:
+            builder.add(
+                *(f"**Source ({code}):** {url}\n" for code, url in content.source_urls.items())
+            )
+            builder.add(
+                f"**Timestamp:** {metadata.timestamp.isoformat()}\n",
+                ResponseFormatter._stale_notice(metadata),
+                f"**Cached:** {metadata.cache_hit}\n",
+            )
+        builder.add(
+            *(f"**Unavailable ({code}):** {error}\n" for code, error in content.errors.items())
+        )
+        builder.add("\n")
+
+        if first >= total:
+            builder.add(f"No paragraphs from {first + 1} (article has {total} paragraphs).\n")
+            return builder.build()
+
+        shown = first
+        for paragraph in content.paragraphs[first:]:
+            lines = "".join(
+                f"[{code}] {paragraph.texts[code]}\n"
+                for code in content.languages
+                if code in paragraph.texts
+            )
+            block = f"¶{paragraph.pid}\n{lines}\n"
+            if shown > first and not builder.fits(block):
+                break
+            builder.add(block)
+            shown += 1
+
+        if shown < total:
+            if compact:
+                builder.add(
+                    f"[truncated: paragraphs {first + 1}-{shown} of {total}; "
+                    f"continue with start={shown + 1}]\n"
+                )
+            else:
+                builder.add(
+                    f"**Truncated:** showing paragraphs {first + 1}-{shown} of {total}. "
+                    f"Call get_parallel_article with `start={shown + 1}` to continue.\n"
+                )
+
+        return builder.build()
+
+    @staticmethod
+    def format_sections(content: ArticleContent, selector: str) -> str:
+        """Format the outline shown when a section selector does not match.
+
+        Args:
+            content: Parsed article
+            selector: The selector that was requested
+
+        Returns:
+            Markdown text listing the available sections
+        """
+        builder = TextBuilder()
+        builder.add(f"# {content.title}\n\n", f"No section matches '{selector}'.\n\n")
+        if not content.sections:
+            builder.add("This article has no subheadings.\n")
+            return builder.build()
+
+        builder.add("## Sections\n\n")
+        builder.add(
+            *(
+                f"{i}. {section.title} (paragraph {section.start + 1})\n"
+                for i, section in enumerate(content.sections, 1)
+            )
+        )
+        return builder.build()
+
+    @staticmethod
+    def format_publication_index(
+        content: PublicationIndex,
+        metadata: ResponseMetadata,
+        *,
+        start: int = 1,
+        compact: bool = False,
+        max_chars: int | None = None,
+    ) -> str:
+        """Format a publication index/table of contents.
+
+        Args:
+            content: Parsed publication index
+            metadata: Response metadata
+            start: First entry to include (1-based)
+            compact: Omit metadata headers and decoration
+            max_chars: Soft character budget
+
+        Returns:
+            Markdown text, ending with a continuation hint if truncated
+        """
+        total = len(content.articles)
+        first = min(max(start, 1) - 1, total)
+
+        builder = TextBuilder(max_chars)
+        builder.add(f"# {content.title}\n\n")
+        if not compact:
+            builder.add(
+                "**Note:** This URL points to a publication index, not a specific "
+                "article. Use one of the article URLs below with get_article to "
+                "retrieve the full content.\n\n",
+                f"**Source:** {metadata.source_url}\n",
+                ResponseFormatter._stale_notice(metadata),
+                f"**Timestamp:** {metadata.timestamp.isoformat()}\n\n",
+                "## Available Articles\n\n",
+            )
+
+        shown = first
+        for i, entry in enumerate(content.articles[first:], first + 1):
+            if compact:
+                block = f"{i}. {entry.title} {entry.url}\n"
+            else:
+                block = f"{i}. **{entry.title}**\n   URL: {entry.url}\n\n"
+            if shown > first and not builder.fits(block):
+                break
+            builder.add(block)
+            shown += 1
+
+        if shown < total:
+            builder.add(
+                f"**Truncated:** showing entries {first + 1}-{shown} of {total}. "
+                f"Call get_article with `start={shown + 1}` to continue.\n"
+            )
+
+        return builder.build()
+
+    @staticmethod
+    def format_scripture(
+        scripture: dict[str, Any], metadata: ResponseMetadata, *, compact: bool = False
+    ) -> str:
+        """Format a scripture passage.
+
+        Args:
+            scripture: Scripture data with reference and text
+            metadata: Response metadata
+            compact: Omit metadata footer
+
+        Returns:
+            Markdown text
+        """
+        builder = TextBuilder()
+        builder.add(f"# {scripture['reference']}\n\n", f"{scripture['text']}\n\n")
+        if not compact:
+            builder.add(
+                f"**Source:** {metadata.source_url}\n",
+                f"**Timestamp:** {metadata.timestamp.isoformat()}\n",
+                ResponseFormatter._stale_notice(metadata),
+            )
+        return builder.build()
+
+    @staticmethod
+    def format_cache_stats(stats: dict[str, Any]) -> str:
+        """Format cache statistics.
+
+        Args:
+            stats: Cache statistics
+
+        Returns:
+            Markdown text
+        """
+        builder = TextBuilder()
+        builder.add(
+            "# Cache Statistics\n\n",
+            f"**Entries:** {stats['entries']}\n",
+            f"**Hits:** {stats['hits']}\n",
+            f"**Misses:** {stats['misses']}\n",
+            f"**Hit Rate:** {stats['hit_rate']}%\n",
+        )
+        if "shared_bodies" in stats:
+            builder.add(f"**Shared Article Bodies:** {stats['shared_bodies']}\n")
+        if "rendered_hits" in stats:
+            builder.add(
+                f"**Rendered Hits:** {stats['rendered_hits']}\n",
+                f"**Formatting Time Saved:** {stats['render_time_saved_ms']} ms\n",
+            )
+        if "adaptive_ttl" in stats:
+            learned = stats["adaptive_ttl"]
+            builder.add(
+                f"**Learned TTLs:** {learned['keys']} keys, content unchanged "
+                f"{learned['unchanged']}x, changed {learned['changed']}x\n",
+            )
+            for content_class, counts in learned["distribution"].items():
+                ttls = ", ".join(f"{ttl}s: {count}" for ttl, count in counts.items())
+                builder.add(f"- {content_class}: {ttls}\n")
+        if "compression" in stats:
+            builder.add(
+                f"**Compressed Entries:** {stats['compressed_entries']} "
+                f"({stats['compression']}, ratio {stats['compression_ratio']}x)\n",
+                f"**Compression Time:** {stats['compress_ms']} ms\n",
+                f"**Decompression Time:** {stats['decompress_ms']} ms "
+                f"({stats['decompressions']} hits)\n",
+                f"**Large Derived Values Not Kept:** {stats['derived_skipped']}\n",
+            )
+        if "negative_hits" in stats:
+            builder.add(
+                f"**Remembered Failures:** {stats['negative_entries']} "
+                f"({stats['negative_hits']} hits)\n",
+            )
+        for language, counts in stats.get("languages", {}).items():
+            builder.add(
+                f"**Language {language}:** {counts['hits']} hits, {counts['misses']} misses\n",
+            )
+        revisions = stats.get("revisions", {})
+        if revisions.get("unchanged") or revisions.get("revised"):
+            builder.add(
+                f"**Refetched Articles:** {revisions['unchanged']} unchanged, "
+                f"{revisions['revised']} revised ({revisions['paragraphs']} paragraphs)\n",
+            )
+        if stats.get("stale_hits"):
+            builder.add(f"**Served Stale:** {stats['stale_hits']}\n")
+        for endpoint, breaker in stats.get("circuit_breakers", {}).items():
+            builder.add(
+                f"**Circuit {endpoint}:** {breaker['state']}, {breaker['failures']} of "
+                f"{breaker['calls']} recent calls failed, opened {breaker['opened']}x, "
+                f"{breaker['rejected']} rejected\n",
+            )
+        for endpoint, latency in stats.get("upstream_latency", {}).items():
+            if "p95_ms" in latency:
+                builder.add(
+                    f"**Latency {endpoint}:** p50 {latency['p50_ms']} ms, "
+                    f"p95 {latency['p95_ms']} ms\n",
+                )
+        if stats.get("hedged_requests"):
+            builder.add(
+                f"**Hedged Requests:** {stats['hedged_requests']} "
+                f"({stats['hedges_won']} answered first)\n",
+            )
+        return builder.build()
+
+    @staticmethod
+    def format_json(data_json: str, metadata: ResponseMetadata | None = None) -> str:
+        """Wrap pre-serialized data in the standard JSON response envelope.
+
+        Args:
+            data_json: Serialized response data
+            metadata: Response metadata, serialized on every call since it varies per hit
+
+        Returns:
+            Compact JSON text of the form {"data": ..., "metadata": ...}
+        """
+        metadata_json = metadata.model_dump_json() if metadata is not None else "null"
+        return f'{{"data":{data_json},"metadata":{metadata_json}}}'
+
+    @staticmethod
+    def publication_index_json(
+        content: PublicationIndex,
+        *,
+        start: int = 1,
+        max_chars: int | None = None,
+    ) -> str:
+        """Serialize a publication index for JSON output.
+
+        Entries are included while they fit the budget, like in
+        format_publication_index; ``next_start`` is where to continue, or null.
+
+        Args:
+            content: Parsed publication index
+            start: First entry to include (1-based)
+            max_chars: Soft character budget
+
+        Returns:
+            Compact JSON object
+        """
+        total = len(content.articles)
+        first = min(max(start, 1) - 1, total)
+        items = [entry.model_dump_json() for entry in content.articles[first:]]
+
+        data: dict[str, Any] = {
+            "title": content.title,
+            "articles": _RawJSON("[]"),
+            "source_url": content.source_url,
+            "start": first + 1,
+            "end": total,
+            "total": total,
+            "next_start": total,
+        }
+        shown = first + _fit_items([len(i) for i in items], len(_json_object(data)), max_chars)
+        data.update(
+            {
+                "articles": _json_array(items[: shown - first]),
+                "end": shown,
+                "next_start": shown + 1 if shown < total else None,
+            }
+        )
+        return _json_object(data)
+
+    @staticmethod
+    def parallel_article_json(
+        content: ParallelArticle,
+        *,
+        start: int = 1,
+        max_chars: int | None = None,
+    ) -> str:
+        """Serialize an article in several languages for JSON output.
+
+        Aligned paragraphs are included while they fit the budget, like in
+        format_parallel_article; ``next_start`` is where to continue, or null.
+
+        Args:
+            content: Article with aligned paragraphs
+            start: First aligned paragraph to include (1-based)
+            max_chars: Soft character budget
+
+        Returns:
+            Compact JSON object
+        """
+        total = len(content.paragraphs)
+        first = min(max(start, 1) - 1, total)
+        items = [p.model_dump_json() for p in content.paragraphs[first:]]
+
+        data: dict[str, Any] = {
+            "languages": content.languages,
+            "titles": content.titles,
+            "source_urls": content.source_urls,
+            "errors": content.errors,
+            "paragraphs": _RawJSON("[]"),
+            "start": first + 1,
+            "end": total,
+            "total": total,
+            "next_start": total,
+        }
+        shown = first + _fit_items([len(i) for i in items], len(_json_object(data)), max_chars)
+        data.update(
+            {
+                "paragraphs": _json_array(items[: shown - first]),
+                "end": shown,
+                "next_start": shown + 1 if shown < total else None,
+            }
+        )
+        return _json_object(data)
+
+    @staticmethod
+    def section_outline(content: ArticleContent) -> list[dict[str, Any]]:
+        """List the sections of an article for JSON output.
+
+        Args:
+            content: Parsed article
+
+        Returns:
+            Title and 1-based first paragraph of each section, matching the
+            numbering of the ``start``/``end`` tool arguments
+        """
+        return [{"title": s.title, "start": s.start + 1} for s in content.sections]
+
+    @staticmethod
+    def article_json(
+        content: ArticleContent,
+        *,
+        start: int = 1,
+        end: int | None = None,
+        max_chars: int | None = None,
+    ) -> str:
+        """Serialize an article, or a range of its paragraphs, for JSON output.
+
+        Paragraphs are included while they fit the budget, like in
+        format_article. Sections and ``start``/``end``/``total`` use 1-based
+        paragraph positions in the whole article; ``next_start`` is where to
+        continue a truncated range, or null. An empty range has ``end`` one
+        less than ``start`` and a ``message`` saying so, like format_article.
+
+        Args:
+            content: Parsed article
+            start: First paragraph to include (1-based)
+            end: Last paragraph to include (1-based, inclusive), or None for the end
+            max_chars: Soft character budget
+
+        Returns:
+            Compact JSON object
+        """
+        total = len(content.paragraphs)
+        first, last = _paragraph_slice(total, start, end)
+
+        # Each paragraph is serialized once: for measuring and for the output
+        items = [_dumps(p) for p in content.paragraphs[first:last]]
+        costs = [
+            len(item) + (len(str(pid)) + 1 if pid is not None else 0)
+            for item, pid in zip_longest(items, content.pids[first:last])
+        ]
+        sections = ResponseFormatter.section_outline(content)
+        data: dict[str, Any] = {
+            "title": content.title,
+            "paragraphs": _RawJSON("[]"),
+            "references": content.references,
+            "source_url": content.source_url,
+            "pids": [],
+            "sections": [s for s in sections if first < s["start"] <= last],
+            "start": first + 1,
+            "end": last,
+            "total": total,
+            "next_start": last,
+        }
+        shown = first + _fit_items(costs, len(_json_object(data)), max_chars)
+
+        data.update(
+            {
+                "paragraphs": _json_array(items[: shown - first]),
+                "pids": content.pids[first:shown],
+                "sections": [s for s in sections if first < s["start"] <= shown],
+                "end": shown,
+                "next_start": shown + 1 if shown < last else None,
+            }
+        )
+        if first == last:
+            data["message"] = _empty_range_message(total)
+        return _json_object(data)
@@ -0,0 +1,257 @@
+"""HTTP client construction, with cassette record/replay for offline runs.
+
+All HTTP clients (JWOrgClient and AuthManager) are created by
+``create_http_client``. With ``settings.cassette_mode`` set to "record", every
+exchange is also written to a gzip-compressed cassette file; with "replay",
+requests are answered from the cassette without network access, optionally
+with (a fraction of) the recorded latencies.
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import logging
+import os
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+# Response headers that no longer apply once the body is stored decoded
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CassetteMissError(httpx.TransportError):
+    """Raised in replay mode for a request that is not in the cassette."""
+
+
+class Cassette:
+    """Recorded HTTP exchanges, stored as gzip-compressed JSON."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cassette, loading any existing recording.
+
+        Args:
+            path: Cassette file
+        """
+        self.path = path
+        self.interactions: list[dict[str, Any]] = []
+        self._dirty = False
+        if path.exists():
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version in {path}")
+            self.interactions = data["interactions"]
+
+    def add(
+        self, request: httpx.Request, response: httpx.Response, body: bytes, elapsed: float
+    ) -> None:
+        """Record an exchange.
+
+        Args:
+            request: Request sent
+            response: Response received
+            body: Decoded response body
+            elapsed: Seconds from sending the request to reading the body
+        """
+        self.interactions.append(
+            {
+                "method": request.method,
+                "url": str(request.url),
+                "status": response.status_code,
+                "headers": [
+                    [name, value]
+                    for name, value in response.headers.multi_items()
+                    if name.lower() not in _DROPPED_HEADERS
+                ],
+                "body": base64.b64encode(body).decode("ascii"),
+                "elapsed": round(elapsed, 6),
+            }
+        )
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cassette if it has new exchanges."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with gzip.open(temp, "wt", encoding="utf-8") as f:
+            json.dump({"version": CASSETTE_VERSION, "interactions": self.interactions}, f)
+        temp.replace(self.path)
+        self._dirty = False
+        logger.info("Saved %d HTTP exchanges to %s", len(self.interactions), self.path)
+
+
+def decoded_response(
+    response: httpx.Response, body: bytes, request: httpx.Request | None = None
+) -> httpx.Response:
+    """Build a response holding an already decoded body.
+
+    Args:
+        response: Response the body was read from
+        body: Decoded (and possibly partial) body
+        request: Request to attach to the response, if any
+
+    Returns:
+        Response with the status, request and headers of the original, minus
+        the headers describing the encoded body
+    """
+    headers = [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name.lower() not in _DROPPED_HEADERS
+    ]
+    return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+
+# Cassettes by path, so every client of the process records into one file
+_cassettes: dict[Path, Cassette] = {}
+
+
+def get_cassette(path: str | Path) -> Cassette:
+    """Get the cassette for a path, loading it on first use.
+
+    Args:
+        path: Cassette file
+
+    Returns:
+        Shared Cassette instance
+    """
+    resolved = Path(path).expanduser().resolve()
+    if resolved not in _cassettes:
+        _cassettes[resolved] = Cassette(resolved)
+    return _cassettes[resolved]
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Transport recording every exchange of a wrapped transport."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, cassette: Cassette) -> None:
+        """Initialize the transport.
+
+        Args:
+            inner: Transport performing the requests
+            cassette: Cassette to record into
+        """
+        self._inner = inner
+        self._cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request and record the exchange."""
+        start = time.perf_counter()
+        response = await self._inner.handle_async_request(request)
+        try:
+            # Read through a Response to decode any content encoding
+            decoded = httpx.Response(
+                response.status_code, headers=response.headers, stream=response.stream
+            )
+            body = await decoded.aread()
+        finally:
+            await response.aclose()
+        self._cassette.add(request, response, body, time.perf_counter() - start)
+        return decoded_response(response, body)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport and save the cassette."""
+        await self._inner.aclose()
+        self._cassette.save()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Transport answering requests from a cassette.
+
+    Repeated requests for a URL get its recorded responses in order; once they
+    are used up, the last one is repeated.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 0.0) -> None:
+        """Initialize the transport.
+
+        Args:
+            cassette: Cassette to replay
+            latency_scale: Fraction of each recorded latency to wait before
+                responding (0 responds immediately, 1 reproduces the recording)
+        """
+        self._latency_scale = latency_scale
+        self._responses: dict[tuple[str, str], deque[dict[str, Any]]] = defaultdict(deque)
+        for interaction in cassette.interactions:
+            self._responses[(interaction["method"], interaction["url"])].append(interaction)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request from the cassette.
+
+        Raises:
+            CassetteMissError: If the request was not recorded
+        """
+        recorded = self._responses.get((request.method, str(request.url)))
+        if not recorded:
+            raise CassetteMissError(
+                f"No recorded response for {request.method} {request.url}", request=request
+            )
+        interaction = recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+        if self._latency_scale > 0:
+            await asyncio.sleep(interaction["elapsed"] * self._latency_scale)
+        return httpx.Response(
+            interaction["status"],
+            headers=[tuple(header) for header in interaction["headers"]],
+            content=base64.b64decode(interaction["body"]),
+        )
+
+
+def configured_timeout() -> httpx.Timeout:
+    """Get the request timeouts configured in settings.
+
+    Returns:
+        Timeout with the connect, read and pool phases set separately and
+        ``settings.request_timeout`` for writes
+    """
+    return httpx.Timeout(
+        settings.request_timeout,
+        connect=settings.connect_timeout,
+        read=settings.read_timeout,
+        pool=settings.pool_timeout,
+    )
+
+
+def create_http_client(
+    *,
+    limits: httpx.Limits = httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """Create an HTTP client, recording or replaying per ``settings.cassette_mode``.
+
+    Args:
+        limits: Connection pool limits (default: httpx's)
+        **kwargs: Other httpx.AsyncClient arguments
+
+    Returns:
+        HTTP client
+    """
+    mode = settings.cassette_mode
+    if mode == "off":
+        return httpx.AsyncClient(limits=limits, **kwargs)
+    if mode not in ("record", "replay"):
+        raise ValueError(f"Unknown cassette mode: {mode}")
+    if not settings.cassette_path:
+        raise ValueError("JWORG_MCP_CASSETTE_PATH must be set to record or replay")
+
+    cassette = get_cassette(settings.cassette_path)
+    transport: httpx.AsyncBaseTransport
+    if mode == "record":
+        inner = httpx.AsyncHTTPTransport(limits=limits)
+        transport = RecordingTransport(inner, cassette)
+    else:
+        transport = ReplayTransport(cassette, settings.cassette_latency_scale)
+    return httpx.AsyncClient(transport=transport, **kwargs)
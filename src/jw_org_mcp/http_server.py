@@ -0,0 +1,127 @@
+"""HTTP transports for serving many MCP clients from one long-lived process.
+
+Serves the MCP streamable HTTP transport (at ``settings.http_path``) and the
+legacy SSE transport (``/sse`` + ``/messages/``). All sessions share the
+server's JWOrgClient, and with it the cache, JWT token and connection pools.
+With ``settings.metrics_enabled``, Prometheus metrics are served at ``/metrics``.
+"""
+
+import contextlib
+import logging
+import os
+from collections.abc import AsyncIterator
+
+import uvicorn
+from mcp.server.sse import SseServerTransport
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import BaseRoute, Mount, Route
+from starlette.types import Receive, Scope, Send
+
+from .config import settings
+from .metrics import metrics
+from .server import app, cleanup, start_maintenance
+
+logger = logging.getLogger(__name__)
+
+
+class _StreamableHTTPEndpoint:
+    """ASGI endpoint delegating to the streamable HTTP session manager."""
+
+    def __init__(self, session_manager: StreamableHTTPSessionManager) -> None:
+        """Initialize the endpoint.
+
+        Args:
+            session_manager: Session manager handling MCP requests
+        """
+        self._session_manager = session_manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        await self._session_manager.handle_request(scope, receive, send)
+
+
+def create_http_app() -> Starlette:
+    """Create the ASGI application for the HTTP transports.
+
+    Returns:
+        Starlette application; its lifespan runs the session manager and the
+        cache maintenance task, and calls cleanup() on shutdown
+    """
+    session_manager = StreamableHTTPSessionManager(app=app, stateless=settings.http_stateless)
+    sse = SseServerTransport("/messages/")
+
+    async def handle_sse(request: Request) -> Response:
+        async with sse.connect_sse(
+            request.scope,
+            request.receive,
+            request._send,  # noqa: SLF001 - required by the SSE transport
+        ) as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+        return Response()
+
+    async def handle_health(request: Request) -> JSONResponse:
+        return JSONResponse({"status": "ok", "pid": os.getpid()})
+
+    async def handle_metrics(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(
+            metrics.render_prometheus(), media_type="text/plain; version=0.0.4"
+        )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            start_maintenance()
+            logger.info(
+                "Serving MCP over HTTP on %s:%s%s",
+                settings.http_host,
+                settings.http_port,
+                settings.http_path,
+            )
+            try:
+                yield
+            finally:
+                await cleanup()
+
+    routes: list[BaseRoute] = [
+        Route(settings.http_path, endpoint=_StreamableHTTPEndpoint(session_manager)),
+        Route("/health", endpoint=handle_health, methods=["GET"]),
+    ]
+    if settings.metrics_enabled:
+        # Metrics are per process; with several workers each scrape reaches one of them
+        routes.append(Route("/metrics", endpoint=handle_metrics, methods=["GET"]))
+    if settings.http_workers <= 1:
+        # SSE sessions live in process memory, so they need a single process
+        routes += [
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+        ]
+
+    return Starlette(routes=routes, lifespan=lifespan)
+
+
+def create_uvicorn_server() -> uvicorn.Server:
+    """Create the uvicorn server for the HTTP transports.
+
+    On SIGINT/SIGTERM uvicorn stops accepting connections, waits up to
+    ``settings.http_shutdown_timeout`` seconds for in-flight requests, and
+    then runs the application lifespan shutdown.
+
+    Returns:
+        Configured uvicorn server
+    """
+    config = uvicorn.Config(
+        create_http_app(),
+        host=settings.http_host,
+        port=settings.http_port,
+        log_level=settings.log_level.lower(),
+        timeout_graceful_shutdown=settings.http_shutdown_timeout,
+    )
+    return uvicorn.Server(config)
+
+
+async def serve_http() -> None:
+    """Serve the HTTP transports until shutdown."""
+    await create_uvicorn_server().serve()
@@ -0,0 +1,332 @@
+"""Metrics and tracing for JW.Org MCP Tool.
+
+Counters and latency histograms are kept in process memory and exposed in the
+Prometheus text format (served at ``/metrics`` by the HTTP transport). Spans
+are emitted through the OpenTelemetry API when tracing is enabled and the
+``opentelemetry-api`` package is installed.
+
+Both are disabled by default; disabled timers and spans are shared no-op
+objects, so instrumented code paths only pay for an attribute check.
+"""
+
+import bisect
+import contextlib
+import time
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Any
+
+from .config import settings
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric name -> help text, in exposition order
+METRIC_HELP: dict[str, str] = {
+    "jworg_tool_calls_total": "MCP tool calls by tool and outcome",
+    "jworg_tool_duration_seconds": "MCP tool call latency",
+    "jworg_upstream_requests_total": "Requests to jw.org endpoints by endpoint and status",
+    "jworg_upstream_duration_seconds": "Latency of requests to jw.org endpoints",
+    "jworg_hedged_requests_total": "Hedged second requests sent, by endpoint",
+    "jworg_hedges_won_total": "Hedged requests that answered first, by endpoint",
+    "jworg_parse_duration_seconds": "Time spent parsing upstream responses, by stage",
+    "jworg_cache_requests_total": "Cache lookups by tier and result",
+    "jworg_cache_expired_total": "Expired cache entries removed by maintenance, by tier",
+    "jworg_article_revisions_total": "Refetched articles by whether their paragraphs changed",
+    "jworg_circuit_opened_total": "Circuit breaker openings by upstream endpoint",
+    "jworg_circuit_rejected_total": "Upstream calls rejected by an open circuit breaker",
+    "jworg_auth_refresh_total": "JWT token refreshes by outcome",
+    "jworg_auth_refresh_duration_seconds": "JWT token refresh latency",
+}
+
+_LabelKey = tuple[tuple[str, str], ...]
+
+
+class _Histogram:
+    """Cumulative latency histogram for one label set."""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int) -> None:
+        """Initialize the histogram.
+
+        Args:
+            buckets: Number of finite buckets
+        """
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Timer:
+    """Context manager recording the duration and outcome of a block."""
+
+    __slots__ = ("_metrics", "_histogram", "_counter", "_labels", "_start", "status")
+
+    def __init__(
+        self, metrics: "Metrics", histogram: str, counter: str | None, labels: dict[str, str]
+    ) -> None:
+        """Initialize the timer.
+
+        Args:
+            metrics: Registry to record into
+            histogram: Histogram metric name
+            counter: Optional counter metric name, labelled with the status
+            labels: Labels for both metrics
+        """
+        self._metrics = metrics
+        self._histogram = histogram
+        self._counter = counter
+        self._labels = labels
+        self._start = 0.0
+        # Outcome label for the counter; "error" if the block raises
+        self.status = "ok"
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._metrics.observe(self._histogram, time.perf_counter() - self._start, **self._labels)
+        if self._counter is not None:
+            status = "error" if exc_type is not None else self.status
+            self._metrics.add(self._counter, {**self._labels, "status": status})
+
+
+class _NullTimer:
+    """No-op timer used while metrics are disabled."""
+
+    __slots__ = ("status",)
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self.status = "ok"
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """In-process registry of counters and histograms."""
+
+    def __init__(self, enabled: bool = False, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize the registry.
+
+        Args:
+            enabled: Record metrics; when False every operation is a no-op
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self.enabled = enabled
+        self._buckets = buckets
+        self._counters: dict[str, dict[_LabelKey, float]] = {}
+        self._histograms: dict[str, dict[_LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        """Increment a counter.
+
+        Args:
+            name: Metric name
+            amount: Amount to add
+            **labels: Metric labels
+        """
+        self.add(name, labels, amount)
+
+    def add(self, name: str, labels: dict[str, str], amount: float = 1) -> None:
+        """Increment a counter, with the labels given as a dict.
+
+        Args:
+            name: Metric name
+            labels: Metric labels
+            amount: Amount to add
+        """
+        if not self.enabled:
+            return
+        series = self._counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Record a duration in a histogram.
+
+        Args:
+            name: Metric name
+            seconds: Observed duration
+            **labels: Metric labels
+        """
+        if not self.enabled:
+            return
+        series = self._histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = _Histogram(len(self._buckets))
+        index = bisect.bisect_left(self._buckets, seconds)
+        if index < len(self._buckets):
+            histogram.counts[index] += 1
+        histogram.sum += seconds
+        histogram.count += 1
+
+    def timer(
+        self, histogram: str, counter: str | None = None, **labels: str
+    ) -> _Timer | _NullTimer:
+        """Time a block into a histogram, optionally counting its outcome.
+
+        The counter gets a ``status`` label: "error" if the block raises,
+        otherwise the timer's ``status`` attribute (default "ok").
+
+        Args:
+            histogram: Histogram metric name
+            counter: Optional counter metric name
+            **labels: Labels for both metrics
+
+        Returns:
+            Context manager
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, histogram, counter, labels)
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        """Get the value of a counter.
+
+        Args:
+            name: Metric name
+            **labels: Metric labels
+
+        Returns:
+            Counter value (0 if never incremented)
+        """
+        return self._counters.get(name, {}).get(tuple(sorted(labels.items())), 0)
+
+    def get_histogram_count(self, name: str, **labels: str) -> int:
+        """Get the number of observations in a histogram.
+
+        Args:
+            name: Metric name
+            **labels: Metric labels
+
+        Returns:
+            Observation count (0 if never observed)
+        """
+        histogram = self._histograms.get(name, {}).get(tuple(sorted(labels.items())))
+        return histogram.count if histogram is not None else 0
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        self._counters.clear()
+        self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        lines: list[str] = []
+        names = sorted(set(self._counters) | set(self._histograms), key=_metric_order)
+        for name in names:
+            if name in METRIC_HELP:
+                lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+            if name in self._counters:
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            else:
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(self._buckets, histogram.counts, strict=True):
+                        cumulative += count
+                        labels = _format_labels(key, le=_format_value(bound))
+                        lines.append(f"{name}_bucket{labels} {cumulative}")
+                    labels = _format_labels(key, le="+Inf")
+                    lines.append(f"{name}_bucket{labels} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum!r}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+_METRIC_ORDER = {name: index for index, name in enumerate(METRIC_HELP)}
+
+
+def _metric_order(name: str) -> tuple[int, str]:
+    """Sort key placing known metrics in METRIC_HELP order."""
+    return (_METRIC_ORDER.get(name, len(_METRIC_ORDER)), name)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: _LabelKey, **extra: str) -> str:
+    """Format a label set, e.g. ``{tool="search_content"}``."""
+    items = [*key, *extra.items()]
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in items) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value without a trailing ``.0`` for integers."""
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+metrics = Metrics(enabled=settings.metrics_enabled)
+
+
+# OpenTelemetry tracer, resolved on first use; False if unavailable
+_tracer: Any = None
+
+
+def _get_tracer() -> Any:
+    """Get the OpenTelemetry tracer, or False if opentelemetry is not installed."""
+    global _tracer
+    if _tracer is None:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            _tracer = False
+        else:
+            _tracer = trace.get_tracer("jw_org_mcp")
+    return _tracer
+
+
+@contextlib.contextmanager
+def _otel_span(tracer: Any, name: str, attributes: dict[str, Any]) -> Iterator[None]:
+    """Run a block inside an OpenTelemetry span."""
+    with tracer.start_as_current_span(name, attributes=attributes):
+        yield
+
+
+def span(name: str, **attributes: Any) -> contextlib.AbstractContextManager[Any]:
+    """Trace a block as an OpenTelemetry span.
+
+    Spans are only created when ``settings.tracing_enabled`` is set and the
+    ``opentelemetry-api`` package is installed; exporting them is left to the
+    OpenTelemetry SDK configured by the host application.
+
+    Args:
+        name: Span name
+        **attributes: Span attributes
+
+    Returns:
+        Context manager
+    """
+    if not settings.tracing_enabled:
+        return _NULL_TIMER
+    tracer = _get_tracer()
+    if not tracer:
+        return _NULL_TIMER
+    return _otel_span(tracer, name, attributes)
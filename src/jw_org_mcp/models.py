@@ -1,10 +1,38 @@
 """Data models for JW.Org MCP Tool."""
 
+import hashlib
 from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+# Per model, the fields set shared by the instances built by construct()
+_FIELDS_SETS: dict[type[BaseModel], set[str]] = {}
+
+
+def construct[M: BaseModel](model: type[M], **values: Any) -> M:
+    """Create a model instance from trusted values, skipping validation.
+
+    Used on the parsing hot path, where thousands of results are built from
+    values the parser has already typed. All instances of a model share one
+    fields set listing every field, which saves about 700 bytes per search
+    result. Pydantic never changes that set: assigning a field adds a name
+    already in it, and copies get a set of their own. Validation still
+    applies to models built from external input elsewhere.
+
+    Args:
+        model: Model class
+        **values: Field values of the correct types; omitted fields get
+            their defaults
+
+    Returns:
+        Model instance
+    """
+    fields_set = _FIELDS_SETS.get(model)
+    if fields_set is None:
+        fields_set = _FIELDS_SETS[model] = set(model.model_fields)
+    return model.model_construct(_fields_set=fields_set, **values)
+
 
 class SearchResult(BaseModel):
     """A single search result."""
@@ -30,6 +58,26 @@ class SearchResponse(BaseModel):
     query: str
 
 
+class ArticleSection(BaseModel):
+    """A subheading within an article."""
+
+    title: str
+    start: int  # Index into ArticleContent.paragraphs of the first paragraph under it
+
+
+class ContentChanges(BaseModel):
+    """Paragraphs of an article that differ from its previous version, by data-pid."""
+
+    changed: list[int] = Field(default_factory=list)
+    added: list[int] = Field(default_factory=list)
+    removed: list[int] = Field(default_factory=list)
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether no paragraph changed."""
+        return not (self.changed or self.added or self.removed)
+
+
 class ArticleContent(BaseModel):
     """Parsed article content."""
 
@@ -37,6 +85,88 @@ class ArticleContent(BaseModel):
     paragraphs: list[str]
     references: list[str] = Field(default_factory=list)
     source_url: str
+    pids: list[int] = Field(default_factory=list)  # data-pid of each paragraph
+    sections: list[ArticleSection] = Field(default_factory=list)
+
+    def pid_range(self, pid_start: int | None, pid_end: int | None) -> tuple[int, int]:
+        """Map a data-pid range onto paragraph positions.
+
+        Args:
+            pid_start: First data-pid to include, or None for the beginning
+            pid_end: Last data-pid to include, or None for the end
+
+        Returns:
+            Tuple of (start, end) as 1-based inclusive paragraph positions
+        """
+        positions = [
+            i
+            for i, pid in enumerate(self.pids, 1)
+            if (pid_start is None or pid >= pid_start) and (pid_end is None or pid <= pid_end)
+        ]
+        if not positions:
+            return len(self.paragraphs) + 1, len(self.paragraphs)
+        return positions[0], positions[-1]
+
+    def paragraph_hashes(self) -> dict[int, str]:
+        """Hash the text of each paragraph.
+
+        Returns:
+            Short content hash of each paragraph by data-pid (by 1-based
+            position for articles without data-pids)
+        """
+        pids = self.pids or range(1, len(self.paragraphs) + 1)
+        return {
+            pid: hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+            for pid, text in zip(pids, self.paragraphs, strict=False)
+        }
+
+    def changes_since(self, previous: "ArticleContent") -> ContentChanges:
+        """Compare the paragraphs of the article with a previous version.
+
+        Args:
+            previous: Earlier version of the article
+
+        Returns:
+            Paragraphs changed, added and removed, by data-pid
+        """
+        old = previous.paragraph_hashes()
+        new = self.paragraph_hashes()
+        return ContentChanges(
+            changed=[pid for pid, digest in new.items() if pid in old and old[pid] != digest],
+            added=[pid for pid in new if pid not in old],
+            removed=[pid for pid in old if pid not in new],
+        )
+
+    def find_section(self, selector: str) -> tuple[ArticleSection, int, int] | None:
+        """Find a section by 1-based number or case-insensitive heading text.
+
+        Args:
+            selector: Section number or part of its heading
+
+        Returns:
+            Tuple of (section, start, end) with 1-based inclusive paragraph
+            positions, or None if no section matches
+        """
+        selector = selector.strip()
+        index: int | None = None
+        if selector.isdigit():
+            number = int(selector)
+            if 1 <= number <= len(self.sections):
+                index = number - 1
+        else:
+            needle = selector.lower()
+            index = next(
+                (i for i, s in enumerate(self.sections) if needle in s.title.lower()), None
+            )
+        if index is None:
+            return None
+
+        section = self.sections[index]
+        if index + 1 < len(self.sections):
+            end = self.sections[index + 1].start
+        else:
+            end = len(self.paragraphs)
+        return section, section.start + 1, end
 
 
 class PublicationIndexEntry(BaseModel):
@@ -54,6 +184,23 @@ class PublicationIndex(BaseModel):
     source_url: str
 
 
+class AlignedParagraph(BaseModel):
+    """A paragraph of an article in several languages."""
+
+    pid: int  # data-pid shared by the translations
+    texts: dict[str, str]  # Text by language code; languages lacking the paragraph are omitted
+
+
+class ParallelArticle(BaseModel):
+    """An article in several languages, with paragraphs aligned by data-pid."""
+
+    languages: list[str]  # Languages retrieved, in the requested order
+    titles: dict[str, str]
+    source_urls: dict[str, str]
+    paragraphs: list[AlignedParagraph]
+    errors: dict[str, str] = Field(default_factory=dict)  # Languages that could not be retrieved
+
+
 class ScriptureContent(BaseModel):
     """Scripture content."""
 
@@ -71,6 +218,13 @@ class ResponseMetadata(BaseModel):
     timestamp: datetime
     query_params: dict[str, Any] = Field(default_factory=dict)
     cache_hit: bool = False
+    # Served from an expired cache entry because upstream failed, and the
+    # state of the upstream endpoint's circuit breaker at the time
+    stale: bool = False
+    circuit_state: str | None = None
+    # For the response that refetched an article, how its paragraphs differ
+    # from the version cached before; None otherwise, including on cache hits
+    changes: ContentChanges | None = None
 
 
 class MCPResponse(BaseModel):
@@ -1,13 +1,24 @@
 """Content parsers for JW.Org responses."""
 
+import functools
 import logging
 import re
+import sys
 from typing import Any
+from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
+from lxml import etree  # type: ignore[import-untyped]
 
 from .exceptions import ParseError
-from .models import ArticleContent, PublicationIndex, PublicationIndexEntry, SearchResult
+from .models import (
+    ArticleContent,
+    ArticleSection,
+    PublicationIndex,
+    PublicationIndexEntry,
+    SearchResult,
+    construct,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +26,7 @@ logger = logging.getLogger(__name__)
 class QueryParser:
     """Parses user queries to extract meaningful search terms."""
 
-    # Common question patterns to remove
+    # Common question patterns to remove (English)
     QUESTION_PATTERNS = [
         r"^what\s+(does|do|is|are)\s+the\s+bible\s+say\s+about\s+",
         r"^what\s+does\s+.*?\s+say\s+about\s+",
@@ -29,12 +40,112 @@ class QueryParser:
         r"^find\s+information\s+about\s+",
     ]
 
+    # Question patterns per language code; languages not listed use English
+    LANGUAGE_PATTERNS: dict[str, list[str]] = {
+        "E": QUESTION_PATTERNS,
+        "S": [
+            r"^[¿¡]\s*",
+            r"^qu[eé]\s+dice\s+la\s+biblia\s+(sobre|acerca\s+de|de)\s+",
+            r"^qu[eé]\s+dice\s+.*?\s+(sobre|acerca\s+de)\s+",
+            r"^c[oó]mo\s+(puedo|puede|podemos|se\s+puede)\s+",
+            r"^por\s+qu[eé]\s+",
+            r"^cu[aá]ndo\s+",
+            r"^d[oó]nde\s+",
+            r"^qui[eé]n(es)?\s+(es|son|era|eran|fue|fueron)\s+",
+            r"^h[aá]blame\s+(sobre|acerca\s+de|de)\s+",
+            r"^explica(me)?\s+",
+        ],
+        "X": [
+            r"^was\s+sagt\s+die\s+bibel\s+(über|zu|zum|zur)\s+",
+            r"^was\s+sagt\s+.*?\s+(über|zu)\s+",
+            r"^wie\s+(kann|können|sollte|sollten)\s+(ich|man|wir)\s+",
+            r"^warum\s+",
+            r"^wann\s+",
+            r"^wo\s+",
+            r"^wer\s+(ist|sind|war|waren)\s+",
+            r"^erzähle?\s+mir\s+(etwas\s+)?(über|von)\s+",
+            r"^erkläre?(\s+mir)?\s+",
+        ],
+        "T": [
+            r"^o\s+que\s+a\s+b[ií]blia\s+diz\s+(sobre|a\s+respeito\s+de)\s+",
+            r"^o\s+que\s+.*?\s+diz\s+(sobre|a\s+respeito\s+de)\s+",
+            r"^como\s+(posso|pode|podemos|devo)\s+",
+            r"^por\s+que\s+",
+            r"^quando\s+",
+            r"^onde\s+",
+            r"^quem\s+(é|são|foi|foram|era|eram)\s+",
+            r"^fale(-me)?\s+(sobre|de)\s+",
+            r"^explique(-me)?\s+",
+        ],
+        "I": [
+            r"^(che\s+)?cosa\s+dice\s+la\s+bibbia\s+(su|sul|sulla|riguardo\s+a)\s+",
+            r"^(che\s+)?cosa\s+dice\s+.*?\s+(su|riguardo\s+a)\s+",
+            r"^come\s+(posso|può|possiamo|si\s+può)\s+",
+            r"^perch[eé]\s+",
+            r"^quando\s+",
+            r"^dove\s+",
+            r"^chi\s+(è|sono|era|erano|fu)\s+",
+            r"^parlami\s+(di|del|della)\s+",
+            r"^spiega(mi)?\s+",
+        ],
+        "F": [
+            r"^que\s+dit\s+la\s+bible\s+(sur|au\s+sujet\s+de|à\s+propos\s+de)\s+",
+            r"^que\s+dit\s+.*?\s+(sur|au\s+sujet\s+de)\s+",
+            r"^comment\s+(puis-je|peut-on|pouvons-nous|faire\s+pour)\s+",
+            r"^pourquoi\s+",
+            r"^quand\s+",
+            r"^o[uù]\s+",
+            r"^qui\s+(est|sont|était|étaient)\s+",
+            r"^parle[sz]?-moi\s+(de|du|des)\s+",
+            r"^explique(z)?(-moi)?\s+",
+        ],
+    }
+
+    # For each language, the i-th regex is the alternation of patterns i..n-1,
+    # so one match finds the first pattern that applies and where to resume
+    _compiled: dict[str, list[re.Pattern[str]]] = {}
+
+    @classmethod
+    def _get_matchers(cls, language: str) -> list[re.Pattern[str]]:
+        """Get the precompiled matchers for a language.
+
+        Args:
+            language: Language code (E, S, F, ...)
+
+        Returns:
+            Suffix alternations of the language's question patterns
+        """
+        matchers = cls._compiled.get(language)
+        if matchers is None:
+            patterns = cls.LANGUAGE_PATTERNS.get(language, cls.QUESTION_PATTERNS)
+            groups = [f"(?P<p{i}>{p.removeprefix('^')})" for i, p in enumerate(patterns)]
+            matchers = [
+                re.compile("|".join(groups[start:]), re.IGNORECASE)
+                for start in range(len(groups))
+            ]
+            cls._compiled[language] = matchers
+        return matchers
+
     @classmethod
-    def extract_search_terms(cls, query: str) -> str:
+    def extract_search_terms(cls, query: str, language: str = "E") -> str:
         """Extract meaningful search terms from a natural language query.
 
         Args:
             query: User's natural language query
+            language: Language code selecting the question patterns
+
+        Returns:
+            Extracted search terms
+        """
+        return _extract_search_terms(query, language)
+
+    @classmethod
+    def _extract_uncached(cls, query: str, language: str) -> str:
+        """Extract search terms without memoization.
+
+        Args:
+            query: User's natural language query
+            language: Language code selecting the question patterns
 
         Returns:
             Extracted search terms
@@ -42,9 +153,15 @@ class QueryParser:
         # Clean the query
         cleaned = query.strip().lower()
 
-        # Remove question patterns
-        for pattern in cls.QUESTION_PATTERNS:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+        # Remove question patterns, each at most once and in order
+        matchers = cls._get_matchers(language)
+        start = 0
+        while start < len(matchers):
+            match = matchers[start].match(cleaned)
+            if match is None:
+                break
+            cleaned = cleaned[match.end() :]
+            start = int((match.lastgroup or "p0")[1:]) + 1
 
         # Remove trailing question marks and periods
         cleaned = cleaned.rstrip("?.!")
@@ -56,6 +173,12 @@ class QueryParser:
         return cleaned.strip()
 
 
+@functools.lru_cache(maxsize=1024)
+def _extract_search_terms(query: str, language: str) -> str:
+    """Memoized QueryParser extraction, keyed by raw query and language."""
+    return QueryParser._extract_uncached(query, language)
+
+
 class SearchResponseParser:
     """Parses search API responses."""
 
@@ -97,7 +220,7 @@ class SearchResponseParser:
             return results
 
         except Exception as e:
-            logger.error(f"Error parsing search results: {e}")
+            logger.error("Error parsing search results: %s", e)
             raise ParseError(f"Failed to parse search results: {e}") from e
 
     @staticmethod
@@ -111,35 +234,45 @@ class SearchResponseParser:
             SearchResult object or None if invalid
         """
         try:
-            # Extract basic fields
-            title = item.get("title", "")
-            snippet = item.get("snippet", "")
-            item_type = item.get("type", "item")
-            subtype = item.get("subtype", "")
+            # Extract basic fields. Results are built without pydantic
+            # validation, so every value is checked for its type here.
+            title = SearchResponseParser._str_field(item, "title", "")
+            snippet = SearchResponseParser._str_field(item, "snippet", "")
+            # Type names recur across results and cached pages; keep one copy
+            item_type = sys.intern(SearchResponseParser._str_field(item, "type", "item"))
+            subtype = sys.intern(SearchResponseParser._str_field(item, "subtype", ""))
 
             # Clean HTML from snippet
             snippet = SearchResponseParser._clean_html(snippet)
 
             # Extract URL (prefer wol link)
-            links = item.get("links", {})
+            links = item.get("links") or {}
             url = links.get("wol") or links.get("jw.org") or ""
+            if not isinstance(url, str):
+                raise TypeError(f"Invalid link: {url!r}")
 
             # Extract context and metadata
             context = item.get("context")
-            rank = item.get("insight", {}).get("rank")
+            if context is not None and not isinstance(context, str):
+                raise TypeError(f"Invalid context: {context!r}")
+            rank = (item.get("insight") or {}).get("rank")
+            if rank is not None and (isinstance(rank, bool) or not isinstance(rank, int)):
+                raise TypeError(f"Invalid rank: {rank!r}")
 
             # Try to extract publication and year from context
             publication = None
             year = None
             if context:
+                context = sys.intern(context)
                 year_match = re.search(r"\((\d{4})\)", context)
                 if year_match:
                     year = int(year_match.group(1))
-                    publication = context.replace(f"({year})", "").strip()
+                    publication = sys.intern(context.replace(f"({year})", "").strip())
                 else:
                     publication = context
 
-            return SearchResult(
+            return construct(
+                SearchResult,
                 title=title,
                 snippet=snippet,
                 url=url,
@@ -152,9 +285,31 @@ class SearchResponseParser:
             )
 
         except Exception as e:
-            logger.warning(f"Could not parse result item: {e}")
+            logger.warning("Could not parse result item: %s", e)
             return None
 
+    @staticmethod
+    def _str_field(item: dict[str, Any], key: str, default: str) -> str:
+        """Get a string field of a raw result item.
+
+        Args:
+            item: Raw result item
+            key: Field name
+            default: Value if the field is missing or null
+
+        Returns:
+            Field value
+
+        Raises:
+            TypeError: If the field is not a string
+        """
+        value = item.get(key)
+        if value is None:
+            return default
+        if not isinstance(value, str):
+            raise TypeError(f"Invalid {key}: {value!r}")
+        return value
+
     @staticmethod
     def _clean_html(text: str) -> str:
         """Remove HTML tags from text.
@@ -173,6 +328,73 @@ class SearchResponseParser:
         return soup.get_text(separator=" ", strip=True)
 
 
+class _ArticleEndTarget:
+    """lxml parser target tracking the nesting of ``article`` elements.
+
+    Using a target instead of the default tree builder, the parser keeps no
+    elements: it only reports tags as they are read.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the target."""
+        # Open article elements from article#article inward, 0 before it starts
+        self.depth = 0
+        self.done = False
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        """Handle an opening tag."""
+        if tag != "article" or self.done:
+            return
+        if self.depth or attrib.get("id") == "article":
+            self.depth += 1
+
+    def end(self, tag: str) -> None:
+        """Handle a closing tag."""
+        if tag == "article" and self.depth:
+            self.depth -= 1
+            self.done = self.depth == 0
+
+    def close(self) -> None:
+        """Finish parsing."""
+
+
+class ArticleEndDetector:
+    """Finds where the article container of a page being downloaded ends.
+
+    Chunks of a wol.jw.org page are fed to lxml's incremental HTML parser,
+    which reports once ``article#article`` is closed; the rest of the page
+    (footer, scripts) is not needed for parsing the article. No tree is
+    built, and the parser is released once the end has been seen.
+    """
+
+    def __init__(self, encoding: str | None = None) -> None:
+        """Initialize the detector.
+
+        Args:
+            encoding: Character encoding of the page, if known
+        """
+        self._target = _ArticleEndTarget()
+        self._parser: Any = etree.HTMLParser(target=self._target, encoding=encoding)
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Feed the next chunk of the page.
+
+        Args:
+            chunk: Page bytes
+
+        Returns:
+            True once the article container has been closed
+        """
+        if self.done:
+            return True
+        self._parser.feed(chunk)
+        if self._target.done:
+            self.done = True
+            self._parser = None
+        return self.done
+
+
 class ArticleParser:
     """Parses article content from wol.jw.org."""
 
@@ -207,13 +429,26 @@ class ArticleParser:
             title = title_elem.get_text(strip=True) if title_elem else "Untitled"
 
             # Extract paragraphs
-            paragraphs = []
-            references = []
+            paragraphs: list[str] = []
+            references: list[str] = []
+            pids: list[int] = []
+            sections: list[ArticleSection] = []
+
+            # Walk subheadings and paragraph elements with data-pid in document order
+            elements = article.find_all(["h2", "h3", "p"])
+
+            for para in elements:
+                if para.name != "p":
+                    heading = para.get_text(separator=" ", strip=True)
+                    if heading:
+                        sections.append(
+                            construct(ArticleSection, title=heading, start=len(paragraphs))
+                        )
+                    continue
 
-            # Find all paragraph elements with data-pid attribute
-            para_elements = article.find_all("p", {"data-pid": True})
+                if not para.has_attr("data-pid"):
+                    continue
 
-            for para in para_elements:
                 # Skip if paragraph has class indicating it's not content
                 class_attr = para.get("class")
                 classes = class_attr if isinstance(class_attr, list) else []
@@ -224,20 +459,25 @@ class ArticleParser:
                 text = para.get_text(separator=" ", strip=True)
                 if text:
                     paragraphs.append(text)
+                    pids.append(ArticleParser._parse_pid(para.get("data-pid"), len(pids) + 1))
 
                 # Extract scripture references
                 scripture_refs = para.find_all("a", {"class": "b"})
                 for ref in scripture_refs:
                     ref_text = ref.get_text(strip=True)
                     if ref_text:
-                        references.append(ref_text)
+                        # The same few references recur across cached articles
+                        references.append(sys.intern(ref_text))
 
             if paragraphs:
-                return ArticleContent(
+                return construct(
+                    ArticleContent,
                     title=title,
                     paragraphs=paragraphs,
                     references=list(set(references)),  # Remove duplicates
                     source_url=url,
+                    pids=pids,
+                    sections=sections,
                 )
 
             # No paragraphs found — try parsing as a publication index/TOC
@@ -250,9 +490,25 @@ class ArticleParser:
         except ParseError:
             raise
         except Exception as e:
-            logger.error(f"Error parsing article: {e}")
+            logger.error("Error parsing article: %s", e)
             raise ParseError(f"Failed to parse article: {e}") from e
 
+    @staticmethod
+    def _parse_pid(value: Any, fallback: int) -> int:
+        """Parse a data-pid attribute value.
+
+        Args:
+            value: Attribute value
+            fallback: Value to use if the attribute is not an integer
+
+        Returns:
+            Paragraph id
+        """
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return fallback
+
     @staticmethod
     def _try_parse_publication_index(
         soup: BeautifulSoup, url: str
@@ -285,8 +541,8 @@ class ArticleParser:
             if not href or not link_title:
                 continue
 
-            # Build full URL
-            full_url = f"https://wol.jw.org{href}" if href.startswith("/") else href
+            # Build full URL, on the host and in the language path of the page
+            full_url = urljoin(url, href)
 
             # Strip query parameters from the URL for deduplication and cleanliness
             clean_url = full_url.split("?")[0]
@@ -295,7 +551,7 @@ class ArticleParser:
                 continue
             seen_urls.add(clean_url)
 
-            entries.append(PublicationIndexEntry(title=link_title, url=clean_url))
+            entries.append(construct(PublicationIndexEntry, title=link_title, url=clean_url))
 
         if not entries:
             return None
@@ -304,7 +560,8 @@ class ArticleParser:
         h1 = soup.find("h1")
         pub_title = h1.get_text(strip=True) if h1 else "Publication Index"
 
-        return PublicationIndex(
+        return construct(
+            PublicationIndex,
             title=pub_title,
             articles=entries,
             source_url=url,
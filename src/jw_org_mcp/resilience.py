@@ -0,0 +1,321 @@
+"""Protection against failing and slow upstream endpoints."""
+
+import logging
+import time
+from collections import deque
+from typing import Any
+
+from .exceptions import CircuitOpenError
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def is_failure_status(status_code: int) -> bool:
+    """Check whether an HTTP status shows the upstream endpoint is failing.
+
+    Rate limiting and server errors are failures; any other response,
+    including client errors such as 404, shows the endpoint is serving.
+
+    Args:
+        status_code: HTTP status of a response
+
+    Returns:
+        True for failure statuses
+    """
+    return status_code == 429 or status_code >= 500
+
+
+class CircuitBreaker:
+    """Fails calls fast while an upstream endpoint is failing or slow.
+
+    The outcomes of the last ``window`` calls are kept; calls that fail or
+    take ``slow_call_seconds`` or longer count as failures. The breaker opens
+    once at least ``failure_threshold`` of them failed and they make up
+    ``failure_rate`` of the window, and rejects calls for ``reset_seconds``.
+
+    It then turns half-open and lets a single probe call through: a success
+    closes it, a failure opens it again. Further calls are rejected while
+    the probe is in flight.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        slow_call_seconds: float = 10.0,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            name: Name of the protected endpoint, for messages and statistics
+            failure_threshold: Failures in the window needed to open the breaker
+            reset_seconds: How long the breaker stays open before probing
+            failure_rate: Fraction of failures in the window that opens the breaker
+            window: Number of recent calls considered
+            slow_call_seconds: Duration from which a successful call counts
+                as a failure
+        """
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._failure_rate = failure_rate
+        self._slow_call_seconds = slow_call_seconds
+        # True for each failed call
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._open = False
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+        self._opened = 0
+        self._rejected = 0
+        self._slow_calls = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        if not self._open:
+            return "closed"
+        if self._probe_started is None and time.monotonic() < self._opened_at + self._reset_seconds:
+            return "open"
+        return "half_open"
+
+    def check(self) -> None:
+        """Check that a call may be made.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a
+                probe in flight
+        """
+        if not self._open:
+            return
+        now = time.monotonic()
+        if self._probe_started is None:
+            remaining = self._opened_at + self._reset_seconds - now
+            if remaining <= 0:
+                self._probe_started = now
+                logger.info("%s: probing for recovery", self.name)
+                return
+            message = f"{self.name} is failing; not retrying for another {remaining:.0f}s"
+        elif now - self._probe_started >= self._reset_seconds:
+            # The probe never reported back; send another
+            self._probe_started = now
+            return
+        else:
+            message = f"{self.name} is failing; waiting for a recovery probe"
+        self._rejected += 1
+        metrics.inc("jworg_circuit_rejected_total", endpoint=self.name)
+        raise CircuitOpenError(message)
+
+    def record_success(self, elapsed: float = 0.0) -> None:
+        """Record a successful call.
+
+        Args:
+            elapsed: Duration of the call in seconds
+        """
+        if elapsed >= self._slow_call_seconds:
+            self._slow_calls += 1
+            self._record(failed=True)
+            return
+        if self._open:
+            logger.info("%s recovered", self.name)
+            self._open = False
+            self._probe_started = None
+            self._outcomes.clear()
+        self._outcomes.append(False)
+
+    def record_response(self, status_code: int, elapsed: float) -> None:
+        """Record an HTTP call by its response status (see is_failure_status).
+
+        Args:
+            status_code: HTTP status of the response
+            elapsed: Duration of the call in seconds
+        """
+        if is_failure_status(status_code):
+            self.record_failure()
+        else:
+            self.record_success(elapsed)
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        self._record(failed=True)
+
+    def _record(self, failed: bool) -> None:
+        """Add a call outcome, opening the breaker when warranted.
+
+        Args:
+            failed: Whether the call failed
+        """
+        if self._open:
+            # A failed probe (or a call started before the breaker opened)
+            self._trip()
+            return
+        self._outcomes.append(failed)
+        failures = sum(self._outcomes)
+        if failures >= self._failure_threshold and failures >= self._failure_rate * len(
+            self._outcomes
+        ):
+            self._trip()
+
+    def _trip(self) -> None:
+        """Open the breaker, starting a new cooldown."""
+        if not self._open:
+            self._opened += 1
+            metrics.inc("jworg_circuit_opened_total", endpoint=self.name)
+            logger.warning(
+                "%s failed %d of the last %d calls; failing fast for %ss",
+                self.name,
+                sum(self._outcomes),
+                len(self._outcomes),
+                self._reset_seconds,
+            )
+        self._open = True
+        self._opened_at = time.monotonic()
+        self._probe_started = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get breaker statistics.
+
+        Returns:
+            Dictionary with the state, failures and calls in the window, and
+            how often the breaker opened, rejected calls and saw slow calls
+        """
+        return {
+            "state": self.state,
+            "failures": sum(self._outcomes),
+            "calls": len(self._outcomes),
+            "opened": self._opened,
+            "rejected": self._rejected,
+            "slow_calls": self._slow_calls,
+        }
+
+
+class CircuitBreakers:
+    """Circuit breakers by upstream endpoint, created on first use."""
+
+    def __init__(self, **options: Any) -> None:
+        """Initialize the registry.
+
+        Args:
+            **options: CircuitBreaker arguments for every breaker
+        """
+        self._options = options
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Get the breaker for an endpoint.
+
+        Args:
+            endpoint: Upstream endpoint name
+
+        Returns:
+            The endpoint's breaker
+        """
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(endpoint, **self._options)
+        return breaker
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get statistics of every breaker.
+
+        Returns:
+            Breaker statistics by endpoint
+        """
+        return {name: breaker.get_stats() for name, breaker in sorted(self._breakers.items())}
+
+
+class LatencyTracker:
+    """Recent upstream latencies by endpoint, for hedging thresholds."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window: Latencies kept per endpoint
+            min_samples: Latencies needed before quantiles are reported
+        """
+        self._window = window
+        self._min_samples = min_samples
+        self._latencies: dict[str, deque[float]] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a call.
+
+        Args:
+            endpoint: Upstream endpoint name
+            seconds: Duration of the call
+        """
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self._window)
+        latencies.append(seconds)
+
+    def quantile(self, endpoint: str, q: float) -> float | None:
+        """Get a latency quantile of an endpoint's recent calls.
+
+        Args:
+            endpoint: Upstream endpoint name
+            q: Quantile between 0 and 1
+
+        Returns:
+            Latency in seconds, or None with too few recorded calls
+        """
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies) < self._min_samples:
+            return None
+        ordered = sorted(latencies)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get latency statistics.
+
+        Returns:
+            Per endpoint the number of recorded calls and, once there are
+            enough, the median and 95th percentile in milliseconds
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for endpoint, latencies in sorted(self._latencies.items()):
+            entry: dict[str, Any] = {"samples": len(latencies)}
+            for name, q in (("p50_ms", 0.5), ("p95_ms", 0.95)):
+                value = self.quantile(endpoint, q)
+                if value is not None:
+                    entry[name] = round(value * 1000, 1)
+            stats[endpoint] = entry
+        return stats
+
+
+class HedgeBudget:
+    """Token bucket limiting hedged requests to a fraction of all requests.
+
+    Every request deposits ``ratio`` tokens, up to ``burst``; every hedge
+    withdraws one.
+    """
+
+    def __init__(self, ratio: float, burst: float = 10.0) -> None:
+        """Initialize the budget.
+
+        Args:
+            ratio: Hedges allowed per request
+            burst: Most hedges that can be saved up
+        """
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = 0.0
+
+    def deposit(self) -> None:
+        """Credit the budget for a request."""
+        self._tokens = min(self._tokens + self._ratio, self._burst)
+
+    def withdraw(self) -> bool:
+        """Spend the budget on a hedge.
+
+        Returns:
+            True if the hedge may be sent
+        """
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
@@ -1,29 +1,71 @@
 """MCP server implementation for JW.Org."""
 
+import asyncio
+import contextlib
+import json
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 
-from .client import JWOrgClient
 from .config import settings
-from .exceptions import JWOrgMCPError
-from .models import PublicationIndex
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+from .exceptions import ContentRetrievalError, JWOrgMCPError
+from .formatter import ResponseFormatter, budget_chars
+from .metrics import metrics, span
+from .models import (
+    ArticleContent,
+    ArticleSection,
+    PublicationIndex,
+    ResponseMetadata,
+    ScriptureContent,
+    SearchResponse,
 )
 
+if TYPE_CHECKING:
+    from .client import JWOrgClient
+
 logger = logging.getLogger(__name__)
 
 # Create MCP server
 app = Server("jw-org-mcp")
 
-# Create client instance
-client = JWOrgClient()
+# Client instance, created on the first tool call so that the HTTP client,
+# parser and BeautifulSoup/lxml are not imported during server startup
+_client: "JWOrgClient | None" = None
+
+# Background task removing expired cache entries, see start_maintenance()
+_maintenance_task: "asyncio.Task[None] | None" = None
+
+
+def configure_logging() -> None:
+    """Configure logging for the server process."""
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+def get_client() -> "JWOrgClient":
+    """Get the shared client, creating it on first use.
+
+    Returns:
+        The JWOrgClient instance
+    """
+    global _client
+    if _client is None:
+        from .client import JWOrgClient
+
+        _client = JWOrgClient()
+    return _client
+
+
+def __getattr__(name: str) -> Any:
+    """Keep ``server.client`` available as a lazily created attribute (PEP 562)."""
+    if name == "client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @app.list_tools()  # type: ignore[misc, no-untyped-call]
@@ -66,6 +108,28 @@ async def list_tools() -> list[Tool]:
                         "minimum": 1,
                         "maximum": 50,
                     },
+                    "compact": {
+                        "type": "boolean",
+                        "description": "Omit metadata headers to save tokens",
+                        "default": False,
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": (
+                            "Output format: markdown text, or compact JSON with "
+                            "'data' and 'metadata' keys"
+                        ),
+                        "enum": ["markdown", "json"],
+                        "default": "markdown",
+                    },
+                    "max_tokens": {
+                        "type": "integer",
+                        "description": (
+                            "Approximate response size budget in tokens "
+                            "(0 disables the budget)"
+                        ),
+                        "minimum": 0,
+                    },
                 },
                 "required": ["query"],
             },
@@ -73,8 +137,10 @@ async def list_tools() -> list[Tool]:
         Tool(
             name="get_article",
             description=(
-                "Retrieve full article content from a JW.Org URL. "
-                "Returns the article text with paragraphs and scripture references."
+                "Retrieve article content from a JW.Org URL. "
+                "Returns the article text with paragraphs and scripture references. "
+                "Long articles are returned in chunks; follow the continuation hint "
+                "to read the rest."
             ),
             inputSchema={
                 "type": "object",
@@ -83,10 +149,126 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "The article URL from wol.jw.org",
                     },
+                    "language": {
+                        "type": "string",
+                        "description": (
+                            "Language code to get the article in (E=English, "
+                            "S=Spanish, F=French, X=German, T=Portuguese, I=Italian); "
+                            "default: the language of the URL"
+                        ),
+                    },
+                    "start": {
+                        "type": "integer",
+                        "description": (
+                            "First paragraph to return (1-based). Use the value from "
+                            "a truncated response to continue reading."
+                        ),
+                        "default": 1,
+                        "minimum": 1,
+                    },
+                    "end": {
+                        "type": "integer",
+                        "description": "Last paragraph to return (1-based, inclusive)",
+                        "minimum": 1,
+                    },
+                    "pid_start": {
+                        "type": "integer",
+                        "description": "First paragraph to return, by its data-pid",
+                    },
+                    "pid_end": {
+                        "type": "integer",
+                        "description": "Last paragraph to return, by its data-pid",
+                    },
+                    "section": {
+                        "type": "string",
+                        "description": (
+                            "Return only the section under a subheading, selected by "
+                            "number (1-based) or by part of the heading text"
+                        ),
+                    },
+                    "compact": {
+                        "type": "boolean",
+                        "description": "Omit metadata headers to save tokens",
+                        "default": False,
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": (
+                            "Output format: markdown text, or compact JSON with "
+                            "'data' and 'metadata' keys"
+                        ),
+                        "enum": ["markdown", "json"],
+                        "default": "markdown",
+                    },
+                    "max_tokens": {
+                        "type": "integer",
+                        "description": (
+                            "Approximate response size budget in tokens "
+                            "(0 disables the budget)"
+                        ),
+                        "minimum": 0,
+                    },
                 },
                 "required": ["url"],
             },
         ),
+        Tool(
+            name="get_parallel_article",
+            description=(
+                "Retrieve an article in several languages side by side. "
+                "Paragraphs are aligned across the translations by their data-pid."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "url": {
+                        "type": "string",
+                        "description": "The article URL from wol.jw.org, in any language",
+                    },
+                    "languages": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            "Language codes to get the article in (E=English, S=Spanish, "
+                            "F=French, X=German, T=Portuguese, I=Italian)"
+                        ),
+                        "minItems": 1,
+                    },
+                    "start": {
+                        "type": "integer",
+                        "description": (
+                            "First aligned paragraph to return (1-based). Use the value "
+                            "from a truncated response to continue reading."
+                        ),
+                        "default": 1,
+                        "minimum": 1,
+                    },
+                    "compact": {
+                        "type": "boolean",
+                        "description": "Omit metadata headers to save tokens",
+                        "default": False,
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": (
+                            "Output format: markdown text, or compact JSON with "
+                            "'data' and 'metadata' keys"
+                        ),
+                        "enum": ["markdown", "json"],
+                        "default": "markdown",
+                    },
+                    "max_tokens": {
+                        "type": "integer",
+                        "description": (
+                            "Approximate response size budget in tokens "
+                            "(0 disables the budget)"
+                        ),
+                        "minimum": 0,
+                    },
+                },
+                "required": ["url", "languages"],
+            },
+        ),
         Tool(
             name="get_scripture",
             description=(
@@ -105,6 +287,25 @@ async def list_tools() -> list[Tool]:
                         "description": "Bible translation code",
                         "default": "nwtsty",
                     },
+                    "language": {
+                        "type": "string",
+                        "description": "Language code of the reference (E=English, S=Spanish, etc)",
+                        "default": "E",
+                    },
+                    "compact": {
+                        "type": "boolean",
+                        "description": "Omit metadata headers to save tokens",
+                        "default": False,
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": (
+                            "Output format: markdown text, or compact JSON with "
+                            "'data' and 'metadata' keys"
+                        ),
+                        "enum": ["markdown", "json"],
+                        "default": "markdown",
+                    },
                 },
                 "required": ["reference"],
             },
@@ -114,57 +315,139 @@ async def list_tools() -> list[Tool]:
             description="Get cache statistics including hit rate and entry count.",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "description": (
+                            "Output format: markdown text, or compact JSON with "
+                            "'data' and 'metadata' keys"
+                        ),
+                        "enum": ["markdown", "json"],
+                        "default": "markdown",
+                    },
+                },
             },
         ),
     ]
 
 
+# Tool names used as metric labels; anything else is labelled "unknown"
+_TOOL_NAMES = frozenset(
+    {
+        "search_content",
+        "get_article",
+        "get_parallel_article",
+        "get_scripture",
+        "get_cache_stats",
+    }
+)
+
+
 @app.call_tool()  # type: ignore[misc]
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls."""
-    try:
-        if name == "search_content":
-            return await _handle_search(arguments)
-        elif name == "get_article":
-            return await _handle_get_article(arguments)
-        elif name == "get_scripture":
-            return await _handle_get_scripture(arguments)
-        elif name == "get_cache_stats":
-            return await _handle_cache_stats()
-        else:
+    tool = name if name in _TOOL_NAMES else "unknown"
+    with (
+        span("mcp.call_tool", tool=tool),
+        metrics.timer("jworg_tool_duration_seconds", "jworg_tool_calls_total", tool=tool) as timer,
+    ):
+        try:
+            if name == "search_content":
+                return await _handle_search(arguments)
+            elif name == "get_article":
+                return await _handle_get_article(arguments)
+            elif name == "get_parallel_article":
+                return await _handle_get_parallel_article(arguments)
+            elif name == "get_scripture":
+                return await _handle_get_scripture(arguments)
+            elif name == "get_cache_stats":
+                return await _handle_cache_stats(arguments or {})
+            else:
+                timer.status = "error"
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"Unknown tool: {name}",
+                    )
+                ]
+        except JWOrgMCPError as e:
+            timer.status = "error"
+            logger.error("Tool error: %s", e)
             return [
                 TextContent(
                     type="text",
-                    text=f"Unknown tool: {name}",
+                    text=f"Error: {str(e)}",
                 )
             ]
-    except JWOrgMCPError as e:
-        logger.error(f"Tool error: {e}")
-        return [
-            TextContent(
-                type="text",
-                text=f"Error: {str(e)}",
-            )
-        ]
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
-        return [
-            TextContent(
-                type="text",
-                text=f"Unexpected error: {str(e)}",
-            )
-        ]
+        except Exception as e:
+            timer.status = "error"
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Unexpected error: {str(e)}",
+                )
+            ]
+
+
+# Arguments that change the rendered output of a cached model, with their defaults
+_RENDER_ARGUMENTS: dict[str, dict[str, Any]] = {
+    "search_content": {"limit": 10, "compact": False, "format": "markdown", "max_tokens": None},
+    "get_article": {
+        "start": 1,
+        "end": None,
+        "pid_start": None,
+        "pid_end": None,
+        "section": None,
+        "compact": False,
+        "format": "markdown",
+        "max_tokens": None,
+    },
+}
+
+
+# get_article arguments that select a paragraph range, kept when continuing
+_RANGE_ARGUMENTS = ("section", "pid_start", "pid_end", "end")
+
+
+def _render_options(tool: str, arguments: dict[str, Any]) -> str:
+    """Build the rendered-output cache name for a tool call.
+
+    Args:
+        tool: Tool name
+        arguments: Tool arguments
+
+    Returns:
+        Name identifying the tool and its normalized format options
+    """
+    options = {
+        name: arguments.get(name, default) for name, default in _RENDER_ARGUMENTS[tool].items()
+    }
+    if options["max_tokens"] is None:
+        options["max_tokens"] = settings.response_max_tokens
+    return f"render:{tool}:{json.dumps(options, sort_keys=True, default=str)}"
+
+
+def _wants_json(arguments: dict[str, Any]) -> bool:
+    """Check whether structured JSON output was requested."""
+    return bool(arguments.get("format", "markdown") == "json")
 
 
 async def _handle_search(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle search_content tool call."""
+    client = get_client()
     query = arguments.get("query", "")
     filter_type = arguments.get("filter", "all")
-    language = arguments.get("language", "E")
+    language = arguments.get("language", settings.default_language)
     limit = arguments.get("limit", 10)
 
-    logger.info(f"Searching: query={query}, filter={filter_type}, language={language}")
+    cache_key = client.search_cache_key(query, filter_type, language)
+    render_options = _render_options("search_content", arguments)
+    rendered = client.get_rendered(cache_key, render_options)
+    if rendered is not None:
+        return [rendered]
+
+    logger.info("Searching: query=%s, filter=%s, language=%s", query, filter_type, language)
 
     response, metadata = await client.search(
         query=query,
@@ -173,102 +456,273 @@ async def _handle_search(arguments: dict[str, Any]) -> list[TextContent]:
         limit=limit,
     )
 
-    # Format results
-    result_text = f"# Search Results for '{response.query}'\n\n"
-    result_text += f"**Total Results:** {response.total}\n"
-    result_text += f"**Filter:** {response.filter}\n"
-    result_text += f"**Source:** {metadata.source_url}\n"
-    result_text += f"**Timestamp:** {metadata.timestamp.isoformat()}\n"
-    result_text += f"**Cached:** {metadata.cache_hit}\n\n"
+    render_start = time.perf_counter()
+    result = TextContent(
+        type="text", text=_render_search(response, metadata, arguments, cache_key)
+    )
+    client.store_rendered(
+        cache_key,
+        render_options,
+        result,
+        time.perf_counter() - render_start,
+        cache_hit=metadata.cache_hit,
+    )
 
-    if not response.results:
-        result_text += "No results found.\n"
-    else:
-        result_text += f"## Results (showing {len(response.results)} of {response.total})\n\n"
-        for i, result in enumerate(response.results, 1):
-            result_text += f"### {i}. {result.title}\n\n"
-            if result.context:
-                result_text += f"**Source:** {result.context}\n\n"
-            result_text += f"{result.snippet}\n\n"
-            result_text += f"**URL:** {result.url}\n\n"
-            result_text += "---\n\n"
+    return [result]
+
+
+def _render_search(
+    response: SearchResponse,
+    metadata: ResponseMetadata,
+    arguments: dict[str, Any],
+    cache_key: tuple[Any, ...],
+) -> str:
+    """Render search results in the requested format."""
+    if _wants_json(arguments):
+        data_json = get_client().get_serialized(cache_key, "json", response.model_dump_json)
+        return ResponseFormatter.format_json(data_json, metadata)
+
+    return ResponseFormatter.format_search(
+        response,
+        metadata,
+        compact=arguments.get("compact", False),
+        max_chars=budget_chars(arguments.get("max_tokens", settings.response_max_tokens)),
+    )
 
-    return [TextContent(type="text", text=result_text)]
+
+def _resolve_article_range(
+    content: ArticleContent, arguments: dict[str, Any]
+) -> tuple[int, int | None, ArticleSection | None] | None:
+    """Resolve the paragraph range requested for an article.
+
+    Args:
+        content: Parsed article
+        arguments: Tool arguments
+
+    Returns:
+        Tuple of (start, end, section) with 1-based inclusive positions, or
+        None if the requested section does not exist
+    """
+    start = arguments.get("start", 1)
+    end = arguments.get("end")
+    section = arguments.get("section")
+
+    if section is not None:
+        found = content.find_section(str(section))
+        if found is None:
+            return None
+        matched, range_start, end = found
+        # A continuation start from a truncated response wins over the range start
+        return max(start, range_start), end, matched
+
+    if "pid_start" in arguments or "pid_end" in arguments:
+        range_start, end = content.pid_range(arguments.get("pid_start"), arguments.get("pid_end"))
+        return max(start, range_start), end, None
+
+    return start, end, None
 
 
 async def _handle_get_article(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle get_article tool call."""
+    client = get_client()
     url = arguments.get("url", "")
+    language = arguments.get("language")
+
+    try:
+        cache_key = client.article_cache_key(url, language)
+    except ValueError as e:
+        raise ContentRetrievalError(str(e)) from e
+    render_options = _render_options("get_article", arguments)
+    rendered = client.get_rendered(cache_key, render_options)
+    if rendered is not None:
+        return [rendered]
 
-    logger.info(f"Fetching article: {url}")
+    logger.info("Fetching article: %s", url)
 
-    content, metadata = await client.get_article(url)
+    content, metadata = await client.get_article(url, language)
+
+    render_start = time.perf_counter()
+    result = TextContent(
+        type="text", text=_render_article(content, metadata, arguments, cache_key)
+    )
+    client.store_rendered(
+        cache_key,
+        render_options,
+        result,
+        time.perf_counter() - render_start,
+        cache_hit=metadata.cache_hit,
+    )
+
+    return [result]
+
+
+def _render_article(
+    content: ArticleContent | PublicationIndex,
+    metadata: ResponseMetadata,
+    arguments: dict[str, Any],
+    cache_key: tuple[Any, ...],
+) -> str:
+    """Render an article or publication index in the requested format."""
+    start = arguments.get("start", 1)
+    compact = arguments.get("compact", False)
+    max_chars = budget_chars(arguments.get("max_tokens", settings.response_max_tokens))
+    as_json = _wants_json(arguments)
 
     if isinstance(content, PublicationIndex):
-        # Format publication index/table of contents
-        result_text = f"# {content.title}\n\n"
-        result_text += (
-            "**Note:** This URL points to a publication index, not a specific "
-            "article. Use one of the article URLs below with get_article to "
-            "retrieve the full content.\n\n"
+        if as_json:
+            if start <= 1:
+                full_json = get_client().get_serialized(
+                    cache_key, "json", lambda: ResponseFormatter.publication_index_json(content)
+                )
+                if max_chars is None or len(full_json) <= max_chars:
+                    return ResponseFormatter.format_json(full_json, metadata)
+            data_json = ResponseFormatter.publication_index_json(
+                content, start=start, max_chars=max_chars
+            )
+            return ResponseFormatter.format_json(data_json, metadata)
+        return ResponseFormatter.format_publication_index(
+            content, metadata, start=start, compact=compact, max_chars=max_chars
         )
-        result_text += f"**Source:** {metadata.source_url}\n"
-        result_text += f"**Timestamp:** {metadata.timestamp.isoformat()}\n\n"
-        result_text += "## Available Articles\n\n"
-        for i, entry in enumerate(content.articles, 1):
-            result_text += f"{i}. **{entry.title}**\n"
-            result_text += f"   URL: {entry.url}\n\n"
-    else:
-        # Format article
-        result_text = f"# {content.title}\n\n"
-        result_text += f"**Source:** {metadata.source_url}\n"
-        result_text += f"**Timestamp:** {metadata.timestamp.isoformat()}\n"
-        result_text += f"**Cached:** {metadata.cache_hit}\n\n"
 
-        result_text += "## Content\n\n"
-        for para in content.paragraphs:
-            result_text += f"{para}\n\n"
+    resolved = _resolve_article_range(content, arguments)
+    if resolved is None:
+        section = str(arguments.get("section"))
+        if as_json:
+            error = {
+                "error": f"No section matches '{section}'",
+                "sections": ResponseFormatter.section_outline(content),
+            }
+            return ResponseFormatter.format_json(
+                json.dumps(error, separators=(",", ":")), metadata
+            )
+        return ResponseFormatter.format_sections(content, section)
+
+    start, end, matched = resolved
+    if as_json:
+        if start <= 1 and end is None:
+            # The whole article is serialized once per cache entry
+            full_json = get_client().get_serialized(
+                cache_key, "json", lambda: ResponseFormatter.article_json(content)
+            )
+            if max_chars is None or len(full_json) <= max_chars:
+                return ResponseFormatter.format_json(full_json, metadata)
+        data_json = ResponseFormatter.article_json(
+            content, start=start, end=end, max_chars=max_chars
+        )
+        return ResponseFormatter.format_json(data_json, metadata)
+
+    return ResponseFormatter.format_article(
+        content,
+        metadata,
+        start=start,
+        end=end,
+        heading=matched.title if matched is not None else "Content",
+        selector=", ".join(
+            f"{name}={json.dumps(arguments[name], ensure_ascii=False)}"
+            for name in _RANGE_ARGUMENTS
+            if arguments.get(name) is not None
+        ),
+        compact=compact,
+        max_chars=max_chars,
+    )
+
 
-        if content.references:
-            result_text += "## Scripture References\n\n"
-            for ref in content.references:
-                result_text += f"- {ref}\n"
+async def _handle_get_parallel_article(arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle get_parallel_article tool call."""
+    client = get_client()
+    url = arguments.get("url", "")
+    languages = arguments.get("languages", [])
+
+    logger.info("Fetching article in %s: %s", ", ".join(languages), url)
+
+    content, metadata = await client.get_parallel_article(url, languages)
+    start = arguments.get("start", 1)
+    max_chars = budget_chars(arguments.get("max_tokens", settings.response_max_tokens))
+
+    if _wants_json(arguments):
+        data_json = ResponseFormatter.parallel_article_json(
+            content, start=start, max_chars=max_chars
+        )
+        result_text = ResponseFormatter.format_json(data_json, metadata)
+    else:
+        result_text = ResponseFormatter.format_parallel_article(
+            content,
+            metadata,
+            start=start,
+            compact=arguments.get("compact", False),
+            max_chars=max_chars,
+        )
 
     return [TextContent(type="text", text=result_text)]
 
 
 async def _handle_get_scripture(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle get_scripture tool call."""
+    client = get_client()
     reference = arguments.get("reference", "")
     translation = arguments.get("translation", "nwtsty")
+    language = arguments.get("language", settings.default_language)
 
-    logger.info(f"Fetching scripture: {reference}")
+    logger.info("Fetching scripture: %s", reference)
 
-    scripture, metadata = await client.get_scripture(reference, translation)
+    scripture, metadata = await client.get_scripture(reference, translation, language)
 
-    # Format scripture
-    result_text = f"# {scripture['reference']}\n\n"
-    result_text += f"{scripture['text']}\n\n"
-    result_text += f"**Source:** {metadata.source_url}\n"
-    result_text += f"**Timestamp:** {metadata.timestamp.isoformat()}\n"
+    if _wants_json(arguments):
+        data_json = ScriptureContent.model_validate(scripture).model_dump_json()
+        result_text = ResponseFormatter.format_json(data_json, metadata)
+    else:
+        result_text = ResponseFormatter.format_scripture(
+            scripture, metadata, compact=arguments.get("compact", False)
+        )
 
     return [TextContent(type="text", text=result_text)]
 
 
-async def _handle_cache_stats() -> list[TextContent]:
+async def _handle_cache_stats(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle get_cache_stats tool call."""
+    client = get_client()
     stats = client.get_cache_stats()
 
-    result_text = "# Cache Statistics\n\n"
-    result_text += f"**Entries:** {stats['entries']}\n"
-    result_text += f"**Hits:** {stats['hits']}\n"
-    result_text += f"**Misses:** {stats['misses']}\n"
-    result_text += f"**Hit Rate:** {stats['hit_rate']}%\n"
+    if _wants_json(arguments):
+        result_text = ResponseFormatter.format_json(json.dumps(stats, separators=(",", ":")))
+    else:
+        result_text = ResponseFormatter.format_cache_stats(stats)
 
     return [TextContent(type="text", text=result_text)]
 
 
+def start_maintenance() -> None:
+    """Start the background cache maintenance task on the running event loop.
+
+    Does nothing if it is already running or ``settings.cache_sweep_interval``
+    is 0. The task is stopped by cleanup().
+    """
+    global _maintenance_task
+    if _maintenance_task is None and settings.cache_sweep_interval > 0:
+        _maintenance_task = asyncio.create_task(_maintain_cache(), name="cache-maintenance")
+
+
+async def _maintain_cache() -> None:
+    """Sweep expired cache entries every ``settings.cache_sweep_interval`` seconds."""
+    while True:
+        await asyncio.sleep(settings.cache_sweep_interval)
+        # Nothing is cached before the client is created by the first tool call
+        if _client is None:
+            continue
+        try:
+            _client.maintain_cache(settings.cache_sweep_budget_ms / 1000)
+        except Exception:
+            logger.exception("Cache maintenance failed")
+
+
 async def cleanup() -> None:
     """Cleanup resources on shutdown."""
+    global _maintenance_task
     logger.info("Shutting down JW.Org MCP server")
-    await client.close()
+    if _maintenance_task is not None:
+        _maintenance_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _maintenance_task
+        _maintenance_task = None
+    if _client is not None:
+        await _client.close()
@@ -0,0 +1,209 @@
+"""State shared between server worker processes.
+
+Used in multi-worker mode: a SQLite-backed cache tier that all workers read
+and write through, and a file-locked JWT token store so only one worker
+refreshes the token at a time.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from .models import JWTToken
+
+if sys.platform != "win32":
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds a shared cache call waits for another worker's write lock. The calls
+# run on the event loop, so a busy database is treated as a miss (or a skipped
+# write) rather than waited for.
+BUSY_TIMEOUT = 0.05
+
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    """Check whether a SQLite error means the database is locked by another writer.
+
+    Args:
+        error: Error raised by a SQLite call
+
+    Returns:
+        True for SQLITE_BUSY and SQLITE_LOCKED, including their extended codes
+    """
+    return (error.sqlite_errorcode & 0xFF) in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+
+class SharedCacheStore:
+    """Cache tier stored in a SQLite database shared by worker processes.
+
+    Reads, writes and purges that find the database locked for longer than
+    ``BUSY_TIMEOUT`` are skipped, since the local tier still holds the value.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open (or create) the shared cache database.
+
+        Args:
+            path: Database file path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        # Setting up the database may wait for other workers doing the same
+        self._conn = sqlite3.connect(path, timeout=5.0, isolation_level=None)
+        # Calls skipped because the database was busy
+        self.busy_skips = 0
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)"
+        )
+        self._conn.execute(f"PRAGMA busy_timeout={int(BUSY_TIMEOUT * 1000)}")
+
+    def _skip_busy(self, error: sqlite3.OperationalError, operation: str) -> None:
+        """Count a call skipped because the database is locked, re-raising other errors.
+
+        Args:
+            error: Error raised by the call
+            operation: Name of the skipped operation, for logging
+
+        Raises:
+            sqlite3.OperationalError: If the error is not a lock timeout
+        """
+        if not _is_busy(error):
+            raise error
+        self.busy_skips += 1
+        logger.debug("Shared cache busy, skipping %s", operation)
+
+    def get(self, key: str) -> tuple[bytes, float] | None:
+        """Get an unexpired value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (encoded value, expiry as a Unix timestamp), or None if
+            missing or the database is busy
+        """
+        try:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        except sqlite3.OperationalError as e:
+            self._skip_busy(e, "read")
+            return None
+        if row is None:
+            return None
+        return bytes(row[0]), float(row[1])
+
+    def set(self, key: str, value: bytes, expires_at: float) -> None:
+        """Store a value, unless the database is busy.
+
+        Args:
+            key: Cache key
+            value: Encoded value
+            expires_at: Expiry as a Unix timestamp
+        """
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, expires_at, value),
+            )
+        except sqlite3.OperationalError as e:
+            self._skip_busy(e, "write")
+
+    def delete_expired(self) -> int:
+        """Remove expired values.
+
+        Returns:
+            Number of values removed
+        """
+        try:
+            cursor = self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        except sqlite3.OperationalError as e:
+            # Left for the next purge
+            self._skip_busy(e, "purge")
+            return 0
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._conn.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class SharedTokenStore:
+    """JWT token shared between workers through a file guarded by an advisory lock."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the token store.
+
+        Args:
+            path: Token file path; a sibling ``.lock`` file is used for locking
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._lock_path = path.with_suffix(path.suffix + ".lock")
+
+    def read(self) -> JWTToken | None:
+        """Read the stored token.
+
+        Returns:
+            The stored token, or None if missing or unreadable
+        """
+        try:
+            return JWTToken.model_validate_json(self._path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, token: JWTToken) -> None:
+        """Atomically replace the stored token."""
+        tmp_path = self._path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(token.model_dump_json())
+        os.replace(tmp_path, self._path)
+
+    async def refresh(
+        self,
+        fetch: Callable[[], Awaitable[JWTToken]],
+        is_valid: Callable[[JWTToken], bool],
+        reject: str | None = None,
+    ) -> JWTToken:
+        """Get a valid token, fetching one only if no worker has done so already.
+
+        Holds an exclusive lock on the store while checking and fetching, so
+        concurrent refreshes across processes result in one upstream request.
+
+        Args:
+            fetch: Fetches a new token from upstream
+            is_valid: Checks whether a stored token can still be used
+            reject: Token value that must not be reused (e.g. on forced refresh)
+
+        Returns:
+            A valid token
+        """
+        with open(self._lock_path, "a") as lock_file:
+            if sys.platform != "win32":
+                await asyncio.to_thread(fcntl.flock, lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                stored = self.read()
+                if stored is not None and stored.token != reject and is_valid(stored):
+                    logger.debug("Using JWT token refreshed by another worker")
+                    return stored
+
+                token = await fetch()
+                self._write(token)
+                return token
+            finally:
+                if sys.platform != "win32":
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,133 @@
+"""Canonical forms of wol.jw.org article URLs, and their languages.
+
+The same article is reachable through many URL variants: with query
+parameters or fragments (search highlights, paragraph anchors), with or
+without the interface language prefix, and through jw.org "finder" links.
+Canonicalizing them lets every variant share one fetch and cache entry.
+
+An article keeps its document id across translations; only the r/lp codes
+of its URL change with the language.
+"""
+
+import re
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from .config import settings
+
+# Interface language prefix, content language (r/lp codes) and document id
+_ARTICLE_PATH = re.compile(
+    r"^/(?:(?P<ui>[a-z]{2,3}(?:-[a-z]+)?)/)?wol/d/(?P<r>r\d+)/(?P<lp>lp-[a-z0-9-]+)/(?P<docid>\d+)/?$",
+    re.IGNORECASE,
+)
+
+# Language codes (as used by search and finder wtlocale) mapped to interface
+# language and r/lp codes
+LANGUAGES: dict[str, tuple[str, str, str]] = {
+    "E": ("en", "r1", "lp-e"),
+    "S": ("es", "r4", "lp-s"),
+    "F": ("fr", "r30", "lp-f"),
+    "X": ("de", "r10", "lp-x"),
+    "T": ("pt", "r5", "lp-t"),
+    "I": ("it", "r6", "lp-i"),
+}
+
+# Interface language and language code for each lp code
+_UI_LANGUAGES = {lp: ui for ui, _, lp in LANGUAGES.values()}
+_LANGUAGE_CODES = {lp: code for code, (_, _, lp) in LANGUAGES.items()}
+
+_JW_HOSTS = frozenset({"jw.org", "www.jw.org", "wol.jw.org"})
+
+
+def canonical_article_url(url: str) -> str:
+    """Get the canonical form of an article URL.
+
+    Article links (``/wol/d/<r>/<lp>/<docid>``) lose their query and fragment
+    and get the interface language prefix of their content language, and
+    finder links for a known language become article links on
+    ``settings.wol_base_url``. Other URLs only lose their fragment.
+
+    Args:
+        url: Article URL or publication finder URL
+
+    Returns:
+        Canonical URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = parts.netloc.lower()
+    if host in _JW_HOSTS:
+        scheme = "https"
+
+    if parts.path.rstrip("/").endswith("/finder") and host in _JW_HOSTS:
+        finder_url = _finder_article_url(parts.query)
+        if finder_url is not None:
+            return finder_url
+
+    match = _ARTICLE_PATH.match(parts.path)
+    if match is None:
+        return urlunsplit((scheme, host, parts.path, parts.query, ""))
+
+    lp = match["lp"].lower()
+    # The interface language only changes the page around the article
+    ui = _UI_LANGUAGES.get(lp) or (match["ui"] or "en").lower()
+    path = f"/{ui}/wol/d/{match['r'].lower()}/{lp}/{match['docid']}"
+    return urlunsplit((scheme, host, path, "", ""))
+
+
+def article_language(url: str) -> str | None:
+    """Get the language of an article URL.
+
+    Args:
+        url: Article URL, in any variant
+
+    Returns:
+        Language code (E, S, ...), or None for other URLs and unknown languages
+    """
+    match = _ARTICLE_PATH.match(urlsplit(canonical_article_url(url)).path)
+    if match is None:
+        return None
+    return _LANGUAGE_CODES.get(match["lp"].lower())
+
+
+def localized_article_url(url: str, language: str) -> str:
+    """Get the canonical URL of an article in another language.
+
+    Args:
+        url: Article URL, in any variant
+        language: Language code (E, S, ...)
+
+    Returns:
+        Canonical URL of the same document in that language
+
+    Raises:
+        ValueError: If the URL is not an article URL or the language is unknown
+    """
+    parts = urlsplit(canonical_article_url(url))
+    match = _ARTICLE_PATH.match(parts.path)
+    if match is None:
+        raise ValueError(f"Not an article URL: {url}")
+    codes = LANGUAGES.get(language.upper())
+    if codes is None:
+        raise ValueError(f"Unsupported language: {language}")
+    ui, r, lp = codes
+    return urlunsplit(
+        (parts.scheme, parts.netloc, f"/{ui}/wol/d/{r}/{lp}/{match['docid']}", "", "")
+    )
+
+
+def _finder_article_url(query: str) -> str | None:
+    """Map a finder link query to an article URL.
+
+    Args:
+        query: Query string of the finder link
+
+    Returns:
+        Article URL, or None for unknown languages or links without a document id
+    """
+    params = parse_qs(query)
+    docid = params.get("docid", [""])[0]
+    language = LANGUAGES.get(params.get("wtlocale", ["E"])[0].upper())
+    if not docid.isdigit() or language is None:
+        return None
+    ui, r, lp = language
+    return f"{settings.wol_base_url.rstrip('/')}/{ui}/wol/d/{r}/{lp}/{docid}"
@@ -0,0 +1,171 @@
+"""Multi-process HTTP serving: a supervisor running shared-nothing worker processes.
+
+Each worker is a complete HTTP server process (see http_server) with its own
+event loop, parser and connection pool, so CPU-bound parsing scales across
+cores. Connections are distributed by the kernel, either with SO_REUSEPORT
+(each worker binds its own listening socket) or, where that is unavailable,
+by all workers accepting from one socket bound by the supervisor. Workers
+share the cache tier and JWT token through ``settings.shared_state_dir``, or
+a private temporary directory removed when the supervisor exits.
+
+Because a client's requests may reach any worker, workers run the streamable
+HTTP transport in stateless mode and do not serve the legacy SSE transport.
+"""
+
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between restarts of a crashed worker
+RESTART_DELAY = 1.0
+
+
+def _bind_socket(reuse_port: bool) -> socket.socket:
+    """Bind the configured HTTP address.
+
+    Args:
+        reuse_port: Set SO_REUSEPORT so several workers can bind the same address
+
+    Returns:
+        Bound (not yet listening) socket
+    """
+    family = socket.AF_INET6 if ":" in settings.http_host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((settings.http_host, settings.http_port))
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(worker_id: int, sock: socket.socket | None) -> None:
+    """Worker process entry point.
+
+    Args:
+        worker_id: Index of the worker, for logging
+        sock: Socket shared by all workers, or None to bind one with SO_REUSEPORT
+    """
+    import asyncio
+
+    from .http_server import create_uvicorn_server
+    from .server import configure_logging
+
+    configure_logging()
+    if sock is None:
+        sock = _bind_socket(reuse_port=True)
+
+    logger.info("Worker %d started (pid %d)", worker_id, os.getpid())
+    asyncio.run(create_uvicorn_server().serve(sockets=[sock]))
+
+
+def run_supervisor(workers: int | None = None) -> None:
+    """Run worker processes until SIGINT/SIGTERM, restarting any that crash.
+
+    On shutdown each worker receives SIGTERM and drains in-flight requests
+    (see ``settings.http_shutdown_timeout``) before it is forcibly killed.
+
+    Args:
+        workers: Number of worker processes (default: ``settings.http_workers``)
+    """
+    from .server import configure_logging
+
+    configure_logging()
+    count = workers if workers is not None else settings.http_workers
+
+    private_dir = None
+    if not settings.shared_state_dir:
+        # A fresh directory only this user can access, so no one else can
+        # plant cache or token files for the workers to read
+        private_dir = tempfile.mkdtemp(prefix="jw-org-mcp-")
+        # Workers are spawned fresh and read their settings from the environment
+        os.environ["JWORG_MCP_SHARED_STATE_DIR"] = private_dir
+        logger.info("Sharing worker state in %s", private_dir)
+
+    try:
+        _supervise(count)
+    finally:
+        if private_dir is not None:
+            del os.environ["JWORG_MCP_SHARED_STATE_DIR"]
+            shutil.rmtree(private_dir, ignore_errors=True)
+
+
+def _supervise(count: int) -> None:
+    """Run worker processes until SIGINT/SIGTERM (see run_supervisor).
+
+    Args:
+        count: Number of worker processes
+    """
+    # Consecutive requests of one client may reach different workers, so sessions
+    # must not live in worker memory
+    os.environ["JWORG_MCP_HTTP_STATELESS"] = "true"
+
+    reuse_port = settings.http_reuse_port and hasattr(socket, "SO_REUSEPORT")
+    shared_socket = None if reuse_port else _bind_socket(reuse_port=False)
+
+    context = multiprocessing.get_context("spawn")
+    processes: dict[int, BaseProcess] = {}
+    stopping = False
+
+    def start_worker(worker_id: int) -> None:
+        process = context.Process(
+            target=_run_worker,
+            args=(worker_id, shared_socket),
+            name=f"jw-org-mcp-worker-{worker_id}",
+        )
+        process.start()
+        processes[worker_id] = process
+
+    def handle_signal(signum: int, frame: FrameType | None) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    logger.info(
+        "Starting %d workers on %s:%s (%s)",
+        count,
+        settings.http_host,
+        settings.http_port,
+        "SO_REUSEPORT" if reuse_port else "shared socket",
+    )
+    for worker_id in range(count):
+        start_worker(worker_id)
+
+    while not stopping:
+        wait([p.sentinel for p in processes.values()], timeout=0.5)
+        for worker_id, process in list(processes.items()):
+            if not stopping and not process.is_alive():
+                logger.warning(
+                    "Worker %d exited with code %s, restarting", worker_id, process.exitcode
+                )
+                time.sleep(RESTART_DELAY)
+                start_worker(worker_id)
+
+    logger.info("Stopping %d workers", len(processes))
+    for process in processes.values():
+        if process.is_alive():
+            process.terminate()
+    deadline = time.monotonic() + settings.http_shutdown_timeout + 5
+    for process in processes.values():
+        process.join(max(deadline - time.monotonic(), 0))
+        if process.is_alive():
+            logger.warning("Worker %s did not stop in time, killing it", process.name)
+            process.kill()
+            process.join()
+
+    if shared_socket is not None:
+        shared_socket.close()
@@ -0,0 +1,35 @@
+"""Tests for auth module."""
+
+import asyncio
+import base64
+import json
+
+import httpx
+
+from jw_org_mcp.auth import AuthManager
+
+
+def _make_token(exp: int) -> str:
+    """Build an unsigned JWT with the given expiry."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+async def test_concurrent_refresh_fetches_once() -> None:
+    """Concurrent callers share a single token request."""
+    requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=_make_token(4102444800))
+
+    auth = AuthManager()
+    auth._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    tokens = await asyncio.gather(*(auth.get_jwt_token() for _ in range(50)))
+
+    assert requests == 1
+    assert len(set(tokens)) == 1
+    await auth.close()
@@ -1,10 +1,14 @@
 """Tests for cache module."""
 
 import time
+from datetime import UTC, datetime
+from pathlib import Path
 
 import pytest
 
-from jw_org_mcp.cache import Cache
+from jw_org_mcp.cache import AdaptiveTTL, Cache
+from jw_org_mcp.codec import CompressedValue, EncodedValue
+from jw_org_mcp.models import ArticleContent, ResponseMetadata
 
 
 class TestCache:
@@ -85,6 +89,36 @@ class TestCache:
         assert cache.get("key1") is None
         assert cache.get("key2") == "value2"
 
+    def test_sweep(self) -> None:
+        """Test that sweeps remove expired entries but not ones replaced since."""
+        cache = Cache(ttl_seconds=0.05)
+
+        cache.set("key1", value="value1")
+        cache.set("key2", value="value2")
+        cache.set("key3", value="value3", ttl_seconds=10)
+        # Replaced with a longer TTL: its first expiry must be ignored
+        cache.set("key2", value="value2b", ttl_seconds=10)
+        time.sleep(0.1)
+
+        assert cache.sweep() == 1
+        assert len(cache._cache) == 2
+        assert cache.get("key2") == "value2b"
+        assert cache.get_stats()["expired"] == 1
+
+    def test_sweep_budget(self) -> None:
+        """Test that a sweep with an exhausted budget leaves work for the next one."""
+        cache = Cache(ttl_seconds=0.01)
+        for i in range(1000):
+            cache.set(f"key{i}", value=i)
+        time.sleep(0.05)
+
+        removed = cache.sweep(budget_seconds=0)
+
+        assert 0 < removed < 1000
+        assert cache.sweep() == 1000 - removed
+        assert not cache._cache
+        assert not cache._expiry
+
     def test_stats(self) -> None:
         """Test cache statistics."""
         cache = Cache(ttl_seconds=60)
@@ -117,3 +151,235 @@ class TestCache:
         assert cache.get("search", "peace", "all") == "results1"
         assert cache.get("search", "peace", "videos") == "results2"
         assert cache.get("search", "peace", "audio") is None
+
+    def test_derived_values(self) -> None:
+        """Test derived representations stored alongside an entry."""
+        cache = Cache(ttl_seconds=60)
+
+        # No entry to attach to
+        assert cache.set_derived("key1", name="json", value="{}") is False
+
+        cache.set("key1", value="value1")
+        assert cache.set_derived("key1", name="json", value='"value1"') is True
+        assert cache.get_derived("key1", name="json") == '"value1"'
+        assert cache.get_derived("key1", name="other") is None
+
+        # Replacing the entry drops derived values
+        cache.set("key1", value="value2")
+        assert cache.get_derived("key1", name="json") is None
+
+        # Derived lookups do not affect statistics
+        stats = cache.get_stats()
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
+
+    def test_keep_derived_values(self) -> None:
+        """Test that replacing an entry can keep named derived values."""
+        cache = Cache(ttl_seconds=60)
+        cache.set("key1", value="value1")
+        cache.set_derived("key1", name="json", value='"value1"')
+        cache.set_derived("key1", name="render", value="Value 1")
+
+        cache.set("key1", value="value1", keep_derived=("json", "missing"))
+
+        assert cache.get_derived("key1", name="json") == '"value1"'
+        assert cache.get_derived("key1", name="render") is None
+
+    def test_peek(self) -> None:
+        """Test that peek returns held values, even expired, without counting."""
+        cache = Cache(ttl_seconds=60, stale_seconds=60)
+        cache.set("key1", value="value1", ttl_seconds=0.01)
+        time.sleep(0.02)
+
+        assert cache.peek("key1") == "value1"
+        assert cache.peek("key2") is None
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["stale_hits"]) == (0, 0, 0)
+
+    def test_stale_values(self) -> None:
+        """Test that expired values stay available to get_stale for a while."""
+        cache = Cache(ttl_seconds=60, stale_seconds=0.05)
+        cache.set("key1", value="value1", ttl_seconds=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("key1") is None
+        assert cache.sweep() == 0
+        assert cache.get_stale("key1") == "value1"
+
+        time.sleep(0.05)
+        assert cache.sweep() == 1
+        assert cache.get_stale("key1") is None
+        assert cache.get_stats()["stale_hits"] == 1
+
+
+class TestCompression:
+    """Tests for holding large values compressed."""
+
+    @staticmethod
+    def article(paragraphs: int) -> tuple[ArticleContent, ResponseMetadata]:
+        """Build a cached get_article value with the given number of paragraphs."""
+        url = "https://wol.jw.org/en/wol/d/r1/lp-e/1985720"
+        return (
+            ArticleContent(
+                title="Peace",
+                paragraphs=[f"Paragraph {i} about peace and security." for i in range(paragraphs)],
+                source_url=url,
+                pids=list(range(1, paragraphs + 1)),
+            ),
+            ResponseMetadata(
+                source_domain="wol.jw.org", source_url=url, timestamp=datetime.now(UTC)
+            ),
+        )
+
+    @pytest.mark.parametrize("algorithm", ["zlib", "brotli"])
+    def test_large_value_roundtrip(self, algorithm: str) -> None:
+        """Test that large values are held compressed and decoded on hit."""
+        cache = Cache(ttl_seconds=60, compression=algorithm, compress_min_bytes=1024)
+        value = self.article(200)
+
+        cache.set("article", value=value)
+
+        assert isinstance(cache._cache[cache._make_key("article")].data, CompressedValue)
+        assert cache.get("article") == value
+        stats = cache.get_stats()
+        assert stats["compressed_entries"] == 1
+        assert stats["compression_ratio"] > 1
+        assert stats["decompressions"] == 1
+
+    def test_small_and_unsupported_values_stay_raw(self) -> None:
+        """Test that values below the threshold or without a codec are not compressed."""
+        cache = Cache(ttl_seconds=60, compression="zlib", compress_min_bytes=1024)
+        small = self.article(2)
+
+        cache.set("small", value=small)
+        cache.set("text", value="x" * 4096)
+
+        assert cache.get("small") is small
+        assert cache.get("text") == "x" * 4096
+        assert cache.get_stats()["compressed_entries"] == 0
+
+    def test_large_derived_values_not_kept(self) -> None:
+        """Test that compressed entries only keep derived values below the threshold."""
+        cache = Cache(ttl_seconds=60, compression="zlib", compress_min_bytes=1024)
+        cache.set("article", value=self.article(200))
+        cache.set("small", value=self.article(2))
+
+        assert not cache.set_derived("article", name="json", value="x" * 2048, size=2048)
+        assert cache.set_derived("article", name="title", value="Peace", size=5)
+        assert cache.set_derived("small", name="json", value="x" * 2048, size=2048)
+
+        assert cache.get_derived("article", name="json") is None
+        assert cache.get_derived("article", name="title") == "Peace"
+        assert cache.get_derived("small", name="json") == "x" * 2048
+        assert cache.get_stats()["derived_skipped"] == 1
+
+    def test_disabled_by_default(self) -> None:
+        """Test that values are held as-is without compression."""
+        cache = Cache(ttl_seconds=60)
+        value = self.article(200)
+
+        cache.set("article", value=value)
+
+        assert cache.get("article") is value
+        assert "compression" not in cache.get_stats()
+
+    def test_unknown_algorithm(self) -> None:
+        """Test that an unknown algorithm is rejected."""
+        with pytest.raises(ValueError):
+            Cache(compression="lzma")
+
+
+class TestSnapshot:
+    """Tests for saving and restoring the cache."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Test that a restored cache serves the saved values with their TTLs."""
+        path = tmp_path / "cache.snapshot"
+        article = TestCompression.article(200)
+        small = TestCompression.article(1)
+        cache = Cache(ttl_seconds=60, compression="zlib", compress_min_bytes=1024)
+        cache.set("article", value=article)
+        cache.set("small", value=small, ttl_seconds=30)
+        cache.set("text", value="not encodable")
+        cache.set("expiring", value=TestCompression.article(1), ttl_seconds=0.01)
+        time.sleep(0.02)
+
+        assert cache.save_snapshot(path) == 2
+
+        restored = Cache(ttl_seconds=60)
+        assert restored.load_snapshot(path) == 2
+        entry = restored._cache[restored._make_key("small")]
+        assert isinstance(entry.data, EncodedValue)
+        assert 29 < entry.expires_at - time.monotonic() <= 30
+
+        assert restored.get("article") == article
+        assert restored.get("small") == small
+        assert not isinstance(entry.data, EncodedValue)
+        assert restored.get("text") is None
+        assert restored.get_stats()["restored"] == 2
+
+    def test_missing_or_damaged(self, tmp_path: Path) -> None:
+        """Test that a missing or damaged snapshot restores what it can."""
+        path = tmp_path / "cache.snapshot"
+        cache = Cache(ttl_seconds=60)
+
+        assert cache.load_snapshot(path) == 0
+
+        source = Cache(ttl_seconds=60)
+        source.set("a", value=TestCompression.article(1))
+        source.set("b", value=TestCompression.article(1))
+        source.save_snapshot(path)
+        path.write_bytes(path.read_bytes()[:-10])
+
+        assert cache.load_snapshot(path) == 1
+
+        path.write_bytes(b"garbage")
+        assert Cache().load_snapshot(path) == 0
+
+
+class TestAdaptiveTTL:
+    """Tests for TTLs learned from content changes."""
+
+    def test_backoff_and_shortening(self) -> None:
+        """Test that unchanged content doubles the TTL and changes halve it."""
+        ttl = AdaptiveTTL(min_seconds=60, max_seconds=3600)
+
+        assert ttl.ttl("k", "a", "article", 900) == 900
+        assert ttl.ttl("k", "a", "article", 900) == 1800
+        assert ttl.ttl("k", "a", "article", 900) == 3600
+        assert ttl.ttl("k", "a", "article", 900) == 3600
+        assert ttl.ttl("k", "b", "article", 900) == 1800
+        assert ttl.ttl("s", "x", "search", 90) == 90
+        assert ttl.ttl("s", "y", "search", 90) == 60
+
+        stats = ttl.get_stats()
+        assert stats["keys"] == 2
+        assert stats["unchanged"] == 3
+        assert stats["changed"] == 2
+        assert stats["distribution"] == {"article": {1800: 1}, "search": {60: 1}}
+
+    def test_forgets_least_recent_keys(self) -> None:
+        """Test that the number of remembered keys is bounded."""
+        ttl = AdaptiveTTL(min_seconds=60, max_seconds=3600, max_keys=2)
+        for key in ("a", "b", "c"):
+            ttl.ttl(key, "h", "article", 900)
+
+        assert ttl.ttl("a", "h", "article", 900) == 900
+        assert ttl.ttl("c", "h", "article", 900) == 1800
+
+    def test_cache_uses_learned_ttl(self) -> None:
+        """Test that the cache applies learned TTLs to values with a content hash."""
+        cache = Cache(ttl_seconds=900, adaptive_ttl=AdaptiveTTL(60, 86400))
+
+        cache.set("article", value="v1", content_hash="h", content_class="article")
+        cache.set("article", value="v1", content_hash="h", content_class="article")
+        cache.set("plain", value="v")
+        cache.set("custom", value="v", content_hash="h", ttl_seconds=10)
+
+        def remaining(*key: str) -> float:
+            return cache._cache[cache._make_key(*key)].expires_at - time.monotonic()
+
+        assert 1790 < remaining("article") <= 1800
+        assert 890 < remaining("plain") <= 900
+        assert remaining("custom") <= 10
+        assert cache.get_stats()["adaptive_ttl"]["distribution"] == {"article": {1800: 1}}
@@ -0,0 +1,687 @@
+"""Tests for client module."""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+from mcp.types import TextContent
+
+from jw_org_mcp import server
+from jw_org_mcp.client import JWOrgClient
+from jw_org_mcp.config import settings
+from jw_org_mcp.exceptions import ContentRetrievalError
+from jw_org_mcp.models import ArticleContent, ResponseMetadata
+
+ARTICLE_URL = "https://wol.jw.org/en/wol/d/r1/lp-e/1985720"
+
+
+class TestRenderedCache:
+    """Tests for rendered response caching."""
+
+    @pytest.fixture
+    async def client(self) -> AsyncIterator[JWOrgClient]:
+        """Client closed once the test finishes."""
+        client = JWOrgClient()
+        yield client
+        await client.close()
+
+    def test_store_and_get_rendered(self, client: JWOrgClient) -> None:
+        """Test that rendered responses are served from the cache entry."""
+        key = client.article_cache_key("https://wol.jw.org/en/wol/d/r1/lp-e/1")
+        client._cache.set(*key, value="parsed")
+        rendered = TextContent(type="text", text="# Article")
+
+        assert client.get_rendered(key, "render:a") is None
+
+        client.store_rendered(key, "render:a", rendered, 0.002, cache_hit=True)
+
+        assert client.get_rendered(key, "render:a") is rendered
+        assert client.get_rendered(key, "render:b") is None
+
+        stats = client.get_cache_stats()
+        assert stats["rendered_hits"] == 1
+        assert stats["rendered_misses"] == 2
+        assert stats["render_time_saved_ms"] == 2.0
+
+    async def test_rendered_hits_count_as_cache_hits(
+        self, client: JWOrgClient, sample_article_html: str
+    ) -> None:
+        """Test that calls answered by a rendered response count as cache hits."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=sample_article_html)
+
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        server._client = client
+        try:
+            for _ in range(5):
+                await server.call_tool("get_article", {"url": ARTICLE_URL})
+        finally:
+            server._client = None
+
+        stats = client.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (4, 1, 80.0)
+        assert stats["rendered_hits"] == 3
+        assert stats["languages"] == {"E": {"hits": 4, "misses": 1}}
+
+    async def test_json_article_within_budget(self, client: JWOrgClient) -> None:
+        """Test that JSON articles are cut at max_tokens with a continuation point."""
+        paragraphs = "".join(f'<p data-pid="{i}">{"word " * 100}</p>' for i in range(1, 21))
+        page = f'<article id="article"><h1>Long</h1>{paragraphs}</article>'
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=page)
+
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        server._client = client
+        arguments = {"url": ARTICLE_URL, "format": "json", "max_tokens": 1000}
+        try:
+            first = (await server.call_tool("get_article", arguments))[0]
+            rest = (await server.call_tool("get_article", {**arguments, "start": 8}))[0]
+            whole = (await server.call_tool("get_article", {**arguments, "max_tokens": 0}))[0]
+        finally:
+            server._client = None
+
+        data = json.loads(first.text)["data"]
+        assert len(first.text) < 1000 * settings.response_chars_per_token + 500
+        assert data["pids"] == list(range(1, 8))
+        assert data["next_start"] == 8
+        assert json.loads(rest.text)["data"]["pids"][0] == 8
+        assert json.loads(whole.text)["data"]["next_start"] is None
+        assert len(json.loads(whole.text)["data"]["paragraphs"]) == 20
+
+    async def test_json_index_within_budget(self, client: JWOrgClient) -> None:
+        """Test that JSON publication indexes honor max_tokens and start."""
+        links = "".join(f'<a href="/en/wol/d/r1/lp-e/{i}">Article {i}</a>' for i in range(1, 601))
+        page = f'<article id="article"><h1>Index</h1>{links}</article>'
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=page)
+
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        server._client = client
+        arguments = {"url": ARTICLE_URL, "format": "json", "max_tokens": 100, "start": 500}
+        try:
+            result = (await server.call_tool("get_article", arguments))[0]
+        finally:
+            server._client = None
+
+        data = json.loads(result.text)["data"]
+        assert len(result.text) < 100 * settings.response_chars_per_token + 500
+        assert data["articles"][0]["title"] == "Article 500"
+        assert data["next_start"] == data["end"] + 1
+
+    def test_fresh_responses_not_stored(self, client: JWOrgClient) -> None:
+        """Test that responses rendered from a fresh fetch are not stored."""
+        key = client.article_cache_key("https://wol.jw.org/en/wol/d/r1/lp-e/1")
+        client._cache.set(*key, value="parsed")
+
+        client.store_rendered(
+            key, "render:a", TextContent(type="text", text="x"), 0.001, cache_hit=False
+        )
+
+        assert client.get_rendered(key, "render:a") is None
+
+    def test_rendered_dropped_with_entry(self, client: JWOrgClient) -> None:
+        """Test that replacing the model entry invalidates rendered responses."""
+        key = client.article_cache_key("https://wol.jw.org/en/wol/d/r1/lp-e/1")
+        client._cache.set(*key, value="parsed")
+        client.store_rendered(
+            key, "render:a", TextContent(type="text", text="x"), 0.001, cache_hit=True
+        )
+
+        client._cache.set(*key, value="reparsed")
+
+        assert client.get_rendered(key, "render:a") is None
+
+
+class TestArticleRanges:
+    """Tests for reading a range of an article through the server."""
+
+    async def test_hint_keeps_pid_range(self) -> None:
+        """Test that a truncated pid range is continued within the same range."""
+        paragraphs = "".join(f'<p data-pid="{i}">{"word " * 100}</p>' for i in range(1, 21))
+        page = f'<article id="article"><h1>Long</h1>{paragraphs}</article>'
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=page)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        server._client = client
+        arguments = {"url": ARTICLE_URL, "pid_start": 3, "pid_end": 9, "max_tokens": 300}
+        try:
+            result = (await server.call_tool("get_article", arguments))[0]
+        finally:
+            server._client = None
+            await client.close()
+
+        assert "Call get_article with `pid_start=3, pid_end=9, start=" in result.text
+
+
+class TestArticleAliases:
+    """Tests for fetching URL variants of an article once."""
+
+    async def test_variants_share_fetch(self, sample_article_html: str) -> None:
+        """Test that URL variants are fetched and cached once."""
+        fetched = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            fetched.append(str(request.url))
+            return httpx.Response(200, text=sample_article_html)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        first, _ = await client.get_article(ARTICLE_URL + "?q=peace#h=2")
+        second, metadata = await client.get_article(
+            "https://www.jw.org/finder?wtlocale=E&docid=1985720&srctype=wol"
+        )
+        await client.close()
+
+        assert fetched == [ARTICLE_URL]
+        assert second is first
+        assert metadata.cache_hit
+        assert metadata.source_url == ARTICLE_URL
+
+    async def test_identical_bodies_shared(self, sample_article_html: str) -> None:
+        """Test that different URLs serving the same article share one body."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=sample_article_html)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        other_url = "https://wol.jw.org/en/wol/d/r1/lp-e/202"
+        first, _ = await client.get_article(ARTICLE_URL)
+        second, _ = await client.get_article(other_url)
+        await client.close()
+
+        assert isinstance(first, ArticleContent)
+        assert isinstance(second, ArticleContent)
+        assert second.paragraphs is first.paragraphs
+        assert (first.source_url, second.source_url) == (ARTICLE_URL, other_url)
+        assert client.get_cache_stats()["shared_bodies"] == 1
+
+
+class TestArticleLanguages:
+    """Tests for getting articles in other languages."""
+
+    async def test_language_routes_to_translation(self, sample_article_html: str) -> None:
+        """Test that a language fetches and caches the translated document."""
+        fetched = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            fetched.append(str(request.url))
+            return httpx.Response(200, text=sample_article_html)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client.get_article(ARTICLE_URL)
+        _, metadata = await client.get_article(ARTICLE_URL, language="S")
+        _, cached = await client.get_article("https://wol.jw.org/es/wol/d/r4/lp-s/1985720")
+        await client.close()
+
+        spanish_url = "https://wol.jw.org/es/wol/d/r4/lp-s/1985720"
+        assert fetched == [ARTICLE_URL, spanish_url]
+        assert metadata.source_url == spanish_url
+        assert metadata.query_params["language"] == "S"
+        assert cached.cache_hit
+        assert client.get_cache_stats()["languages"] == {
+            "E": {"hits": 0, "misses": 1},
+            "S": {"hits": 1, "misses": 1},
+        }
+
+    async def test_unknown_language(self) -> None:
+        """Test that an unknown language is a retrieval error."""
+        client = JWOrgClient()
+
+        with pytest.raises(ContentRetrievalError):
+            await client.get_article(ARTICLE_URL, language="ZZZ")
+        await client.close()
+
+
+class TestParallelArticle:
+    """Tests for getting an article in several languages at once."""
+
+    async def test_paragraphs_aligned(self) -> None:
+        """Test that translations are fetched concurrently and aligned by data-pid."""
+        pages = {
+            "lp-e": '<article id="article"><h1>Peace</h1>'
+            '<p data-pid="1">One.</p><p data-pid="2">Two.</p></article>',
+            "lp-s": '<article id="article"><h1>Paz</h1>'
+            '<p data-pid="1">Uno.</p><p data-pid="3">Tres.</p></article>',
+        }
+        in_flight = 0
+        most_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, most_in_flight
+            in_flight += 1
+            most_in_flight = max(most_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            page = pages.get(request.url.path.split("/")[-2])
+            return httpx.Response(200, text=page) if page else httpx.Response(404)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        parallel, metadata = await client.get_parallel_article(ARTICLE_URL, ["e", "S", "F", "E"])
+        _, spanish = await client.get_article(ARTICLE_URL, language="S")
+        await client.close()
+
+        assert most_in_flight == 3
+        assert parallel.languages == ["E", "S"]
+        assert parallel.titles == {"E": "Peace", "S": "Paz"}
+        assert [(p.pid, p.texts) for p in parallel.paragraphs] == [
+            (1, {"E": "One.", "S": "Uno."}),
+            (2, {"E": "Two."}),
+            (3, {"S": "Tres."}),
+        ]
+        assert list(parallel.errors) == ["F"]
+        assert metadata.query_params["languages"] == ["E", "S", "F"]
+        assert not metadata.cache_hit
+        assert spanish.cache_hit
+
+    async def test_no_language_retrieved(self) -> None:
+        """Test that failing every language is a retrieval error."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(ContentRetrievalError):
+            await client.get_parallel_article(ARTICLE_URL, ["E", "S"])
+        with pytest.raises(ContentRetrievalError):
+            await client.get_parallel_article(ARTICLE_URL, ["E", "ZZZ"])
+        await client.close()
+
+    async def test_json_within_budget(self) -> None:
+        """Test that JSON parallel articles honor max_tokens and start."""
+        paragraphs = "".join(f'<p data-pid="{i}">{"word " * 100}</p>' for i in range(1, 21))
+        page = f'<article id="article"><h1>Long</h1>{paragraphs}</article>'
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=page)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        server._client = client
+        arguments = {
+            "url": ARTICLE_URL,
+            "languages": ["E", "S"],
+            "format": "json",
+            "max_tokens": 1000,
+            "start": 5,
+        }
+        try:
+            result = (await server.call_tool("get_parallel_article", arguments))[0]
+        finally:
+            server._client = None
+            await client.close()
+
+        data = json.loads(result.text)["data"]
+        assert len(result.text) < 1000 * settings.response_chars_per_token + 500
+        assert [p["pid"] for p in data["paragraphs"]] == [5, 6, 7]
+        assert (data["start"], data["end"], data["next_start"]) == (5, 7, 8)
+
+
+def _article_page(*paragraphs: tuple[int, str]) -> str:
+    """Build an article page from (data-pid, text) pairs."""
+    body = "".join(f'<p data-pid="{pid}">{text}</p>' for pid, text in paragraphs)
+    return f'<article id="article"><h1>Peace</h1>{body}</article>'
+
+
+class TestArticleRevisions:
+    """Tests for comparing refetched articles with their cached version."""
+
+    async def _refetch(self, pages: list[str]) -> tuple[JWOrgClient, list[ResponseMetadata]]:
+        """Fetch ARTICLE_URL once per page, expiring the cached copy in between."""
+        responses = iter(pages)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=next(responses))
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        key = client.article_cache_key(ARTICLE_URL)
+        all_metadata = []
+        for _ in pages:
+            _, metadata = await client.get_article(ARTICLE_URL)
+            client._cache._cache[client._cache._make_key(*key)].expires_at = time.monotonic() - 1
+            all_metadata.append(metadata)
+        await client.close()
+        return client, all_metadata
+
+    async def test_changed_paragraphs_reported(self) -> None:
+        """Test that changed, added and removed paragraphs are reported by data-pid."""
+        client, (first, second) = await self._refetch(
+            [
+                _article_page((1, "One."), (2, "Two."), (3, "Three.")),
+                _article_page((1, "One."), (2, "Two, revised."), (4, "Four.")),
+            ]
+        )
+
+        assert first.changes is None
+        assert second.changes is not None
+        assert second.changes.model_dump() == {"changed": [2], "added": [4], "removed": [3]}
+        assert client.get_cache_stats()["revisions"] == {
+            "unchanged": 0,
+            "revised": 1,
+            "paragraphs": 3,
+        }
+
+    async def test_changes_not_repeated_by_cache_hits(self) -> None:
+        """Test that only the refetching response reports the changes."""
+        responses = iter([_article_page((1, "One.")), _article_page((1, "Uno."))])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=next(responses))
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        key = client.article_cache_key(ARTICLE_URL)
+
+        await client.get_article(ARTICLE_URL)
+        client._cache._cache[client._cache._make_key(*key)].expires_at = time.monotonic() - 1
+        _, refetched = await client.get_article(ARTICLE_URL)
+        _, cached = await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert refetched.changes is not None
+        assert refetched.changes.changed == [1]
+        assert cached.cache_hit
+        assert cached.changes is None
+
+    async def test_unchanged_article_keeps_serialization(self) -> None:
+        """Test that only an unchanged refetch keeps the serialized article."""
+        page = _article_page((1, "One."), (2, "Two."))
+        responses = iter([page, page, _article_page((1, "Uno."))])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=next(responses))
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        key = client.article_cache_key(ARTICLE_URL)
+        entries = client._cache._cache
+        cache_key = client._cache._make_key(*key)
+
+        await client.get_article(ARTICLE_URL)
+        client.get_serialized(key, "json", lambda: "serialized")
+        entries[cache_key].expires_at = time.monotonic() - 1
+        _, metadata = await client.get_article(ARTICLE_URL)
+        kept = client._cache.get_derived(*key, name="json")
+        entries[cache_key].expires_at = time.monotonic() - 1
+        await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert metadata.changes is not None and metadata.changes.unchanged
+        assert kept == "serialized"
+        assert client._cache.get_derived(*key, name="json") is None
+        assert client.get_cache_stats()["shared_bodies"] == 0
+        assert client.get_cache_stats()["revisions"] == {
+            "unchanged": 1,
+            "revised": 1,
+            "paragraphs": 2,
+        }
+
+
+class TestNegativeCache:
+    """Tests for remembering failed lookups."""
+
+    async def test_not_found_remembered(self) -> None:
+        """Test that a missing article is not fetched again."""
+        fetched = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            fetched.append(str(request.url))
+            return httpx.Response(404)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        for _ in range(2):
+            with pytest.raises(ContentRetrievalError, match="404"):
+                await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert fetched == [ARTICLE_URL]
+        stats = client.get_cache_stats()
+        assert stats["negative_entries"] == 1
+        assert stats["negative_hits"] == 1
+
+    async def test_parse_error_remembered(self) -> None:
+        """Test that a page that cannot be parsed is not fetched again."""
+        fetched = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            fetched.append(str(request.url))
+            return httpx.Response(200, text="<html><body>Nothing here</body></html>")
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        for _ in range(2):
+            with pytest.raises(ContentRetrievalError):
+                await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert len(fetched) == 1
+
+    async def test_server_errors_not_remembered(self, sample_article_html: str) -> None:
+        """Test that a transient failure does not hide a later success."""
+        responses = iter([httpx.Response(503), httpx.Response(200, text=sample_article_html)])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(ContentRetrievalError):
+            await client.get_article(ARTICLE_URL)
+        article, _ = await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert article.title == "Peace and Security"
+
+
+class TestCircuitBreaker:
+    """Tests for failing fast on a failing endpoint."""
+
+    async def test_open_breaker_skips_fetch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that requests to an endpoint that keeps failing are not sent."""
+        monkeypatch.setattr(settings, "circuit_failure_threshold", 2)
+        fetched = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            fetched.append(str(request.url))
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        for docid in range(3):
+            with pytest.raises(ContentRetrievalError):
+                await client.get_article(f"https://wol.jw.org/en/wol/d/r1/lp-e/{docid}")
+        await client.close()
+
+        assert len(fetched) == 2
+        breaker = client.get_cache_stats()["circuit_breakers"]["article"]
+        assert breaker["state"] == "open"
+        assert breaker["rejected"] == 1
+
+    async def test_stale_served_while_failing(
+        self, monkeypatch: pytest.MonkeyPatch, sample_article_html: str
+    ) -> None:
+        """Test that an expired cached article is served while upstream fails."""
+        monkeypatch.setattr(settings, "circuit_failure_threshold", 1)
+        responses = iter([httpx.Response(200, text=sample_article_html), httpx.Response(503)])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        fresh, _ = await client.get_article(ARTICLE_URL)
+        key = client._cache._make_key(*client.article_cache_key(ARTICLE_URL))
+        client._cache._cache[key].expires_at = time.monotonic() - 1
+        failed_over, metadata = await client.get_article(ARTICLE_URL)
+        rejected, rejected_metadata = await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert failed_over is fresh and rejected is fresh
+        assert metadata.stale and metadata.cache_hit
+        assert rejected_metadata.circuit_state == "open"
+        assert client.get_cache_stats()["stale_hits"] == 2
+
+    async def test_no_stale_for_not_found(self, sample_article_html: str) -> None:
+        """Test that an article gone upstream is not served stale."""
+        responses = iter([httpx.Response(200, text=sample_article_html), httpx.Response(404)])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client.get_article(ARTICLE_URL)
+        key = client._cache._make_key(*client.article_cache_key(ARTICLE_URL))
+        client._cache._cache[key].expires_at = time.monotonic() - 1
+        with pytest.raises(ContentRetrievalError):
+            await client.get_article(ARTICLE_URL)
+        await client.close()
+
+
+class TestHedging:
+    """Tests for hedged requests."""
+
+    @pytest.fixture(autouse=True)
+    def hedging(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Enable hedging after 10 ms."""
+        monkeypatch.setattr(settings, "hedge_requests", True)
+        monkeypatch.setattr(settings, "hedge_budget", 1.0)
+        monkeypatch.setattr(settings, "hedge_min_delay_seconds", 0.01)
+
+    @staticmethod
+    def slow_first_client(sample_article_html: str) -> tuple[JWOrgClient, list[str]]:
+        """Create a client whose first request hangs and whose later ones answer."""
+        fetched: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            fetched.append(str(request.url))
+            if len(fetched) == 1:
+                await asyncio.sleep(5)
+            return httpx.Response(200, text=sample_article_html)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        for _ in range(20):
+            client._latency.record("article", 0.005)
+        return client, fetched
+
+    async def test_slow_request_hedged(self, sample_article_html: str) -> None:
+        """Test that a request slower than the p95 latency is sent again."""
+        client, fetched = self.slow_first_client(sample_article_html)
+
+        start = time.perf_counter()
+        article, _ = await client.get_article(ARTICLE_URL)
+        elapsed = time.perf_counter() - start
+        await client.close()
+
+        assert article.title == "Peace and Security"
+        assert elapsed < 1
+        assert fetched == [ARTICLE_URL, ARTICLE_URL]
+        stats = client.get_cache_stats()
+        assert stats["hedged_requests"] == 1
+        assert stats["hedges_won"] == 1
+
+    async def test_no_hedge_without_budget(
+        self, monkeypatch: pytest.MonkeyPatch, sample_article_html: str
+    ) -> None:
+        """Test that no hedge is sent once the budget is spent."""
+        monkeypatch.setattr(settings, "hedge_budget", 0.0)
+        client, fetched = self.slow_first_client(sample_article_html)
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.2):
+                await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert fetched == [ARTICLE_URL]
+
+    def test_alternate_cdn(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that hedged CDN requests go to the alternate host."""
+        monkeypatch.setattr(settings, "cdn_alternate_base_url", "https://app.jw-cdn.org")
+
+        assert (
+            JWOrgClient._hedge_url("https://b.jw-cdn.org/apis/search/results/E/all?q=peace")
+            == "https://app.jw-cdn.org/apis/search/results/E/all?q=peace"
+        )
+        assert JWOrgClient._hedge_url(ARTICLE_URL) == ARTICLE_URL
+
+
+class TestStreamingArticles:
+    """Tests for reading article pages only up to the end of the article."""
+
+    @staticmethod
+    def page_client(sample_article_html: str, tail_chunks: int) -> tuple[JWOrgClient, list[int]]:
+        """Create a client serving the sample article followed by a long page tail."""
+        sent: list[int] = []
+
+        async def body() -> AsyncIterator[bytes]:
+            head, _, rest = sample_article_html.partition("</article>")
+            yield (head + "</article>").encode()
+            for i in range(tail_chunks):
+                sent.append(i)
+                yield b"<div>" + b"x" * 16384 + b"</div>"
+            yield rest.encode()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client, sent
+
+    async def test_long_tail_not_downloaded(self, sample_article_html: str) -> None:
+        """Test that the page download stops after the article."""
+        client, sent = self.page_client(sample_article_html, tail_chunks=100)
+
+        article, _ = await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert article.title == "Peace and Security"
+        assert len(sent) < 10
+        assert client.get_cache_stats()["pages_cut_short"] == 1
+
+    async def test_short_tail_read(self, sample_article_html: str) -> None:
+        """Test that a short page tail is read to the end."""
+        client, sent = self.page_client(sample_article_html, tail_chunks=2)
+
+        await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        assert len(sent) == 2
+        assert client.get_cache_stats()["pages_cut_short"] == 0
+
+    async def test_page_size_limit(
+        self, monkeypatch: pytest.MonkeyPatch, sample_article_html: str
+    ) -> None:
+        """Test that pages larger than the limit are rejected."""
+        monkeypatch.setattr(settings, "max_page_bytes", 100)
+        client, _ = self.page_client(sample_article_html, tail_chunks=0)
+
+        with pytest.raises(ContentRetrievalError, match="exceeds 100 bytes"):
+            await client.get_article(ARTICLE_URL)
+        await client.close()
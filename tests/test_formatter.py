@@ -0,0 +1,325 @@
+"""Tests for formatter module."""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from jw_org_mcp.formatter import ResponseFormatter, TextBuilder, budget_chars
+from jw_org_mcp.models import (
+    AlignedParagraph,
+    ArticleContent,
+    ArticleSection,
+    ContentChanges,
+    ParallelArticle,
+    PublicationIndex,
+    PublicationIndexEntry,
+    ResponseMetadata,
+    SearchResponse,
+    SearchResult,
+)
+
+
+@pytest.fixture
+def metadata() -> ResponseMetadata:
+    """Sample response metadata."""
+    return ResponseMetadata(
+        source_domain="wol.jw.org",
+        source_url="https://wol.jw.org/en/wol/d/r1/lp-e/1985720",
+        timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def article() -> ArticleContent:
+    """Sample article with ten paragraphs."""
+    return ArticleContent(
+        title="Peace and Security",
+        paragraphs=[f"Paragraph {i} " + "x" * 90 for i in range(1, 11)],
+        references=["1 Thessalonians 5:3"],
+        source_url="https://wol.jw.org/en/wol/d/r1/lp-e/1985720",
+    )
+
+
+class TestTextBuilder:
+    """Tests for TextBuilder."""
+
+    def test_build_joins_parts(self) -> None:
+        """Test that fragments are joined in order."""
+        builder = TextBuilder()
+        builder.add("a", "b")
+        builder.add("c")
+
+        assert builder.build() == "abc"
+        assert builder.size == 3
+
+    def test_fits_respects_budget(self) -> None:
+        """Test budget checks."""
+        builder = TextBuilder(max_chars=5)
+        builder.add("abc")
+
+        assert builder.fits("de")
+        assert not builder.fits("def")
+
+    def test_budget_chars(self) -> None:
+        """Test token to character conversion."""
+        assert budget_chars(0) is None
+        assert budget_chars(None) is None
+        assert budget_chars(10) == 40
+
+
+class TestResponseFormatter:
+    """Tests for ResponseFormatter."""
+
+    def test_full_article(self, article: ArticleContent, metadata: ResponseMetadata) -> None:
+        """Test formatting a whole article without a budget."""
+        text = ResponseFormatter.format_article(article, metadata)
+
+        assert text.startswith("# Peace and Security\n\n**Source:**")
+        assert "Paragraph 10 " in text
+        assert "## Scripture References" in text
+        assert "Truncated" not in text
+
+    def test_paragraph_range(self, article: ArticleContent, metadata: ResponseMetadata) -> None:
+        """Test selecting a paragraph range."""
+        text = ResponseFormatter.format_article(article, metadata, start=3, end=4)
+
+        assert "Paragraph 2 " not in text
+        assert "Paragraph 3 " in text
+        assert "Paragraph 4 " in text
+        assert "Paragraph 5 " not in text
+        assert "Scripture References" not in text
+
+    def test_truncation_cursor(self, article: ArticleContent, metadata: ResponseMetadata) -> None:
+        """Test that a budget truncates and points at the next paragraph."""
+        text = ResponseFormatter.format_article(article, metadata, max_chars=500)
+
+        assert "Paragraph 1 " in text
+        assert "Paragraph 10 " not in text
+        assert "`start=" in text
+
+        cursor = int(text.rsplit("`start=", 1)[1].split("`")[0])
+        rest = ResponseFormatter.format_article(article, metadata, start=cursor)
+        assert f"Paragraph {cursor} " in rest
+        assert "Paragraph 10 " in rest
+
+    def test_first_paragraph_always_included(
+        self, article: ArticleContent, metadata: ResponseMetadata
+    ) -> None:
+        """Test that a tiny budget still makes progress."""
+        text = ResponseFormatter.format_article(article, metadata, start=2, max_chars=1)
+
+        assert "Paragraph 2 " in text
+        assert "start=3" in text
+
+    def test_hint_repeats_selector(
+        self, article: ArticleContent, metadata: ResponseMetadata
+    ) -> None:
+        """Test that the continuation hint keeps the arguments selecting the range."""
+        text = ResponseFormatter.format_article(
+            article, metadata, start=2, end=6, selector='section="2"', max_chars=1
+        )
+        compact = ResponseFormatter.format_article(
+            article, metadata, selector="pid_start=2", compact=True, max_chars=1
+        )
+
+        assert 'Call get_article with `section="2", start=3` to continue.' in text
+        assert "continue with pid_start=2, start=2]" in compact
+
+    def test_range_past_end(self, article: ArticleContent, metadata: ResponseMetadata) -> None:
+        """Test a start beyond the last paragraph."""
+        text = ResponseFormatter.format_article(article, metadata, start=50)
+
+        assert "The requested range has no paragraphs (article has 10 paragraphs)." in text
+
+    def test_empty_range_same_in_both_formats(
+        self, article: ArticleContent, metadata: ResponseMetadata
+    ) -> None:
+        """Test that markdown and JSON report an empty range the same way."""
+        text = ResponseFormatter.format_article(article, metadata, start=5, end=2)
+        data = json.loads(ResponseFormatter.article_json(article, start=5, end=2))
+
+        assert data["paragraphs"] == []
+        assert (data["start"], data["end"], data["next_start"]) == (5, 4, None)
+        assert data["message"] in text
+        assert "Paragraph" not in text
+        assert "message" not in json.loads(ResponseFormatter.article_json(article, start=5))
+
+    def test_compact_article(self, article: ArticleContent, metadata: ResponseMetadata) -> None:
+        """Test that compact mode drops metadata headers."""
+        text = ResponseFormatter.format_article(article, metadata, compact=True)
+
+        assert "**Source:**" not in text
+        assert "References: 1 Thessalonians 5:3" in text
+
+    def test_search_budget(self, metadata: ResponseMetadata) -> None:
+        """Test truncation of search results."""
+        response = SearchResponse(
+            results=[
+                SearchResult(title=f"Result {i}", snippet="s" * 200, url="u", type="item")
+                for i in range(5)
+            ],
+            total=5,
+            page=1,
+            filter="all",
+            query="peace",
+        )
+
+        text = ResponseFormatter.format_search(response, metadata, max_chars=700)
+
+        assert "Result 0" in text
+        assert "Result 4" not in text
+        assert "**Truncated:**" in text
+
+    def test_publication_index_start(self, metadata: ResponseMetadata) -> None:
+        """Test continuing a publication index listing."""
+        index = PublicationIndex(
+            title="The Watchtower",
+            articles=[PublicationIndexEntry(title=f"Art {i}", url=f"u{i}") for i in range(1, 6)],
+            source_url="https://wol.jw.org/en/wol/publication/r1/lp-e/w24",
+        )
+
+        text = ResponseFormatter.format_publication_index(index, metadata, start=4)
+
+        assert "Art 3" not in text
+        assert "4. **Art 4**" in text
+        assert "5. **Art 5**" in text
+
+    def test_publication_index_json(self) -> None:
+        """Test that JSON publication indexes are paged within the budget."""
+        index = PublicationIndex(
+            title="The Watchtower",
+            articles=[
+                PublicationIndexEntry(title=f"Art {i}", url=f"https://wol.jw.org/{i}")
+                for i in range(1, 601)
+            ],
+            source_url="https://wol.jw.org/en/wol/publication/r1/lp-e/w24",
+        )
+
+        text = ResponseFormatter.publication_index_json(index, start=500, max_chars=400)
+        data = json.loads(text)
+
+        assert len(text) <= 400
+        assert data["articles"][0] == {"title": "Art 500", "url": "https://wol.jw.org/500"}
+        assert data["start"] == 500
+        assert data["next_start"] == data["end"] + 1 < 600
+        assert data["total"] == 600
+
+        whole = json.loads(ResponseFormatter.publication_index_json(index))
+        assert len(whole["articles"]) == whole["end"] == 600
+        assert whole["next_start"] is None
+
+    def test_section_outline(self, article: ArticleContent) -> None:
+        """Test the outline shown for an unknown section."""
+        article.sections = [ArticleSection(title="Why Peace Matters", start=3)]
+
+        text = ResponseFormatter.format_sections(article, "missing")
+
+        assert "No section matches 'missing'" in text
+        assert "1. Why Peace Matters (paragraph 4)" in text
+
+    def test_format_json(self, article: ArticleContent, metadata: ResponseMetadata) -> None:
+        """Test the JSON envelope."""
+        text = ResponseFormatter.format_json(article.model_dump_json(), metadata)
+
+        payload = json.loads(text)
+        assert payload["data"]["title"] == "Peace and Security"
+        assert payload["metadata"]["source_domain"] == "wol.jw.org"
+        assert text.startswith('{"data":{"title":')
+
+    def test_article_json_range(self, article: ArticleContent) -> None:
+        """Test serializing a paragraph range with 1-based section starts."""
+        article.pids = list(range(1, 11))
+        article.sections = [
+            ArticleSection(title="A", start=0),
+            ArticleSection(title="B", start=5),
+        ]
+
+        data = json.loads(ResponseFormatter.article_json(article, start=5, end=7))
+
+        assert len(data["paragraphs"]) == 3
+        assert data["paragraphs"][0].startswith("Paragraph 5 ")
+        assert data["pids"] == [5, 6, 7]
+        assert data["sections"] == [{"title": "B", "start": 6}]
+        assert (data["start"], data["end"], data["total"], data["next_start"]) == (5, 7, 10, None)
+        assert len(article.paragraphs) == 10
+
+    def test_article_json_budget(self, article: ArticleContent) -> None:
+        """Test that JSON output stops at the budget with a continuation point."""
+        text = ResponseFormatter.article_json(article, max_chars=600)
+        data = json.loads(text)
+
+        assert len(text) <= 600
+        assert len(data["paragraphs"]) == data["end"] == 3
+        assert data["next_start"] == 4
+
+        rest = json.loads(ResponseFormatter.article_json(article, start=4, max_chars=1))
+        assert rest["paragraphs"][0].startswith("Paragraph 4 ")
+        assert rest["next_start"] == 5
+
+    def test_section_outline_json(self, article: ArticleContent) -> None:
+        """Test that the JSON section outline numbers paragraphs from 1."""
+        article.sections = [ArticleSection(title="Why Peace Matters", start=3)]
+
+        assert ResponseFormatter.section_outline(article) == [
+            {"title": "Why Peace Matters", "start": 4}
+        ]
+
+    def test_parallel_article(self, metadata: ResponseMetadata) -> None:
+        """Test side-by-side paragraphs, unavailable languages and truncation."""
+        parallel = ParallelArticle(
+            languages=["E", "S"],
+            titles={"E": "Peace", "S": "Paz"},
+            source_urls={"E": "https://e", "S": "https://s"},
+            paragraphs=[
+                AlignedParagraph(pid=pid, texts={"E": "x" * 200, "S": "y" * 200})
+                for pid in range(1, 6)
+            ],
+            errors={"F": "Failed to fetch article"},
+        )
+
+        text = ResponseFormatter.format_parallel_article(parallel, metadata, max_chars=1200)
+
+        assert text.startswith("# Peace / Paz\n")
+        assert "**Unavailable (F):** Failed to fetch article" in text
+        assert "¶1\n[E] " + "x" * 200 + "\n[S] " in text
+        assert "Call get_parallel_article with `start=3`" in text
+
+        rest = ResponseFormatter.format_parallel_article(parallel, metadata, start=3, compact=True)
+        assert "¶3\n" in rest
+        assert "¶2\n" not in rest
+        assert "**Source" not in rest
+
+    def test_parallel_article_json(self) -> None:
+        """Test that JSON parallel articles are paged within the budget."""
+        parallel = ParallelArticle(
+            languages=["E", "S"],
+            titles={"E": "Peace", "S": "Paz"},
+            source_urls={"E": "https://e", "S": "https://s"},
+            paragraphs=[
+                AlignedParagraph(pid=pid, texts={"E": "x" * 200, "S": "y" * 200})
+                for pid in range(1, 6)
+            ],
+        )
+
+        text = ResponseFormatter.parallel_article_json(parallel, start=2, max_chars=1200)
+        data = json.loads(text)
+
+        assert len(text) <= 1200
+        assert [p["pid"] for p in data["paragraphs"]] == [2, 3]
+        assert (data["start"], data["end"], data["total"], data["next_start"]) == (2, 3, 5, 4)
+        assert data["titles"] == {"E": "Peace", "S": "Paz"}
+
+        rest = json.loads(ResponseFormatter.parallel_article_json(parallel, start=4))
+        assert [p["pid"] for p in rest["paragraphs"]] == [4, 5]
+        assert rest["next_start"] is None
+
+    def test_revised_paragraphs(self, article: ArticleContent, metadata: ResponseMetadata) -> None:
+        """Test the header line listing paragraphs revised since the last fetch."""
+        metadata.changes = ContentChanges(changed=[2, 5], removed=[9])
+
+        text = ResponseFormatter.format_article(article, metadata)
+        compact = ResponseFormatter.format_article(article, metadata, compact=True)
+
+        assert "**Revised Paragraphs:** changed 2, 5; removed 9\n" in text
+        assert "Revised" not in compact
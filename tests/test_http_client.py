@@ -0,0 +1,145 @@
+"""Tests for http_client module."""
+
+import gzip
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from jw_org_mcp import http_client
+from jw_org_mcp.client import JWOrgClient
+from jw_org_mcp.config import settings
+from jw_org_mcp.exceptions import ContentRetrievalError
+from jw_org_mcp.http_client import (
+    Cassette,
+    CassetteMissError,
+    RecordingTransport,
+    ReplayTransport,
+    configured_timeout,
+    create_http_client,
+)
+
+ARTICLE_URL = "https://wol.jw.org/en/wol/d/r1/lp-e/1985720"
+
+
+@pytest.fixture(autouse=True)
+def fresh_cassettes() -> Iterator[None]:
+    """Forget cassettes loaded by other tests."""
+    http_client._cassettes.clear()
+    yield
+    http_client._cassettes.clear()
+
+
+async def record(path: Path, responses: list[httpx.Response]) -> None:
+    """Record one GET of ARTICLE_URL per response into a cassette."""
+    pending = iter(responses)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return next(pending)
+
+    cassette = Cassette(path)
+    transport = RecordingTransport(httpx.MockTransport(handler), cassette)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in responses:
+            await client.get(ARTICLE_URL)
+
+
+class TestCassette:
+    """Tests for recording and replaying cassettes."""
+
+    async def test_record_and_replay(self, tmp_path: Path) -> None:
+        """Test that replay returns the recorded, decoded response."""
+        path = tmp_path / "session.json.gz"
+        await record(
+            path,
+            [
+                httpx.Response(
+                    200,
+                    headers={"Content-Encoding": "gzip", "Content-Type": "text/html"},
+                    content=gzip.compress(b"<html>Peace</html>"),
+                )
+            ],
+        )
+
+        replay = ReplayTransport(Cassette(path))
+        async with httpx.AsyncClient(transport=replay) as client:
+            response = await client.get(ARTICLE_URL)
+
+        assert response.status_code == 200
+        assert response.text == "<html>Peace</html>"
+        assert response.headers["content-type"] == "text/html"
+        assert "content-encoding" not in response.headers
+
+    async def test_repeated_requests_replay_in_order(self, tmp_path: Path) -> None:
+        """Test that repeated requests get their recorded responses in order."""
+        path = tmp_path / "session.json.gz"
+        await record(path, [httpx.Response(503), httpx.Response(200, text="ok")])
+
+        replay = ReplayTransport(Cassette(path))
+        async with httpx.AsyncClient(transport=replay) as client:
+            statuses = [(await client.get(ARTICLE_URL)).status_code for _ in range(3)]
+
+        assert statuses == [503, 200, 200]
+
+    async def test_unrecorded_request(self, tmp_path: Path) -> None:
+        """Test that an unrecorded request fails like a network error."""
+        replay = ReplayTransport(Cassette(tmp_path / "empty.json.gz"))
+        async with httpx.AsyncClient(transport=replay) as client:
+            with pytest.raises(CassetteMissError):
+                await client.get(ARTICLE_URL)
+
+    async def test_replay_latency(self, tmp_path: Path) -> None:
+        """Test replaying a fraction of the recorded latency."""
+        path = tmp_path / "session.json.gz"
+        cassette = Cassette(path)
+        cassette.add(httpx.Request("GET", ARTICLE_URL), httpx.Response(200), b"", elapsed=0.4)
+
+        replay = ReplayTransport(cassette, latency_scale=0.25)
+        async with httpx.AsyncClient(transport=replay) as client:
+            start = time.perf_counter()
+            await client.get(ARTICLE_URL)
+
+        assert time.perf_counter() - start >= 0.09
+
+
+class TestCreateHttpClient:
+    """Tests for client construction in cassette modes."""
+
+    async def test_client_replays_cassette(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sample_article_html: str
+    ) -> None:
+        """Test that JWOrgClient runs hermetically from a cassette."""
+        path = tmp_path / "session.json.gz"
+        await record(path, [httpx.Response(200, text=sample_article_html)])
+        monkeypatch.setattr(settings, "cassette_mode", "replay")
+        monkeypatch.setattr(settings, "cassette_path", str(path))
+
+        client = JWOrgClient()
+        article, _ = await client.get_article(ARTICLE_URL)
+        with pytest.raises(ContentRetrievalError):
+            await client.get_article(ARTICLE_URL + "1")
+        await client.close()
+
+        assert article.title == "Peace and Security"
+
+    def test_requires_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that record and replay modes need a cassette path."""
+        monkeypatch.setattr(settings, "cassette_mode", "record")
+        monkeypatch.setattr(settings, "cassette_path", "")
+
+        with pytest.raises(ValueError):
+            create_http_client()
+
+    def test_phase_timeouts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that each request phase gets its configured timeout."""
+        monkeypatch.setattr(settings, "connect_timeout", 2.0)
+        monkeypatch.setattr(settings, "read_timeout", 8.0)
+
+        timeout = configured_timeout()
+
+        assert timeout.connect == 2.0
+        assert timeout.read == 8.0
+        assert timeout.pool == settings.pool_timeout
+        assert timeout.write == settings.request_timeout
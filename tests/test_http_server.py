@@ -0,0 +1,101 @@
+"""Load tests for the HTTP transport: many concurrent clients, one process."""
+
+import asyncio
+import socket
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+import pytest
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+from mcp.types import TextContent
+
+from jw_org_mcp import server
+from jw_org_mcp.client import JWOrgClient
+from jw_org_mcp.config import settings
+from jw_org_mcp.http_server import create_uvicorn_server
+from jw_org_mcp.models import ArticleContent, ResponseMetadata
+
+ARTICLE_URL = "https://wol.jw.org/en/wol/d/r1/lp-e/1985720"
+
+
+@pytest.fixture
+def listening_socket() -> socket.socket:
+    """A socket bound to a free local port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    return sock
+
+
+@pytest.fixture
+def shared_client() -> Iterator[JWOrgClient]:
+    """A fresh shared server client, replaced by the previous one after the test."""
+    previous = server._client
+    server._client = JWOrgClient()
+    yield server._client
+    server._client = previous
+
+
+async def test_concurrent_sessions_share_client(
+    listening_socket: socket.socket, shared_client: JWOrgClient
+) -> None:
+    """Many concurrent sessions are served from one shared, pre-warmed cache."""
+    client = shared_client
+    client._cache.set(
+        *client.article_cache_key(ARTICLE_URL),
+        value=(
+            ArticleContent(
+                title="Peace and Security",
+                paragraphs=["The world has long sought peace."],
+                source_url=ARTICLE_URL,
+            ),
+            ResponseMetadata(
+                source_domain="wol.jw.org",
+                source_url=ARTICLE_URL,
+                timestamp=datetime.now(UTC),
+            ),
+        ),
+    )
+
+    uvicorn_server = create_uvicorn_server()
+    uvicorn_server.config.log_level = "warning"
+    serve_task = asyncio.create_task(uvicorn_server.serve(sockets=[listening_socket]))
+    while not uvicorn_server.started:
+        await asyncio.sleep(0.01)
+
+    assert server._maintenance_task is not None
+    port = listening_socket.getsockname()[1]
+    url = f"http://127.0.0.1:{port}{settings.http_path}"
+    sessions, calls_per_session = 20, 5
+
+    async def run_session() -> list[str]:
+        texts = []
+        async with streamable_http_client(url) as (read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                for _ in range(calls_per_session):
+                    result = await session.call_tool("get_article", {"url": ARTICLE_URL})
+                    content = result.content[0]
+                    assert isinstance(content, TextContent)
+                    texts.append(content.text)
+        return texts
+
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(run_session() for _ in range(sessions))), timeout=60
+        )
+    finally:
+        # Graceful shutdown runs the lifespan, which closes the shared client
+        uvicorn_server.should_exit = True
+        await asyncio.wait_for(serve_task, timeout=30)
+
+    texts = [text for session_texts in results for text in session_texts]
+    assert len(texts) == sessions * calls_per_session
+    assert all(text.startswith("# Peace and Security") for text in texts)
+
+    stats = client.get_cache_stats()
+    assert stats["misses"] == 0
+    assert stats["hits"] == sessions * calls_per_session
+    assert client._http_client is None
+    assert server._maintenance_task is None
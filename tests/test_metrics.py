@@ -0,0 +1,132 @@
+"""Tests for metrics module."""
+
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from jw_org_mcp import server
+from jw_org_mcp.client import JWOrgClient
+from jw_org_mcp.config import settings
+from jw_org_mcp.metrics import Metrics, metrics, span
+
+ARTICLE_URL = "https://wol.jw.org/en/wol/d/r1/lp-e/1985720"
+
+
+@pytest.fixture
+def enabled_metrics() -> Iterator[Metrics]:
+    """The global registry, enabled and empty for the duration of a test."""
+    metrics.reset()
+    metrics.enabled = True
+    yield metrics
+    metrics.enabled = False
+    metrics.reset()
+
+
+class TestMetrics:
+    """Tests for the metrics registry."""
+
+    def test_disabled_records_nothing(self) -> None:
+        """Test that a disabled registry is a no-op."""
+        registry = Metrics(enabled=False)
+
+        registry.inc("calls_total", tool="a")
+        with registry.timer("duration_seconds", "calls_total", tool="a"):
+            pass
+
+        assert registry.get_counter("calls_total", tool="a") == 0
+        assert registry.render_prometheus() == ""
+
+    def test_timer_counts_outcome(self) -> None:
+        """Test that timers record a duration and count the outcome."""
+        registry = Metrics(enabled=True)
+
+        with registry.timer("duration_seconds", "calls_total", tool="a"):
+            pass
+        with registry.timer("duration_seconds", "calls_total", tool="a") as timer:
+            timer.status = "404"
+        with (
+            pytest.raises(RuntimeError),
+            registry.timer("duration_seconds", "calls_total", tool="a"),
+        ):
+            raise RuntimeError("boom")
+
+        assert registry.get_histogram_count("duration_seconds", tool="a") == 3
+        assert registry.get_counter("calls_total", tool="a", status="ok") == 1
+        assert registry.get_counter("calls_total", tool="a", status="404") == 1
+        assert registry.get_counter("calls_total", tool="a", status="error") == 1
+
+    def test_prometheus_exposition(self) -> None:
+        """Test the Prometheus text format."""
+        registry = Metrics(enabled=True, buckets=(0.1, 1.0))
+
+        registry.inc("jworg_tool_calls_total", tool="get_article", status="ok")
+        registry.observe("jworg_tool_duration_seconds", 0.5, tool="get_article")
+        registry.observe("jworg_tool_duration_seconds", 2.0, tool="get_article")
+
+        assert registry.render_prometheus() == (
+            "# HELP jworg_tool_calls_total MCP tool calls by tool and outcome\n"
+            "# TYPE jworg_tool_calls_total counter\n"
+            'jworg_tool_calls_total{status="ok",tool="get_article"} 1\n'
+            "# HELP jworg_tool_duration_seconds MCP tool call latency\n"
+            "# TYPE jworg_tool_duration_seconds histogram\n"
+            'jworg_tool_duration_seconds_bucket{tool="get_article",le="0.1"} 0\n'
+            'jworg_tool_duration_seconds_bucket{tool="get_article",le="1"} 1\n'
+            'jworg_tool_duration_seconds_bucket{tool="get_article",le="+Inf"} 2\n'
+            'jworg_tool_duration_seconds_sum{tool="get_article"} 2.5\n'
+            'jworg_tool_duration_seconds_count{tool="get_article"} 2\n'
+        )
+
+    def test_label_escaping(self) -> None:
+        """Test that label values are escaped."""
+        registry = Metrics(enabled=True)
+
+        registry.inc("errors_total", message='say "hi"\n')
+
+        assert 'errors_total{message="say \\"hi\\"\\n"} 1' in registry.render_prometheus()
+
+
+def test_span(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test spans with tracing disabled and enabled."""
+    monkeypatch.setattr(settings, "tracing_enabled", False)
+    with span("test") as active:
+        assert active is not None
+
+    monkeypatch.setattr(settings, "tracing_enabled", True)
+    with span("test", attribute="value"):
+        pass
+
+
+class TestInstrumentation:
+    """Tests for metrics recorded by the server and client."""
+
+    async def test_article_fetch(self, enabled_metrics: Metrics, sample_article_html: str) -> None:
+        """Test metrics recorded while fetching and re-reading an article."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=sample_article_html)
+
+        client = JWOrgClient()
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client.get_article(ARTICLE_URL)
+        await client.get_article(ARTICLE_URL)
+        await client.close()
+
+        counter = enabled_metrics.get_counter
+        assert counter("jworg_upstream_requests_total", endpoint="article", status="200") == 1
+        assert counter("jworg_cache_requests_total", tier="local", result="miss") == 1
+        assert counter("jworg_cache_requests_total", tier="local", result="hit") == 1
+        histogram_count = enabled_metrics.get_histogram_count
+        assert histogram_count("jworg_parse_duration_seconds", stage="article") == 1
+
+    async def test_tool_calls(self, enabled_metrics: Metrics) -> None:
+        """Test that tool calls are counted by tool and outcome."""
+        await server.call_tool("get_cache_stats", {})
+        await server.call_tool("no_such_tool", {})
+
+        counter = enabled_metrics.get_counter
+        assert counter("jworg_tool_calls_total", tool="get_cache_stats", status="ok") == 1
+        assert counter("jworg_tool_calls_total", tool="unknown", status="error") == 1
+        histogram_count = enabled_metrics.get_histogram_count
+        assert histogram_count("jworg_tool_duration_seconds", tool="get_cache_stats") == 1
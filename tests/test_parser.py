@@ -1,7 +1,17 @@
 """Tests for parser module."""
 
+import re
 
-from jw_org_mcp.parser import ArticleParser, QueryParser, SearchResponseParser
+import pytest
+
+from jw_org_mcp.models import ArticleContent, PublicationIndex, SearchResult
+from jw_org_mcp.parser import (
+    ArticleEndDetector,
+    ArticleParser,
+    QueryParser,
+    SearchResponseParser,
+    _extract_search_terms,
+)
 
 
 class TestQueryParser:
@@ -36,6 +46,90 @@ class TestQueryParser:
         assert result == "what is it"
 
 
+def _legacy_extract_search_terms(query: str) -> str:
+    """Reference implementation: one re.sub per pattern, in order."""
+    cleaned = query.strip().lower()
+    for pattern in QueryParser.QUESTION_PATTERNS:
+        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+    cleaned = cleaned.rstrip("?.!")
+    if not cleaned or len(cleaned) < 3:
+        return query.strip()
+    return cleaned.strip()
+
+
+PARITY_QUERIES = [
+    "love",
+    "  Peace and Security  ",
+    "What does the Bible say about peace and security?",
+    "What do the Bible say about hope",
+    "What does Jesus say about forgiveness?",
+    "what does the book of Psalms say about   trust?!",
+    "What does the Bible say about how do I pray?",
+    "Tell me about how do I pray",
+    "Explain tell me about the ransom",
+    "explain find information about baptism",
+    "How can I find true happiness?",
+    "Why does God permit suffering?",
+    "When will the end come?",
+    "Where can I find comfort?",
+    "Who was Abraham?",
+    "Find information about the Kingdom.",
+    "What is it?",
+    "why do",
+    "How",
+    "?!",
+    "",
+    "WHAT IS THE BIBLE SAY ABOUT ANGELS",
+    "whatdoes the bible say about x",
+    "what does say about",
+    "Explain\tthe\nresurrection",
+    "Tell me about Jehovah's love",
+]
+
+
+class TestQueryParserParity:
+    """The precompiled matcher must behave exactly like the sequential re.sub loop."""
+
+    @pytest.mark.parametrize("query", PARITY_QUERIES)
+    def test_matches_legacy(self, query: str) -> None:
+        """Test parity with the legacy implementation."""
+        assert QueryParser.extract_search_terms(query) == _legacy_extract_search_terms(query)
+
+    def test_memoized(self) -> None:
+        """Test that repeated queries are served from the memo."""
+        QueryParser.extract_search_terms("What does the Bible say about memo test?")
+        before = _extract_search_terms.cache_info().hits
+        QueryParser.extract_search_terms("What does the Bible say about memo test?")
+
+        assert _extract_search_terms.cache_info().hits == before + 1
+
+    def test_spanish_patterns(self) -> None:
+        """Test Spanish question patterns."""
+        result = QueryParser.extract_search_terms("¿Qué dice la Biblia sobre el amor?", "S")
+        assert result == "el amor"
+
+    def test_french_patterns(self) -> None:
+        """Test French question patterns."""
+        result = QueryParser.extract_search_terms("Pourquoi Dieu permet-il la souffrance ?", "F")
+        assert result == "dieu permet-il la souffrance"
+
+    @pytest.mark.parametrize(
+        ("query", "language", "expected"),
+        [
+            ("Was sagt die Bibel über den Frieden?", "X", "den frieden"),
+            ("O que a Bíblia diz sobre a oração?", "T", "a oração"),
+            ("Che cosa dice la Bibbia sulla preghiera?", "I", "preghiera"),
+        ],
+    )
+    def test_other_language_patterns(self, query: str, language: str, expected: str) -> None:
+        """Test German, Portuguese and Italian question patterns."""
+        assert QueryParser.extract_search_terms(query, language) == expected
+
+    def test_unknown_language_uses_english(self) -> None:
+        """Test fallback to English patterns."""
+        assert QueryParser.extract_search_terms("Tell me about prayer", "Z") == "prayer"
+
+
 class TestSearchResponseParser:
     """Tests for SearchResponseParser."""
 
@@ -106,6 +200,112 @@ class TestSearchResponseParser:
         assert "<strong>" not in results[0].snippet
         assert "Peace" in results[0].snippet
 
+    def test_results_match_validated_models(self) -> None:
+        """Test that results built without validation equal validated ones."""
+        item = {
+            "type": "item",
+            "subtype": "article",
+            "title": "Peace and Security",
+            "snippet": "The need for peace...",
+            "links": {"wol": "https://wol.jw.org/..."},
+            "context": "The Watchtower (1985)",
+            "insight": {"rank": 2},
+        }
+
+        (result,) = SearchResponseParser.parse_search_results({"results": [item]}, "peace", "all")
+        validated = SearchResult(
+            title="Peace and Security",
+            snippet="The need for peace...",
+            url="https://wol.jw.org/...",
+            type="item",
+            subtype="article",
+            context="The Watchtower (1985)",
+            publication="The Watchtower",
+            year=1985,
+            rank=2,
+        )
+
+        assert result == validated
+        assert result.model_dump_json() == validated.model_dump_json()
+        assert result.model_copy(update={"rank": 3}).rank == 3
+        assert result.rank == 2
+
+    def test_fields_set_unchanged_by_updates(self) -> None:
+        """Test that updating one result leaves the fields set shared with others intact."""
+        items = [{"type": "item", "title": f"Result {i}", "links": {"wol": "u"}} for i in range(2)]
+        first, second = SearchResponseParser.parse_search_results(
+            {"results": items}, "peace", "all"
+        )
+        fields_set = set(second.model_fields_set)
+
+        first.rank = 5
+        copy = first.model_copy(update={"year": 2024})
+        copy.title = "Copy"
+
+        assert second.model_fields_set == fields_set == set(SearchResult.model_fields)
+        assert copy.model_fields_set is not first.model_fields_set
+        assert second.model_dump(exclude_unset=True) == second.model_dump()
+
+    def test_repeated_strings_are_shared(self) -> None:
+        """Test that type, subtype and publication strings are interned."""
+        items = [
+            {
+                "type": "".join(["it", "em"]),
+                "subtype": "".join(["arti", "cle"]),
+                "title": f"Result {i}",
+                "snippet": "",
+                "links": {"wol": f"https://wol.jw.org/{i}"},
+                "context": "".join(["The Watchtower ", "(1985)"]),
+            }
+            for i in range(2)
+        ]
+
+        first, second = SearchResponseParser.parse_search_results(
+            {"results": items}, "peace", "all"
+        )
+
+        assert first.type is second.type
+        assert first.subtype is second.subtype
+        assert first.publication is second.publication
+
+    def test_skip_invalid_items(self) -> None:
+        """Test that items with wrongly typed fields are skipped."""
+        items = [
+            {"type": "item", "title": 42, "links": {"wol": "https://wol.jw.org/1"}},
+            {"type": "item", "title": "Ok", "insight": {"rank": "first"}},
+            {"type": "item", "title": "Valid", "links": {"wol": "https://wol.jw.org/2"}},
+        ]
+
+        results = SearchResponseParser.parse_search_results({"results": items}, "peace", "all")
+
+        assert [r.title for r in results] == ["Valid"]
+
+
+class TestArticleEndDetector:
+    """Tests for ArticleEndDetector."""
+
+    def test_detects_article_end(self) -> None:
+        """Test that the end is reported once the article container closes."""
+        page = (
+            b'<html><body><article class="related"><p>Other</p></article>'
+            b'<article id="article"><h1>Title</h1><article><p>Nested</p></article>'
+            b'<p data-pid="1">Text</p></article><footer>Footer</footer></body></html>'
+        )
+        end = page.index(b"</article><footer>")
+        detector = ArticleEndDetector()
+
+        assert detector.feed(page[:end]) is False
+        assert detector.feed(page[end : end + 20]) is True
+        assert detector.done
+        assert detector._parser is None
+
+    def test_page_without_article(self) -> None:
+        """Test that pages without an article container never end early."""
+        detector = ArticleEndDetector("utf-8")
+
+        assert detector.feed(b"<html><body><h1>Index</h1><ul><li>x</li></ul>") is False
+        assert detector.feed(b"</body></html>") is False
+
 
 class TestArticleParser:
     """Tests for ArticleParser."""
@@ -165,3 +365,54 @@ class TestArticleParser:
 
         assert len(article.paragraphs) == 1
         assert article.paragraphs[0] == "Content paragraph."
+
+    def test_paragraph_index(self) -> None:
+        """Test that data-pids and subheadings are indexed."""
+        html = """
+        <html>
+            <article id="article">
+                <h1>Test</h1>
+                <p data-pid="1">Intro.</p>
+                <h2 data-pid="2">First Heading</h2>
+                <p data-pid="3">One.</p>
+                <p data-pid="4" class="caption">Caption.</p>
+                <p data-pid="5">Two.</p>
+                <h3>Second Heading</h3>
+                <p data-pid="7">Three.</p>
+            </article>
+        </html>
+        """
+
+        article = ArticleParser.parse_article(html, "https://test.com")
+
+        assert isinstance(article, ArticleContent)
+        assert article.pids == [1, 3, 5, 7]
+        assert [s.title for s in article.sections] == ["First Heading", "Second Heading"]
+        assert [s.start for s in article.sections] == [1, 3]
+
+        section, start, end = article.find_section("first")
+        assert section.title == "First Heading"
+        assert (start, end) == (2, 3)
+        assert article.find_section("2")[1:] == (4, 4)
+        assert article.find_section("missing") is None
+
+        assert article.pid_range(3, 5) == (2, 3)
+        assert article.pid_range(6, None) == (4, 4)
+
+    def test_index_links_follow_page_host(self) -> None:
+        """Test that index entries resolve against the page's host and language."""
+        html = """
+        <html><article id="article">
+            <h1>Índice</h1>
+            <a href="/es/wol/d/r4/lp-s/2024101">Primer artículo</a>
+            <a href="/es/wol/d/r4/lp-s/2024102#h=1">Segundo artículo</a>
+        </article></html>
+        """
+
+        index = ArticleParser.parse_article(html, "http://127.0.0.1:8791/es/wol/d/r4/lp-s/2024100")
+
+        assert isinstance(index, PublicationIndex)
+        assert [entry.url for entry in index.articles] == [
+            "http://127.0.0.1:8791/es/wol/d/r4/lp-s/2024101",
+            "http://127.0.0.1:8791/es/wol/d/r4/lp-s/2024102#h=1",
+        ]
@@ -0,0 +1,172 @@
+"""Tests for resilience module."""
+
+import time
+
+import pytest
+
+from jw_org_mcp.exceptions import CircuitOpenError
+from jw_org_mcp.resilience import (
+    CircuitBreaker,
+    CircuitBreakers,
+    HedgeBudget,
+    LatencyTracker,
+    is_failure_status,
+)
+
+
+def open_breaker(reset_seconds: float = 60) -> CircuitBreaker:
+    """Create a breaker and open it with three failures."""
+    breaker = CircuitBreaker("search", failure_threshold=3, reset_seconds=reset_seconds)
+    for _ in range(3):
+        breaker.record_failure()
+    return breaker
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self) -> None:
+        """Test that failures open the breaker."""
+        breaker = CircuitBreaker("search", failure_threshold=3, reset_seconds=60)
+        for _ in range(2):
+            breaker.record_failure()
+        breaker.check()
+
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        stats = breaker.get_stats()
+        assert stats["opened"] == 1
+        assert stats["rejected"] == 1
+
+    def test_failure_rate(self) -> None:
+        """Test that failures among mostly successful calls keep it closed."""
+        breaker = CircuitBreaker("search", failure_threshold=3, failure_rate=0.5, window=10)
+        for _ in range(7):
+            breaker.record_success()
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == "closed"
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == "open"
+
+    def test_slow_calls_count_as_failures(self) -> None:
+        """Test that slow successful calls open the breaker."""
+        breaker = CircuitBreaker("article", failure_threshold=2, slow_call_seconds=1.0)
+        breaker.record_success(elapsed=1.5)
+        breaker.record_success(elapsed=2.0)
+
+        assert breaker.state == "open"
+        assert breaker.get_stats()["slow_calls"] == 2
+
+    def test_half_open_allows_one_probe(self) -> None:
+        """Test that after the cooldown a single probe is let through."""
+        breaker = open_breaker(reset_seconds=0.02)
+        time.sleep(0.03)
+
+        assert breaker.state == "half_open"
+        breaker.check()
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+    def test_failed_probe_reopens(self) -> None:
+        """Test that a failed probe opens the breaker again."""
+        breaker = open_breaker(reset_seconds=0.02)
+        time.sleep(0.03)
+        breaker.check()
+
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.get_stats()["opened"] == 1
+
+    def test_successful_probe_closes(self) -> None:
+        """Test that a successful probe closes the breaker."""
+        breaker = open_breaker(reset_seconds=0.02)
+        time.sleep(0.03)
+        breaker.check()
+
+        breaker.record_success()
+
+        assert breaker.state == "closed"
+        breaker.check()
+        assert breaker.get_stats()["failures"] == 0
+
+    def test_record_response(self) -> None:
+        """Test that only failure statuses count as failures."""
+        breaker = CircuitBreaker("article", failure_threshold=1)
+        breaker.record_response(404, 0.1)
+        assert breaker.state == "closed"
+
+        breaker.record_response(503, 0.1)
+        assert breaker.state == "open"
+
+    def test_failure_statuses(self) -> None:
+        """Test which statuses show a failing endpoint."""
+        assert is_failure_status(429)
+        assert is_failure_status(502)
+        assert not is_failure_status(200)
+        assert not is_failure_status(404)
+
+
+class TestCircuitBreakers:
+    """Tests for the per-endpoint registry."""
+
+    def test_breaker_per_endpoint(self) -> None:
+        """Test that each endpoint gets its own breaker."""
+        breakers = CircuitBreakers(failure_threshold=1, reset_seconds=60)
+        breakers.get("search").record_failure()
+
+        assert breakers.get("search") is breakers.get("search")
+        breakers.get("article").check()
+        assert list(breakers.get_stats()) == ["article", "search"]
+        assert breakers.get_stats()["search"]["state"] == "open"
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker."""
+
+    def test_quantile(self) -> None:
+        """Test quantiles over the recent window."""
+        tracker = LatencyTracker(window=100, min_samples=10)
+        for ms in range(1, 101):
+            tracker.record("search", ms / 1000)
+
+        assert tracker.quantile("search", 0.95) == 0.096
+        assert tracker.quantile("search", 1.0) == 0.1
+        assert tracker.get_stats()["search"] == {"samples": 100, "p50_ms": 51.0, "p95_ms": 96.0}
+
+    def test_too_few_samples(self) -> None:
+        """Test that no quantile is reported before enough calls."""
+        tracker = LatencyTracker(min_samples=10)
+        tracker.record("article", 0.2)
+
+        assert tracker.quantile("article", 0.95) is None
+        assert tracker.quantile("search", 0.95) is None
+        assert tracker.get_stats() == {"article": {"samples": 1}}
+
+
+class TestHedgeBudget:
+    """Tests for HedgeBudget."""
+
+    def test_ratio(self) -> None:
+        """Test that hedges are limited to the ratio of requests."""
+        budget = HedgeBudget(0.25)
+        allowed = 0
+        for _ in range(20):
+            budget.deposit()
+            allowed += budget.withdraw()
+
+        assert allowed == 5
+
+    def test_burst(self) -> None:
+        """Test that saved up budget is capped."""
+        budget = HedgeBudget(1.0, burst=2)
+        for _ in range(10):
+            budget.deposit()
+
+        assert [budget.withdraw() for _ in range(3)] == [True, True, False]
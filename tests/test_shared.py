@@ -0,0 +1,195 @@
+"""Tests for state shared between worker processes."""
+
+import asyncio
+import os
+import sqlite3
+import stat
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from jw_org_mcp import workers
+from jw_org_mcp.auth import AuthManager
+from jw_org_mcp.cache import Cache
+from jw_org_mcp.client import JWOrgClient
+from jw_org_mcp.codec import decode_value, encode_value
+from jw_org_mcp.config import settings
+from jw_org_mcp.models import ArticleContent, JWTToken, ResponseMetadata
+from jw_org_mcp.shared import SharedCacheStore, SharedTokenStore
+
+
+@pytest.fixture
+def cached_article() -> tuple[ArticleContent, ResponseMetadata]:
+    """A cached get_article value."""
+    url = "https://wol.jw.org/en/wol/d/r1/lp-e/1985720"
+    return (
+        ArticleContent(title="Peace", paragraphs=["One.", "Two."], source_url=url, pids=[1, 2]),
+        ResponseMetadata(source_domain="wol.jw.org", source_url=url, timestamp=datetime.now(UTC)),
+    )
+
+
+@pytest.fixture
+def open_store(tmp_path: Path) -> Iterator[Callable[[], SharedCacheStore]]:
+    """Open connections to one shared cache database, closed after the test."""
+    stores: list[SharedCacheStore] = []
+
+    def open_store() -> SharedCacheStore:
+        stores.append(SharedCacheStore(tmp_path / "cache.sqlite3"))
+        return stores[-1]
+
+    yield open_store
+    for store in stores:
+        store.close()
+
+
+class TestCodec:
+    """Tests for the cache value codec."""
+
+    def test_roundtrip(self, cached_article: tuple[ArticleContent, ResponseMetadata]) -> None:
+        """Test encoding and decoding a cached tuple."""
+        encoded = encode_value(cached_article)
+
+        assert encoded is not None
+        assert decode_value(encoded) == cached_article
+
+    def test_unsupported_value(self) -> None:
+        """Test that values other than registered models are not encoded."""
+        assert encode_value("plain string") is None
+        assert encode_value(({"a": 1},)) is None
+
+    def test_invalid_data(self) -> None:
+        """Test decoding garbage."""
+        with pytest.raises(ValueError):
+            decode_value(b'{"k":"model","items":[{"t":"Unknown","v":{}}]}')
+
+
+class TestSharedCache:
+    """Tests for the shared cache tier."""
+
+    def test_value_visible_to_other_worker(
+        self,
+        open_store: Callable[[], SharedCacheStore],
+        cached_article: tuple[ArticleContent, ResponseMetadata],
+    ) -> None:
+        """Test that a value set by one worker is served to another."""
+        worker_a = Cache(ttl_seconds=60, shared=open_store())
+        worker_b = Cache(ttl_seconds=60, shared=open_store())
+
+        worker_a.set("url", "article", value=cached_article)
+
+        assert worker_b.get("url", "article") == cached_article
+        # Now served from worker B's local tier
+        assert worker_b.get("url", "article") == cached_article
+        stats = worker_b.get_stats()
+        assert stats["hits"] == 2
+        assert stats["shared_hits"] == 1
+
+    def test_shared_expiry(
+        self,
+        open_store: Callable[[], SharedCacheStore],
+        cached_article: tuple[ArticleContent, ResponseMetadata],
+    ) -> None:
+        """Test that expired shared values are not served."""
+        store = open_store()
+        worker_a = Cache(ttl_seconds=60, shared=store)
+        worker_b = Cache(ttl_seconds=60, shared=store)
+
+        worker_a.set("url", "article", value=cached_article, ttl_seconds=-1)
+
+        assert worker_b.get("url", "article") is None
+        assert store.delete_expired() == 1
+
+    def test_busy_database_skipped(
+        self,
+        tmp_path: Path,
+        open_store: Callable[[], SharedCacheStore],
+        cached_article: tuple[ArticleContent, ResponseMetadata],
+    ) -> None:
+        """Test that writes are skipped instead of waited for while another worker writes."""
+        path = tmp_path / "cache.sqlite3"
+        cache = Cache(ttl_seconds=60, shared=open_store())
+        other_worker = sqlite3.connect(path, isolation_level=None)
+        other_worker.execute("BEGIN IMMEDIATE")
+        try:
+            start = time.perf_counter()
+            cache.set("url", "article", value=cached_article)
+            elapsed = time.perf_counter() - start
+        finally:
+            other_worker.execute("ROLLBACK")
+            other_worker.close()
+
+        assert elapsed < 1.0
+        assert cache.get("url", "article") == cached_article
+        assert cache.get_stats()["shared_busy_skips"] == 1
+
+    async def test_client_close_closes_store(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that closing the client closes its shared cache database."""
+        monkeypatch.setattr(settings, "shared_state_dir", str(tmp_path))
+        client = JWOrgClient()
+        store = client._cache._shared
+        assert store is not None
+
+        await client.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            store.get("url")
+        assert client._cache._shared is None
+
+
+class TestSupervisorStateDir:
+    """Tests for the state directory the supervisor creates for its workers."""
+
+    def test_private_directory_removed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that workers get a fresh private directory, removed on exit."""
+        monkeypatch.setattr(settings, "shared_state_dir", "")
+        monkeypatch.delenv("JWORG_MCP_SHARED_STATE_DIR", raising=False)
+        seen = []
+
+        def supervise(count: int) -> None:
+            state_dir = os.environ["JWORG_MCP_SHARED_STATE_DIR"]
+            seen.append((state_dir, stat.S_IMODE(os.stat(state_dir).st_mode)))
+
+        monkeypatch.setattr(workers, "_supervise", supervise)
+        workers.run_supervisor(1)
+        workers.run_supervisor(1)
+
+        (first, mode), (second, _) = seen
+        assert mode == 0o700
+        assert first != second
+        assert not os.path.exists(first)
+        assert "JWORG_MCP_SHARED_STATE_DIR" not in os.environ
+
+
+class TestSharedTokenStore:
+    """Tests for the shared JWT token store."""
+
+    async def test_one_worker_refreshes(self, tmp_path: Path) -> None:
+        """Test that workers sharing a store fetch the token once."""
+        fetches = 0
+
+        async def fetch() -> JWTToken:
+            nonlocal fetches
+            fetches += 1
+            await asyncio.sleep(0.01)
+            now = datetime.now(UTC)
+            return JWTToken(token=f"t{fetches}", expires_at=now + timedelta(days=1), issued_at=now)
+
+        workers = [AuthManager(SharedTokenStore(tmp_path / "token.json")) for _ in range(3)]
+        for worker in workers:
+            worker._fetch_token = fetch  # type: ignore[method-assign]
+
+        tokens = await asyncio.gather(*(w.get_jwt_token() for w in workers for _ in range(5)))
+
+        assert fetches == 1
+        assert set(tokens) == {"t1"}
+
+        # A forced refresh does not reuse the token being replaced...
+        assert await workers[0].get_jwt_token(force_refresh=True) == "t2"
+        # ...but adopts a newer one another worker already fetched
+        assert await workers[1].get_jwt_token(force_refresh=True) == "t2"
+        assert fetches == 2
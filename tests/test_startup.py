@@ -0,0 +1,66 @@
+"""Startup (cold import) benchmarks with regression thresholds.
+
+MCP hosts spawn the server once per session, so import cost is on the user's
+critical path. The budget can be raised on slow machines with
+JWORG_MCP_IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_MS = float(os.environ.get("JWORG_MCP_IMPORT_BUDGET_MS", "250"))
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run code in a fresh interpreter with -X importtime.
+
+    Args:
+        code: Python source to run
+
+    Returns:
+        Mapping of module name to cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # Format: "import time: <self us> | <cumulative us> | <indent><module>"
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ["mcp", "httpx", "bs4", "lxml"])
+def test_package_import_is_lightweight(module: str) -> None:
+    """Importing the package does not pull in the server stack."""
+    times = _import_times("import jw_org_mcp")
+
+    assert "jw_org_mcp" in times
+    assert module not in times
+
+
+@pytest.mark.parametrize("module", ["bs4", "lxml", "jw_org_mcp.client", "jw_org_mcp.parser"])
+def test_server_import_defers_client(module: str) -> None:
+    """Importing the server defers the client, parser and HTML stack."""
+    times = _import_times("import jw_org_mcp.server")
+
+    assert "jw_org_mcp.server" in times
+    assert module not in times
+
+
+def test_server_import_time_budget() -> None:
+    """The server's own import cost, beyond the MCP SDK, stays within budget."""
+    # Import the MCP SDK first so only the cost added by this package is measured
+    times = _import_times("import mcp.server, mcp.types; import jw_org_mcp.server")
+
+    own_ms = (times["jw_org_mcp"] + times["jw_org_mcp.server"]) / 1000
+    assert own_ms < IMPORT_BUDGET_MS, f"server import took {own_ms:.1f} ms"
@@ -0,0 +1,82 @@
+"""Tests for urls module."""
+
+import pytest
+
+from jw_org_mcp.urls import article_language, canonical_article_url, localized_article_url
+
+CANONICAL = "https://wol.jw.org/en/wol/d/r1/lp-e/1985720"
+
+
+class TestCanonicalArticleUrl:
+    """Tests for canonical_article_url."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            CANONICAL,
+            "https://wol.jw.org/en/wol/d/r1/lp-e/1985720?q=peace&p=par",
+            "https://wol.jw.org/en/wol/d/r1/lp-e/1985720#h=3",
+            "http://WOL.jw.org/en/wol/d/r1/lp-e/1985720/",
+            "https://wol.jw.org/wol/d/r1/lp-e/1985720",
+            "https://wol.jw.org/es/wol/d/r1/lp-e/1985720",
+            "https://www.jw.org/finder?wtlocale=E&docid=1985720&srctype=wol&srcid=share",
+            "https://wol.jw.org/wol/finder?docid=1985720&wtlocale=E",
+        ],
+    )
+    def test_variants(self, url: str) -> None:
+        """Test that article URL variants map to one canonical URL."""
+        assert canonical_article_url(url) == CANONICAL
+
+    def test_other_language(self) -> None:
+        """Test that articles in other languages keep their language codes."""
+        url = "https://www.jw.org/finder?wtlocale=S&docid=1985720"
+
+        assert canonical_article_url(url) == "https://wol.jw.org/es/wol/d/r4/lp-s/1985720"
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://wol.jw.org/en/wol/publication/r1/lp-e/w",
+            "https://www.jw.org/finder?wtlocale=ZZZ&docid=1985720",
+            "https://www.jw.org/finder?wtlocale=E&pub=w&issue=20240100",
+        ],
+    )
+    def test_other_urls_kept(self, url: str) -> None:
+        """Test that other pages and unmappable finder links keep their query."""
+        assert canonical_article_url(url) == url
+
+    def test_other_hosts_keep_scheme(self) -> None:
+        """Test that article paths on other hosts are canonicalized in place."""
+        url = "http://127.0.0.1:8791/en/wol/d/r1/lp-e/2024100?q=x"
+
+        assert canonical_article_url(url) == "http://127.0.0.1:8791/en/wol/d/r1/lp-e/2024100"
+
+
+class TestArticleLanguages:
+    """Tests for article_language and localized_article_url."""
+
+    def test_article_language(self) -> None:
+        """Test that the language is read from the lp code of any variant."""
+        assert article_language(CANONICAL + "?q=peace") == "E"
+        assert article_language("https://www.jw.org/finder?wtlocale=X&docid=1985720") == "X"
+        assert article_language("https://wol.jw.org/en/wol/publication/r1/lp-e/w") is None
+
+    def test_localized_url(self) -> None:
+        """Test that the document id is kept and the language codes replaced."""
+        assert (
+            localized_article_url(CANONICAL + "#h=3", "t")
+            == "https://wol.jw.org/pt/wol/d/r5/lp-t/1985720"
+        )
+        assert localized_article_url(CANONICAL, "E") == CANONICAL
+
+    @pytest.mark.parametrize(
+        ("url", "language"),
+        [
+            ("https://wol.jw.org/en/wol/publication/r1/lp-e/w", "S"),
+            (CANONICAL, "ZZZ"),
+        ],
+    )
+    def test_localized_url_errors(self, url: str, language: str) -> None:
+        """Test that other pages and unknown languages are rejected."""
+        with pytest.raises(ValueError):
+            localized_article_url(url, language)